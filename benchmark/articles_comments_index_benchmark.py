@@ -0,0 +1,108 @@
+"""
+ArticlesCommentsIndex のリプライ取得(親コメントごとの問い合わせ)を逐次実行と並列実行で比較するベンチマーク
+
+前提: DynamoDB Local が localhost:8000 で起動していること(README の Test 参照)
+実行: python benchmark/articles_comments_index_benchmark.py
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.append('./src/common')
+sys.path.append('./src/handlers/articles/comments/index')
+sys.path.append('./tests/tests_common')
+
+from boto3.dynamodb.conditions import Key  # noqa: E402
+from articles_comments_index import ArticlesCommentsIndex  # noqa: E402
+from tests_util import TestsUtil  # noqa: E402
+
+PARENT_COUNT = 10
+REPLY_COUNT = 50
+ITERATIONS = 30
+ARTICLE_ID = 'benchArticle'
+
+
+def create_fixture(dynamodb):
+    TestsUtil.set_all_tables_name_to_env()
+    TestsUtil.delete_all_tables(dynamodb)
+
+    TestsUtil.create_table(dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], [
+        {'article_id': ARTICLE_ID, 'user_id': 'author', 'status': 'public', 'sort_key': 1520150272000000}
+    ])
+
+    comments = []
+    for i in range(PARENT_COUNT):
+        comments.append({
+            'comment_id': 'parent' + str(i).zfill(6),
+            'article_id': ARTICLE_ID,
+            'user_id': 'user' + str(i),
+            'text': 'parent comment',
+            'sort_key': 1520150272000000 + i,
+            'created_at': 1520150272
+        })
+    for i in range(REPLY_COUNT):
+        comments.append({
+            'comment_id': 'reply' + str(i).zfill(7),
+            'parent_id': 'parent' + str(i % PARENT_COUNT).zfill(6),
+            'replyed_user_id': 'user' + str(i % PARENT_COUNT),
+            'article_id': ARTICLE_ID,
+            'user_id': 'replyuser' + str(i),
+            'text': 'reply comment',
+            'sort_key': 1520150273000000 + i,
+            'created_at': 1520150273
+        })
+    TestsUtil.create_table(dynamodb, os.environ['COMMENT_TABLE_NAME'], comments)
+
+
+def sequential_replies(dynamodb, comments):
+    # 並列化前の実装と同じく親コメントごとに逐次問い合わせる
+    comment_table = dynamodb.Table(os.environ['COMMENT_TABLE_NAME'])
+    for comment in comments:
+        replies = comment_table.query(
+            IndexName='parent_id-sort_key-index',
+            KeyConditionExpression=Key('parent_id').eq(comment['comment_id']),
+            ScanIndexForward=False
+        )['Items']
+        if replies:
+            comment['replies'] = replies
+
+
+def parallel_replies(dynamodb, comments):
+    handler = ArticlesCommentsIndex({}, {}, dynamodb=dynamodb)
+    handler._ArticlesCommentsIndex__get_comments_with_replies(comments)
+
+
+def measure(func, dynamodb, comments):
+    elapsed = []
+    for _ in range(ITERATIONS):
+        targets = [dict(comment) for comment in comments]
+        start = time.perf_counter()
+        func(dynamodb, targets)
+        elapsed.append((time.perf_counter() - start) * 1000)
+    return elapsed
+
+
+def main():
+    dynamodb = TestsUtil.get_dynamodb_client()
+    create_fixture(dynamodb)
+
+    comment_table = dynamodb.Table(os.environ['COMMENT_TABLE_NAME'])
+    parents = comment_table.query(
+        IndexName='article_id-sort_key-index',
+        KeyConditionExpression=Key('article_id').eq(ARTICLE_ID),
+        FilterExpression='attribute_not_exists(parent_id)',
+        ScanIndexForward=False
+    )['Items']
+
+    print('parents: {0}, replies: {1}, iterations: {2}'.format(len(parents), REPLY_COUNT, ITERATIONS))
+    for name, func in [('sequential', sequential_replies), ('parallel', parallel_replies)]:
+        elapsed = measure(func, dynamodb, parents)
+        print('{0:<12} mean: {1:8.2f} ms  median: {2:8.2f} ms  max: {3:8.2f} ms'.format(
+            name, statistics.mean(elapsed), statistics.median(elapsed), max(elapsed)))
+
+    TestsUtil.delete_all_tables(dynamodb)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+MeArticlesCommentsLikesIndex の自身のいいね取得を、article_id-index(記事の全いいねを読み込みフィルタ)と
+article_id-user_id-index(自身のいいねのみを読み込む)で比較するベンチマーク
+1記事に 10,000 件のいいねがある状態で、読み込み件数、消費キャパシティ(RCU)の概算、実行時間を計測する
+
+前提: DynamoDB Local が localhost:8000 で起動していること(README の Test 参照)
+実行: python benchmark/comment_likes_index_benchmark.py
+"""
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+sys.path.append('./src/common')
+sys.path.append('./tests/tests_common')
+
+from boto3.dynamodb.conditions import Key  # noqa: E402
+from tests_util import TestsUtil  # noqa: E402
+
+LIKE_COUNT = 10000
+MY_LIKE_COUNT = 5
+ITERATIONS = 10
+ARTICLE_ID = 'benchArticle'
+USER_ID = 'benchUser'
+
+
+def create_fixture(dynamodb):
+    TestsUtil.set_all_tables_name_to_env()
+    TestsUtil.delete_all_tables(dynamodb)
+
+    comment_likes = [{
+        'comment_id': 'comment' + str(i % 500).zfill(5),
+        'user_id': USER_ID if i < MY_LIKE_COUNT else 'user' + str(i).zfill(6),
+        'article_id': ARTICLE_ID,
+        'created_at': 1520150272
+    } for i in range(LIKE_COUNT)]
+    TestsUtil.create_table(dynamodb, os.environ['COMMENT_LIKED_USER_TABLE_NAME'], comment_likes)
+
+
+# 結果整合性のある読み込みの RCU(4KB 単位で 0.5RCU)を、1回の問い合わせで読み込んだ項目のサイズの合計から概算する
+def estimate_rcu(items):
+    size = sum(len(json.dumps(item, default=str)) for item in items)
+    return math.ceil(size / 4096) * 0.5
+
+
+def query_all(table, query_params):
+    items = []
+    scanned_count = 0
+    while True:
+        response = table.query(**query_params)
+        items.extend(response['Items'])
+        scanned_count += response['ScannedCount']
+        if 'LastEvaluatedKey' not in response:
+            return items, scanned_count
+        query_params = dict(query_params, ExclusiveStartKey=response['LastEvaluatedKey'])
+
+
+def by_article_index(table):
+    # 変更前の実装と同じく記事の全いいねを取得してから自身のいいねに絞り込む
+    items, scanned_count = query_all(table, {
+        'IndexName': 'article_id-index',
+        'KeyConditionExpression': Key('article_id').eq(ARTICLE_ID)
+    })
+    return [item['comment_id'] for item in items if item['user_id'] == USER_ID], items, scanned_count
+
+
+def by_article_user_index(table):
+    items, scanned_count = query_all(table, {
+        'IndexName': 'article_id-user_id-index',
+        'KeyConditionExpression': Key('article_id').eq(ARTICLE_ID) & Key('user_id').eq(USER_ID)
+    })
+    return [item['comment_id'] for item in items], items, scanned_count
+
+
+def main():
+    dynamodb = TestsUtil.get_dynamodb_client()
+    create_fixture(dynamodb)
+    table = dynamodb.Table(os.environ['COMMENT_LIKED_USER_TABLE_NAME'])
+
+    print('likes: {0}, my likes: {1}, iterations: {2}'.format(LIKE_COUNT, MY_LIKE_COUNT, ITERATIONS))
+    results = []
+    for name, func in [('article_id-index', by_article_index), ('article_id-user_id-index', by_article_user_index)]:
+        comment_ids, items, scanned_count = func(table)
+        results.append(sorted(comment_ids))
+
+        elapsed = []
+        for _ in range(ITERATIONS):
+            start = time.perf_counter()
+            func(table)
+            elapsed.append((time.perf_counter() - start) * 1000)
+        print('{0:<26} read items: {1:>6}  estimated RCU: {2:>7.1f}  mean: {3:8.2f} ms  median: {4:8.2f} ms'.format(
+            name, scanned_count, estimate_rcu(items), statistics.mean(elapsed), statistics.median(elapsed)))
+
+    # 同じ結果が取得できていること
+    assert results[0] == results[1]
+
+    TestsUtil.delete_all_tables(dynamodb)
+
+
+if __name__ == '__main__':
+    main()
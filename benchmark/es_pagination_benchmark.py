@@ -0,0 +1,102 @@
+"""
+ESUtil.search_recent_articles の from によるページングと cursor(search_after) によるページングを比較するベンチマーク
+1ページ目と500ページ目の取得時間を計測し、from ではページ数に応じて遅くなり、search_after では一定であることを確認する
+
+前提: Elasticsearch が localhost:9200 で起動していること(README の Test 参照)
+実行: python benchmark/es_pagination_benchmark.py
+"""
+import statistics
+import sys
+import time
+
+sys.path.append('./src/common')
+
+from elasticsearch import Elasticsearch, helpers  # noqa: E402
+from es_util import ESUtil  # noqa: E402
+
+ARTICLE_COUNT = 100000
+LIMIT = 20
+PAGES = [1, 500]
+ITERATIONS = 30
+
+
+def create_fixture(elasticsearch):
+    elasticsearch.indices.delete(index='articles', ignore=[404])
+    # 本番と同じく深いページングを許容する(elasticsearch-setup.py 参照)
+    elasticsearch.indices.create(index='articles', body={
+        'settings': {
+            'index': {
+                'max_result_window': '1000000'
+            }
+        },
+        'mappings': {
+            'article': {
+                'properties': {
+                    'sort_key': {
+                        'type': 'long'
+                    }
+                }
+            }
+        }
+    })
+
+    # sort_key が重複する記事も含める(tiebreaker の確認のため)
+    actions = ({
+        '_index': 'articles',
+        '_type': 'article',
+        '_id': 'article' + str(i).zfill(8),
+        '_source': {
+            'article_id': 'article' + str(i).zfill(8),
+            'status': 'public',
+            'topic': 'crypto',
+            'sort_key': 1520150272000000 + i // 2
+        }
+    } for i in range(ARTICLE_COUNT))
+    helpers.bulk(elasticsearch, actions, chunk_size=5000)
+    elasticsearch.indices.refresh(index='articles')
+
+
+def get_cursor(elasticsearch, page):
+    # 対象ページの直前のページまで cursor を辿る
+    cursor = ''
+    for _ in range(page - 1):
+        articles = ESUtil.search_recent_articles(elasticsearch, {}, LIMIT, 1, cursor=cursor)
+        cursor = ESUtil.get_next_cursor(articles, LIMIT, ESUtil.RECENT_ARTICLES_SORT_FIELDS)
+    return cursor
+
+
+def measure(func):
+    elapsed = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        func()
+        elapsed.append((time.perf_counter() - start) * 1000)
+    return elapsed
+
+
+def main():
+    elasticsearch = Elasticsearch(hosts=[{'host': 'localhost'}])
+    create_fixture(elasticsearch)
+
+    print('articles: {0}, limit: {1}, iterations: {2}'.format(ARTICLE_COUNT, LIMIT, ITERATIONS))
+    for page in PAGES:
+        cursor = get_cursor(elasticsearch, page)
+
+        # 同じページが取得できていること
+        by_page = ESUtil.search_recent_articles(elasticsearch, {}, LIMIT, page)
+        by_cursor = ESUtil.search_recent_articles(elasticsearch, {}, LIMIT, 1, cursor=cursor)
+        assert by_page == by_cursor
+
+        for name, func in [
+            ('from', lambda: ESUtil.search_recent_articles(elasticsearch, {}, LIMIT, page)),
+            ('search_after', lambda: ESUtil.search_recent_articles(elasticsearch, {}, LIMIT, 1, cursor=cursor))
+        ]:
+            elapsed = measure(func)
+            print('page {0:<4} {1:<13} mean: {2:8.2f} ms  median: {3:8.2f} ms  max: {4:8.2f} ms'.format(
+                page, name, statistics.mean(elapsed), statistics.median(elapsed), max(elapsed)))
+
+    elasticsearch.indices.delete(index='articles', ignore=[404])
+
+
+if __name__ == '__main__':
+    main()
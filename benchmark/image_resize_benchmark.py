@@ -0,0 +1,151 @@
+"""
+画像アップロード API(MeArticlesImagesCreate)の縮小処理について、変更前の処理と ImageUtil による処理の
+ステップ毎の所要時間とメモリ使用量(RSS)のピークを比較する
+変更前: 検証時と縮小時に base64 デコード・Image.open を2回行い、元のサイズでデコードしてから縮小、getvalue() でバイト列にコピー
+変更後: base64 デコード・Image.open は1回のみ、JPEG は draft で縮小した状態でデコード、BytesIO をそのまま Body に利用
+
+RSS のピークはプロセス毎に単調増加するため、形式・処理毎に別プロセスで計測する(/proc を参照するため Linux のみ)
+
+実行: python benchmark/image_resize_benchmark.py
+"""
+import base64
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+sys.path.append('./src/common')
+
+from PIL import Image  # noqa: E402
+from image_util import ImageUtil  # noqa: E402
+
+# 本番の上限(ARTICLE_IMAGE_MAX_WIDTH/HEIGHT)
+MAX_WIDTH = 3840
+MAX_HEIGHT = 2160
+# API の上限(base64 で 8MB)に収まる範囲で大きな画像を作成する
+MAX_BASE64_LENGTH = 8388608
+FIXTURES = [
+    ('jpeg', (8000, 6000)),
+    ('png', (6000, 4000)),
+    ('gif', (6000, 4000))
+]
+ITERATIONS = 3
+
+
+def create_fixture(image_format, size):
+    # JPEG は写真に近い滑らかな濃淡、PNG・GIF はイラストに近い平坦な領域の多い画像とし、上限に収まるまで縮小する
+    resample = Image.BICUBIC if image_format == 'jpeg' else Image.NEAREST
+    while True:
+        bands = [Image.effect_noise((size[0] // 32, size[1] // 32), 96).resize(size, resample) for _ in range(3)]
+        image = Image.merge('RGB', bands)
+        buf = BytesIO()
+        image.save(buf, format=image_format, **({'quality': 95} if image_format == 'jpeg' else {}))
+        base64_image_data = base64.b64encode(buf.getvalue())
+        if len(base64_image_data) <= MAX_BASE64_LENGTH:
+            return base64_image_data, size
+        size = (size[0] * 9 // 10, size[1] * 9 // 10)
+
+
+def get_max_rss_mb():
+    # ru_maxrss は exec 後も親プロセスの値を引き継ぐため、プロセス自身のピーク(VmHWM)を参照する
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+
+
+def before(base64_image_data, image_format, step):
+    with step('validate'):
+        Image.open(BytesIO(base64.b64decode(base64_image_data)))
+    with step('decode'):
+        image_data = base64.b64decode(base64_image_data)
+        image = Image.open(BytesIO(image_data))
+    if image.size[0] <= MAX_WIDTH and image.size[1] <= MAX_HEIGHT:
+        return image.size
+    with step('resize'):
+        image.thumbnail((MAX_WIDTH, MAX_HEIGHT), Image.LANCZOS)
+    with step('encode'):
+        buf = BytesIO()
+        image.save(buf, format=image_format)
+        body = buf.getvalue()
+    return Image.open(BytesIO(body)).size
+
+
+def after(base64_image_data, image_format, step):
+    with step('validate'):
+        image_data, image = ImageUtil.decode_base64_image(base64_image_data)
+    if image.size[0] <= MAX_WIDTH and image.size[1] <= MAX_HEIGHT:
+        return image.size
+    with step('resize'):
+        ImageUtil.shrink(image, MAX_WIDTH, MAX_HEIGHT)
+    with step('encode'):
+        body = ImageUtil.to_upload_body(image, image_format)
+    return Image.open(body).size
+
+
+class Step:
+    def __init__(self):
+        self.results = []
+
+    def __call__(self, name):
+        self.name = name
+        return self
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *args):
+        self.results.append((self.name, (time.perf_counter() - self.start) * 1000, get_max_rss_mb()))
+
+
+def measure(pipeline_name, fixture_path, image_format, queue):
+    with open(fixture_path, 'rb') as f:
+        base64_image_data = f.read()
+    baseline = get_max_rss_mb()
+
+    step = Step()
+    size = {'before': before, 'after': after}[pipeline_name](base64_image_data, image_format, step)
+    queue.put((baseline, step.results, size))
+
+
+def run(pipeline_name, fixture_path, image_format):
+    # 計測毎に新しいプロセスを起動し、RSS のピークを他の計測と独立させる
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(pipeline_name, fixture_path, image_format, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    print('max size: {0}x{1}, iterations: {2}'.format(MAX_WIDTH, MAX_HEIGHT, ITERATIONS))
+    for image_format, size in FIXTURES:
+        base64_image_data, size = create_fixture(image_format, size)
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(base64_image_data)
+            fixture_path = f.name
+
+        print('== {0} {1}x{2} ({3:.1f}MB base64)'.format(
+            image_format, size[0], size[1], len(base64_image_data) / 1024 / 1024))
+        try:
+            for pipeline_name in ['before', 'after']:
+                runs = [run(pipeline_name, fixture_path, image_format) for _ in range(ITERATIONS)]
+                baseline, _, output_size = runs[0]
+                total_ms = 0
+                for i, (name, _, _) in enumerate(runs[0][1]):
+                    elapsed = sorted(r[1][i][1] for r in runs)[ITERATIONS // 2]
+                    peak = max(r[1][i][2] - r[0] for r in runs)
+                    total_ms += elapsed
+                    print('{0:<7} {1:<9} {2:9.1f} ms  peak RSS +{3:7.1f} MB'.format(pipeline_name, name, elapsed, peak))
+                print('{0:<7} {1:<9} {2:9.1f} ms  output: {3}x{4}'.format(
+                    pipeline_name, 'total', total_ms, output_size[0], output_size[1]))
+        finally:
+            os.remove(fixture_path)
+
+
+if __name__ == '__main__':
+    main()
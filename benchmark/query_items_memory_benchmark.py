@@ -0,0 +1,86 @@
+"""
+DBUtil.query_all_items(全件をリストで返却)と DBUtil.iterate_query_items(ページ毎に1件ずつ返却)で
+1ユーザー 20,000 件の TokenDistribution を集計した際のメモリ使用量のピークと実行時間を比較する
+合わせて iterate_scan_items と iterate_scan_items_in_parallel でテーブル全体を集計する時間を比較する
+
+前提: DynamoDB Local が localhost:8000 で起動していること(README の Test 参照)
+実行: python benchmark/query_items_memory_benchmark.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append('./src/common')
+sys.path.append('./tests/tests_common')
+
+from boto3.dynamodb.conditions import Key  # noqa: E402
+from db_util import DBUtil  # noqa: E402
+from tests_util import TestsUtil  # noqa: E402
+
+DISTRIBUTION_COUNT = 20000
+USER_ID = 'benchUser'
+DISTRIBUTION_TYPES = ['article', 'like', 'tip', 'bonus']
+# DynamoDB Local は 1MB 単位のページングを行わないため、Limit で1ページの件数を本番相当にする
+PAGE_SIZE = 1000
+
+
+def create_fixture(dynamodb):
+    TestsUtil.set_all_tables_name_to_env()
+    TestsUtil.delete_all_tables(dynamodb)
+
+    distributions = [{
+        'distribution_id': '{0}-{1}'.format(USER_ID, i),
+        'user_id': USER_ID,
+        'distribution_type': DISTRIBUTION_TYPES[i % len(DISTRIBUTION_TYPES)],
+        'quantity': 1000000000000000000,
+        'created_at': 1536184800,
+        'sort_key': 1536184800000000 + i
+    } for i in range(DISTRIBUTION_COUNT)]
+    TestsUtil.create_table(dynamodb, os.environ['TOKEN_DISTRIBUTION_TABLE_NAME'], distributions)
+
+
+def summarize(items):
+    totals = {}
+    for item in items:
+        totals[item['distribution_type']] = totals.get(item['distribution_type'], 0) + item['quantity']
+    return totals
+
+
+def measure(name, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('{0:<32} time: {1:6.2f} s  peak memory: {2:8.1f} KB'.format(name, elapsed, peak / 1024))
+    return result
+
+
+def main():
+    dynamodb = TestsUtil.get_dynamodb_client()
+    create_fixture(dynamodb)
+    table = dynamodb.Table(os.environ['TOKEN_DISTRIBUTION_TABLE_NAME'])
+    query_params = {
+        'IndexName': 'user_id-sort_key-index',
+        'KeyConditionExpression': Key('user_id').eq(USER_ID),
+        'Limit': PAGE_SIZE
+    }
+
+    print('distributions: {0}'.format(DISTRIBUTION_COUNT))
+    by_list = measure('query_all_items', lambda: summarize(DBUtil.query_all_items(table, query_params)))
+    by_iterator = measure('iterate_query_items', lambda: summarize(DBUtil.iterate_query_items(table, query_params)))
+    assert by_list == by_iterator
+
+    by_scan = measure('iterate_scan_items', lambda: summarize(DBUtil.iterate_scan_items(table, {'Limit': PAGE_SIZE})))
+    by_parallel_scan = measure('iterate_scan_items_in_parallel', lambda: summarize(
+        DBUtil.iterate_scan_items_in_parallel(dynamodb, os.environ['TOKEN_DISTRIBUTION_TABLE_NAME'],
+                                              {'Limit': PAGE_SIZE})))
+    assert by_scan == by_parallel_scan == by_list
+
+    TestsUtil.delete_all_tables(dynamodb)
+
+
+if __name__ == '__main__':
+    main()
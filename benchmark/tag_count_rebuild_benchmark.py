@@ -0,0 +1,68 @@
+"""
+TagUtil.rebuild_tag_index によるタグのカウント再集計の所要時間を計測するベンチマーク
+記事数、タグの種類数を本番相当とし、集計(composite aggregation)、インデックス作成、エイリアス切り替えまでの時間を計測する
+
+前提: Elasticsearch が localhost:9200 で起動していること(README の Test 参照)
+実行: python benchmark/tag_count_rebuild_benchmark.py
+"""
+import random
+import sys
+import time
+
+sys.path.append('./src/common')
+
+from elasticsearch import Elasticsearch, helpers  # noqa: E402
+from tag_util import TagUtil  # noqa: E402
+
+ARTICLE_COUNT = 100000
+TAG_VARIATION = 20000
+MAX_TAGS_PER_ARTICLE = 5
+
+
+def delete_tags(elasticsearch):
+    if elasticsearch.indices.exists_alias(name='tags'):
+        for index in elasticsearch.indices.get_alias(name='tags'):
+            elasticsearch.indices.delete(index=index)
+    elasticsearch.indices.delete(index='tags', ignore=[404])
+
+
+def create_fixture(elasticsearch):
+    elasticsearch.indices.delete(index='articles', ignore=[404])
+    delete_tags(elasticsearch)
+    elasticsearch.indices.create(index='articles')
+
+    # 大文字小文字のみ異なるタグも含める
+    random.seed(0)
+    actions = ({
+        '_index': 'articles',
+        '_type': 'article',
+        '_id': 'article' + str(i).zfill(8),
+        '_source': {
+            'article_id': 'article' + str(i).zfill(8),
+            'status': 'public',
+            'tags': [random.choice(['tag', 'TAG']) + str(random.randrange(TAG_VARIATION))
+                     for _ in range(random.randint(0, MAX_TAGS_PER_ARTICLE))]
+        }
+    } for i in range(ARTICLE_COUNT))
+    helpers.bulk(elasticsearch, actions, chunk_size=5000)
+    elasticsearch.indices.refresh(index='articles')
+
+
+def main():
+    elasticsearch = Elasticsearch(hosts=[{'host': 'localhost'}], timeout=60)
+    create_fixture(elasticsearch)
+
+    print('articles: {0}, tag variation: {1}'.format(ARTICLE_COUNT, TAG_VARIATION))
+    # 1回目は tags インデックスが存在しない状態、2回目は既存のエイリアスを切り替える状態を計測する
+    for label in ['initial', 'swap']:
+        start = time.perf_counter()
+        result = TagUtil.rebuild_tag_index(elasticsearch)
+        elapsed = time.perf_counter() - start
+        print('{0:<8} tags: {1:>6}  elapsed: {2:8.2f} s'.format(label, result['tag_count'], elapsed))
+
+    elasticsearch.indices.delete(index='articles', ignore=[404])
+    delete_tags(elasticsearch)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+ユーザーの記事一覧(UsersArticlesPublic、MeArticlesDraftsIndex)の1ページの取得を、
+user_id-sort_key-index + FilterExpression(status)と user_id_status-sort_key-index(キー条件のみ)で比較するベンチマーク
+下書き 500 件、公開記事 5 件のユーザーで、読み込み件数、消費キャパシティ(RCU)の概算、問い合わせ回数を計測する
+
+前提: DynamoDB Local が localhost:8000 で起動していること(README の Test 参照)
+実行: python benchmark/user_articles_index_benchmark.py
+"""
+import json
+import math
+import os
+import sys
+
+sys.path.append('./src/common')
+sys.path.append('./tests/tests_common')
+
+from boto3.dynamodb.conditions import Key, Attr  # noqa: E402
+from db_util import DBUtil  # noqa: E402
+from pagination_util import PaginationUtil  # noqa: E402
+from tests_util import TestsUtil  # noqa: E402
+
+DRAFT_COUNT = 500
+PUBLIC_COUNT = 5
+LIMIT = 10
+USER_ID = 'benchUser'
+KEY_NAMES = ['user_id', 'article_id', 'sort_key']
+
+
+def create_fixture(dynamodb):
+    TestsUtil.set_all_tables_name_to_env()
+    TestsUtil.delete_all_tables(dynamodb)
+
+    # 公開記事は古い記事とし、新しい順に取得する際に下書きを読み込んだ後に見つかるようにする
+    article_infos = []
+    for i in range(DRAFT_COUNT + PUBLIC_COUNT):
+        status = 'public' if i < PUBLIC_COUNT else 'draft'
+        article_infos.append({
+            'article_id': 'article' + str(i).zfill(5),
+            'user_id': USER_ID,
+            'status': status,
+            'user_id_status': DBUtil.get_user_id_status(USER_ID, status),
+            'title': 'タイトル' * 10,
+            'overview': '概要' * 50,
+            'eye_catch_url': 'https://example.com/' + 'a' * 100 + '.png',
+            'sort_key': 1520150272000000 + i,
+            'created_at': 1520150272
+        })
+    TestsUtil.create_table(dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], article_infos)
+
+
+# 結果整合性のある読み込みの RCU(4KB 単位で 0.5RCU)を、1回の問い合わせで読み込んだ項目のサイズの合計から概算する
+def estimate_rcu(items):
+    size = sum(len(json.dumps(item, default=str, ensure_ascii=False).encode()) for item in items)
+    return math.ceil(size / 4096) * 0.5
+
+
+class MeasuredTable:
+    """
+    query の問い合わせ回数、読み込み件数、RCU の概算を記録する
+    FilterExpression で除外された項目も読み込みのキャパシティを消費するため、FilterExpression を除いて問い合わせ直して計測する
+    """
+    def __init__(self, table):
+        self.table = table
+        self.requests = 0
+        self.scanned_count = 0
+        self.rcu = 0
+
+    def query(self, **query_params):
+        response = self.table.query(**query_params)
+        read_params = {k: v for k, v in query_params.items() if k != 'FilterExpression'}
+        read_items = self.table.query(**read_params)['Items']
+        self.requests += 1
+        self.scanned_count += response['ScannedCount']
+        self.rcu += estimate_rcu(read_items)
+        return response
+
+
+def by_user_id_index(table, status):
+    return PaginationUtil.query_filtered_page(table, {
+        'IndexName': 'user_id-sort_key-index',
+        'KeyConditionExpression': Key('user_id').eq(USER_ID),
+        'FilterExpression': Attr('status').eq(status),
+        'ScanIndexForward': False
+    }, LIMIT, KEY_NAMES)
+
+
+def by_user_id_status_index(table, status):
+    return PaginationUtil.query_filtered_page(table, {
+        'IndexName': 'user_id_status-sort_key-index',
+        'KeyConditionExpression': Key('user_id_status').eq(DBUtil.get_user_id_status(USER_ID, status)),
+        'ScanIndexForward': False
+    }, LIMIT, KEY_NAMES)
+
+
+def main():
+    dynamodb = TestsUtil.get_dynamodb_client()
+    create_fixture(dynamodb)
+
+    print('drafts: {0}, public: {1}, limit: {2}'.format(DRAFT_COUNT, PUBLIC_COUNT, LIMIT))
+    for status in ['public', 'draft']:
+        results = []
+        for name, func in [('user_id-sort_key-index', by_user_id_index),
+                           ('user_id_status-sort_key-index', by_user_id_status_index)]:
+            table = MeasuredTable(dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME']))
+            response = func(table, status)
+            results.append(response['Items'])
+            print('{0:<7} {1:<30} returned: {2:>3}  read items: {3:>4}  requests: {4:>2}  estimated RCU: {5:>6.1f}'.format(
+                status, name, len(response['Items']), table.scanned_count, table.requests, table.rcu))
+
+        # 同じ結果が取得できていること
+        assert results[0] == results[1]
+
+    TestsUtil.delete_all_tables(dynamodb)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+ESUtil.search_user の検索速度を、従来の wildcard(*word*) による検索と N-gram による検索で比較するベンチマーク
+同一のユーザーを従来のマッピングのインデックスと N-gram のマッピングのインデックスに登録し、検索語の長さ毎に計測する
+
+前提: Elasticsearch が localhost:9200 で起動していること(README の Test 参照)
+実行: python benchmark/user_search_benchmark.py
+"""
+import copy
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.append('./src/common')
+
+from elasticsearch import Elasticsearch, helpers  # noqa: E402
+from es_util import ESUtil  # noqa: E402
+import settings  # noqa: E402
+
+USER_COUNT = 1000000
+LIMIT = 20
+ITERATIONS = 30
+QUERIES = ['a', 'ab', 'user', 'alis12', 'notfoundname']
+
+WILDCARD_INDEX = 'users_wildcard'
+
+# 従来の users インデックスのマッピング(search_name を keyword として wildcard で検索する)
+WILDCARD_INDEX_SETTINGS = {
+    'settings': {
+        'index': {
+            'number_of_replicas': '0'
+        },
+        'analysis': {
+            'normalizer': {
+                'lowcase': {
+                    'type': 'custom',
+                    'char_filter': [],
+                    'filter': ['lowercase']
+                }
+            }
+        }
+    },
+    'mappings': {
+        'user': {
+            'properties': {
+                'user_id': {
+                    'type': 'keyword',
+                    'copy_to': 'search_name'
+                },
+                'user_display_name': {
+                    'type': 'keyword',
+                    'copy_to': 'search_name'
+                },
+                'search_name': {
+                    'type': 'keyword',
+                    'normalizer': 'lowcase'
+                }
+            }
+        }
+    }
+}
+
+
+def create_fixture(elasticsearch):
+    users_settings = copy.deepcopy(settings.USERS_INDEX_SETTINGS)
+    users_settings['settings']['index']['number_of_replicas'] = '0'
+
+    for index, body in [('users', users_settings), (WILDCARD_INDEX, WILDCARD_INDEX_SETTINGS)]:
+        elasticsearch.indices.delete(index=index, ignore=[404])
+        elasticsearch.indices.create(index=index, body=body)
+
+    random.seed(0)
+    users = [{
+        'user_id': 'user' + str(i),
+        'user_display_name': ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(12)),
+        'updated_at': 1530112753
+    } for i in range(USER_COUNT)]
+    for index in ['users', WILDCARD_INDEX]:
+        actions = ({'_index': index, '_type': 'user', '_id': user['user_id'], '_source': user} for user in users)
+        helpers.bulk(elasticsearch, actions, chunk_size=5000)
+        elasticsearch.indices.refresh(index=index)
+        elasticsearch.indices.forcemerge(index=index, max_num_segments=1)
+
+
+def search_wildcard(elasticsearch, word):
+    return elasticsearch.search(index=WILDCARD_INDEX, body={
+        'query': {'wildcard': {'search_name': f'*{word.lower()}*'}},
+        'sort': [{'_score': 'desc'}, {'user_id': 'asc'}],
+        'size': LIMIT
+    })
+
+
+def measure(func):
+    elapsed = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        func()
+        elapsed.append((time.perf_counter() - start) * 1000)
+    return elapsed
+
+
+def main():
+    elasticsearch = Elasticsearch(hosts=[{'host': 'localhost'}], timeout=60)
+    create_fixture(elasticsearch)
+
+    print('users: {0}, limit: {1}, iterations: {2}'.format(USER_COUNT, LIMIT, ITERATIONS))
+    for query in QUERIES:
+        wildcard_total = search_wildcard(elasticsearch, query)['hits']['total']
+        ngram_total = ESUtil.search_user(elasticsearch, query, LIMIT, 1)['hits']['total']
+        print('query: {0} (hits wildcard: {1}, ngram: {2})'.format(query, wildcard_total, ngram_total))
+
+        for name, func in [
+            ('wildcard', lambda: search_wildcard(elasticsearch, query)),
+            ('ngram', lambda: ESUtil.search_user(elasticsearch, query, LIMIT, 1))
+        ]:
+            elapsed = measure(func)
+            print('  {0:<9} mean: {1:8.2f} ms  median: {2:8.2f} ms  max: {3:8.2f} ms'.format(
+                name, statistics.mean(elapsed), statistics.median(elapsed), max(elapsed)))
+
+    for index in ['users', WILDCARD_INDEX]:
+        elasticsearch.indices.delete(index=index, ignore=[404])
+
+
+if __name__ == '__main__':
+    main()
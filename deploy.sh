@@ -54,9 +54,13 @@ aws cloudformation deploy \
     CommentTableName=${SSM_PARAMS_PREFIX}CommentTableName \
     CommentLikedUserTableName=${SSM_PARAMS_PREFIX}CommentLikedUserTableName \
     DeletedCommentTableName=${SSM_PARAMS_PREFIX}DeletedCommentTableName \
+    LikeCounterTableName=${SSM_PARAMS_PREFIX}LikeCounterTableName \
     UserFraudTableName=${SSM_PARAMS_PREFIX}UserFraudTableName \
     ScreenedArticleTableName=${SSM_PARAMS_PREFIX}ScreenedArticleTableName \
     TokenDistributionTableName=${SSM_PARAMS_PREFIX}TokenDistributionTableName \
+    TokenDistributionTotalTableName=${SSM_PARAMS_PREFIX}TokenDistributionTotalTableName \
+    TokenDistributionAppliedRecordTableName=${SSM_PARAMS_PREFIX}TokenDistributionAppliedRecordTableName \
+    TokenDistributionTableStreamArn=${SSM_PARAMS_PREFIX}TokenDistributionTableStreamArn \
     UserFirstExperienceTableName=${SSM_PARAMS_PREFIX}UserFirstExperienceTableName \
     DistS3BucketName=${SSM_PARAMS_PREFIX}DistS3BucketName \
     ApiLambdaRole=${SSM_PARAMS_PREFIX}ApiLambdaRole \
@@ -7,6 +7,10 @@ import time
 import sys
 import re
 
+sys.path.append('./src/common')
+
+import settings  # noqa: E402
+
 
 class ESconfig:
     def __getdomain(self):
@@ -92,6 +96,74 @@ class ESconfig:
                 )
         urllib.request.urlopen(request)
 
+    def __request(self, path, method="GET", body=None):
+        url = f"https://{self.endpoint}/{path}"
+        request = urllib.request.Request(
+                url,
+                method=method,
+                data=json.dumps(body).encode("utf-8") if body is not None else None,
+                headers={"Content-Type": "application/json"}
+                )
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    def get_alias_indices(self, alias):
+        try:
+            return list(self.__request(f"_alias/{alias}").keys())
+        except urllib.error.HTTPError:
+            return []
+
+    def reindex(self, source, dest, query=None):
+        body = {
+            "source": {"index": source},
+            "dest": {"index": dest}
+        }
+        if query is not None:
+            body["source"]["query"] = query
+        # 件数が多い場合に接続がタイムアウトしないよう、タスクとして実行し完了を待つ
+        task = self.__request("_reindex?wait_for_completion=false", method="POST", body=body)["task"]
+        while True:
+            response = self.__request(f"_tasks/{task}")
+            status = response["task"]["status"]
+            print(f"{source} -> {dest}: {status['created'] + status['updated']}/{status['total']}件")
+            if response["completed"]:
+                if response.get("error") or response["response"]["failures"]:
+                    raise Exception(f"reindex failed: {response.get('error') or response['response']['failures']}")
+                return
+            time.sleep(10)
+
+    def update_aliases(self, actions):
+        self.__request("_aliases", method="POST", body={"actions": actions})
+
+    # インデックスの設定を変更したインデックスを作成し、エイリアスを切り替えてドキュメントを移行する
+    # 初回は既存のインデックスを削除し、同名のエイリアスに置き換える
+    def reindex_with_alias(self, name, setting, updated_at_field=None):
+        started_at = int(time.time())
+        new_index = f"{name}-{started_at}"
+        print(f"{new_index}インデックス作成")
+        self.create_index(new_index, setting)
+        self.reindex(name, new_index)
+
+        # 移行中に更新されたドキュメントを再度反映する
+        if updated_at_field is not None:
+            self.reindex(name, new_index, query={"range": {updated_at_field: {"gte": started_at}}})
+
+        old_indices = self.get_alias_indices(name)
+        if old_indices:
+            actions = [{"remove": {"index": index, "alias": name}} for index in old_indices]
+            actions.append({"add": {"index": new_index, "alias": name}})
+        else:
+            actions = [
+                {"add": {"index": new_index, "alias": name}},
+                {"remove_index": {"index": name}}
+            ]
+        self.update_aliases(actions)
+        print(f"{name}エイリアスを{new_index}に切り替え")
+
+        for index in old_indices:
+            self.delete_index(index)
+            print(f"{index}を削除")
+
 
 esconfig = ESconfig()
 
@@ -145,97 +217,23 @@ articles_setting = {
 }
 create_index_list.append({"name": "articles", "setting": articles_setting})
 
-# users インデックス設定(逐次検索なのでトークナイズしない)
-users_setting = {
-    "settings": {
-        "index": {
-            "number_of_replicas": "1"
-        },
-        "analysis": {
-            "analyzer": {
-                "default": {
-                    "tokenizer": "keyword"
-                }
-            },
-            "normalizer": {
-                "lowcase": {
-                    "type": "custom",
-                    "char_filter": [],
-                    "filter": ["lowercase"]
-                }
-            }
-        }
-    },
-    "mappings": {
-        "user": {
-            "properties": {
-                "user_id": {
-                    "type": "keyword",
-                    "copy_to": "search_name"
-                },
-                "user_display_name": {
-                    "type": "keyword",
-                    "copy_to": "search_name"
-                },
-                "search_name": {
-                    "type": "keyword",
-                    "normalizer": "lowcase"
-                }
-            }
-        }
-    }
-}
+# users インデックス設定(部分一致検索のため N-gram で分割する)
+users_setting = settings.USERS_INDEX_SETTINGS
 create_index_list.append({"name": "users", "setting": users_setting})
 
-tag_settings = {
-    'settings': {
-        'analysis': {
-            'normalizer': {
-                'lowercase_normalizer': {
-                    'type': 'custom',
-                    'char_filter': [],
-                    'filter': ['lowercase']
-                }
-            },
-            'filter': {
-                'autocomplete_filter': {
-                    'type': 'edge_ngram',
-                    'min_gram': 1,
-                    'max_gram': 20
-                }
-            },
-            'analyzer': {
-                'autocomplete': {
-                    'type': 'custom',
-                    'tokenizer': 'keyword',
-                    'filter': [
-                        'lowercase',
-                        'autocomplete_filter'
-                    ]
-                }
-            }
-        }
-    },
-    'mappings': {
-        'tag': {
-            'properties': {
-                'name': {
-                    'type': 'keyword',
-                    'normalizer': 'lowercase_normalizer'
-                },
-                'name_with_analyzer': {
-                    'type': 'text',
-                    'analyzer': 'autocomplete'
-                },
-                'created_at': {
-                    'type': 'integer'
-                }
-            }
-        }
-    }
-}
+tag_settings = settings.TAG_INDEX_SETTINGS
 create_index_list.append({"name": "tags", "setting": tag_settings})
 
+# reindex を指定した場合は、既存のインデックスのドキュメントを現在の設定で作成したインデックスに移行する
+# 実行例: python elasticsearch-setup.py $(curl https://checkip.amazonaws.com/) reindex users
+if len(sys.argv) > 2 and sys.argv[2] == "reindex":
+    reindex_targets = sys.argv[3:]
+    create_index_list = [index for index in create_index_list if index["name"] in reindex_targets]
+    updated_at_fields = {"users": "updated_at"}
+    for index in create_index_list:
+        esconfig.reindex_with_alias(index["name"], index["setting"], updated_at_fields.get(index["name"]))
+    create_index_list = []
+
 for index in create_index_list:
     name = index["name"]
     if esconfig.check_index_exists(name):
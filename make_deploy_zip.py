@@ -1,45 +1,232 @@
 import os
+import re
+import ast
+import sys
 import shutil
-import subprocess
+import zipfile
 import glob
 
 # AWS Lambda へのデプロイ用ファイル（zip）を handler.py ファイル毎に作成する
+# handler.py から import を静的に解析し、到達可能な共通ライブラリ、vendor-package のライブラリのみを zip に含める
 # 前提
-# pip install が完了していること（./venv/lib/python3.6/site-packages/ 配下に必要ライブラリが作成済であること）
+# pip install が完了していること（./vendor-package/ 配下に必要ライブラリが作成済であること）
+#
+# 実行例
+# python make_deploy_zip.py          # handler 毎に必要なファイルのみを含めた zip を作成する
+# python make_deploy_zip.py --full   # 従来通り共通ライブラリ、vendor-package の全てを含めた zip を作成する
 
+COMMON_DIR = 'src/common'
+VENDOR_DIR = 'vendor-package'
+DEPLOY_PATH = os.getcwd() + '/deploy/'
 
-# 事前処理
+# 静的解析で検出できない import(文字列による動的な import 等)のため、常に含める vendor-package のパッケージ
+ALWAYS_INCLUDE_VENDOR_PACKAGES = []
 
-# デプロイディレクトリを空にする
-DEPLOY_PATH = os.getcwd() + '/deploy/'
-if os.path.exists(DEPLOY_PATH):
-    shutil.rmtree(DEPLOY_PATH)
-os.makedirs(DEPLOY_PATH)
+# vendor-package のパッケージ毎に解析した import 先のキャッシュ（handler 間で共有する）
+vendor_imports_cache = {}
+
+
+# ソースコード中の import 先の最上位のモジュール名を取得する
+# LazyModule('bleach') のように遅延 import するモジュールも対象とする
+def get_imported_names(file_path):
+    with open(file_path, 'rb') as f:
+        try:
+            tree = ast.parse(f.read(), filename=file_path)
+        except (SyntaxError, ValueError):
+            return set()
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split('.')[0])
+        elif isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'LazyModule' and node.args:
+            # python3.6 では ast.Str、python3.8 以降では ast.Constant となる
+            value = getattr(node.args[0], 'value', getattr(node.args[0], 's', None))
+            if isinstance(value, str):
+                names.add(value.split('.')[0])
+
+    return names
+
+
+# vendor-package 直下のエントリを、import 時のモジュール名をキーとした dict で返却する
+def get_vendor_modules():
+    modules = {}
+    if not os.path.isdir(VENDOR_DIR):
+        return modules
+
+    for entry in os.listdir(VENDOR_DIR):
+        path = os.path.join(VENDOR_DIR, entry)
+        if entry.endswith(('.dist-info', '.egg-info')) or entry in ['__pycache__', 'bin']:
+            continue
+        if os.path.isdir(path):
+            modules.setdefault(entry, []).append(path)
+        elif entry.endswith(('.py', '.so')):
+            modules.setdefault(entry.split('.')[0], []).append(path)
+
+    return modules
+
+
+# vendor-package の各ディストリビューションのメタデータ（*.dist-info）を返却する
+# 拡張モジュールが参照する共有ライブラリ（Pillow.libs 等）をパッケージと合わせて含めるために利用する
+def get_vendor_distributions():
+    distributions = []
+    for dist_info in glob.glob(os.path.join(VENDOR_DIR, '*.dist-info')):
+        files = []
+        record_path = os.path.join(dist_info, 'RECORD')
+        if os.path.exists(record_path):
+            with open(record_path) as f:
+                for line in f:
+                    file_name = line.split(',')[0]
+                    if file_name and not file_name.startswith('..'):
+                        files.append(os.path.join(VENDOR_DIR, file_name))
+        top_level_names = {re.split(r'[/.]', os.path.relpath(f, VENDOR_DIR))[0] for f in files}
+        distributions.append({'dist_info': dist_info, 'files': files, 'top_level_names': top_level_names})
+
+    return distributions
+
+
+def get_vendor_imports(name, vendor_modules):
+    if name not in vendor_imports_cache:
+        names = set()
+        for path in vendor_modules[name]:
+            file_paths = [path] if os.path.isfile(path) else glob.glob(path + '/**/*.py', recursive=True)
+            for file_path in file_paths:
+                if file_path.endswith('.py'):
+                    names.update(get_imported_names(file_path))
+        vendor_imports_cache[name] = names
+
+    return vendor_imports_cache[name]
+
+
+# handler から到達可能な共通ライブラリのモジュール名、vendor-package のモジュール名を返却する
+# vendor-package のライブラリは、ライブラリ内の import も辿って依存するライブラリを含める
+def resolve_dependencies(target_dir, vendor_modules):
+    common_modules = {os.path.basename(p)[:-3] for p in glob.glob(COMMON_DIR + '/*.py')}
+    local_modules = {os.path.basename(p)[:-3] for p in glob.glob(target_dir + '/*.py')}
+
+    required_common = set()
+    required_vendor = set(n for n in ALWAYS_INCLUDE_VENDOR_PACKAGES if n in vendor_modules)
+    pending = [os.path.join(target_dir, name + '.py') for name in local_modules]
+    pending_vendor = list(required_vendor)
+
+    while pending or pending_vendor:
+        if pending:
+            names = get_imported_names(pending.pop())
+        else:
+            names = get_vendor_imports(pending_vendor.pop(), vendor_modules)
+        for name in names:
+            if name in local_modules:
+                continue
+            if name in common_modules:
+                if name not in required_common:
+                    required_common.add(name)
+                    pending.append(os.path.join(COMMON_DIR, name + '.py'))
+            elif name in vendor_modules and name not in required_vendor:
+                required_vendor.add(name)
+                pending_vendor.append(name)
+
+    return required_common, required_vendor
+
+
+# zip に含めるファイルを (ファイルパス, zip 内のパス) のリストで返却する
+def get_bundle_files(target_dir, vendor_modules, vendor_distributions, full=False):
+    if full:
+        required_common = None
+        required_vendor = None
+    else:
+        required_common, required_vendor = resolve_dependencies(target_dir, vendor_modules)
+
+    files = list_files(target_dir)
+    files += [f for f in list_files(COMMON_DIR)
+              if required_common is None or os.path.splitext(f[1])[0] in required_common]
+
+    if required_vendor is None:
+        files += list_files(VENDOR_DIR)
+        return files
+
+    vendor_paths = set()
+    for name in required_vendor:
+        for path in vendor_modules[name]:
+            if os.path.isdir(path):
+                vendor_paths.update(p for p, _ in list_files(path))
+            else:
+                vendor_paths.add(path)
+    for distribution in vendor_distributions:
+        if distribution['top_level_names'] & required_vendor:
+            vendor_paths.update(p for p in distribution['files'] if os.path.isfile(p))
+    files += [(p, os.path.relpath(p, VENDOR_DIR)) for p in sorted(vendor_paths)]
+
+    return files
+
+
+def list_files(target_dir):
+    files = []
+    for root, dirs, file_names in os.walk(target_dir):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        for file_name in file_names:
+            if file_name.endswith('.pyc'):
+                continue
+            path = os.path.join(root, file_name)
+            files.append((path, os.path.relpath(path, target_dir)))
+
+    return sorted(files)
 
 
 # deploy 用 zip ファイルを作成
-def make_deploy_zip(zip_file_name, target_dir):
-    # zip 作成（実行ファイルパス）
-    exec_zip(zip_file_name, target_dir)
-    # zip 追加（共通ライブラリ）
-    exec_zip(zip_file_name, 'src/common')
-    # zip 追加（venv ライブラリ）
-    exec_zip(zip_file_name, 'vendor-package')
+def make_deploy_zip(zip_file_name, files):
+    with zipfile.ZipFile(DEPLOY_PATH + zip_file_name, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for path, arcname in files:
+            zip_file.write(path, arcname)
 
+    return os.path.getsize(DEPLOY_PATH + zip_file_name)
 
-# zip ファイル作成実行
-def exec_zip(zip_file_name, zip_target_dir):
-    cmd = 'cd ' + os.getcwd() + '/' + zip_target_dir + '; zip -r ' + DEPLOY_PATH + zip_file_name + ' ./*'
-    subprocess.check_call(cmd, shell=True)
+
+def get_files_size(files):
+    return sum(os.path.getsize(path) for path, _ in files)
+
+
+def format_size(size):
+    return '{0:.1f}MB'.format(size / 1024 / 1024)
 
 
 # メイン処理
+def main():
+    full = '--full' in sys.argv[1:]
+
+    # デプロイディレクトリを空にする
+    if os.path.exists(DEPLOY_PATH):
+        shutil.rmtree(DEPLOY_PATH)
+    os.makedirs(DEPLOY_PATH)
+
+    vendor_modules = get_vendor_modules()
+    vendor_distributions = get_vendor_distributions()
+
+    # 従来の共通ライブラリ、vendor-package の全てを含めた場合のサイズ（展開後）と比較して出力する
+    shared_size = get_files_size(list_files(COMMON_DIR)) + get_files_size(list_files(VENDOR_DIR))
+
+    # 各 handler ファイル毎に、必要な共通ライブラリと vendor-package のライブラリを含めて zip ファイルを作成する
+    total_before = 0
+    total_after = 0
+    for name in sorted(glob.iglob('src/handlers/**/handler.py', recursive=True)):
+        # 実行ディレクトリパスを取得
+        target_dir = './' + name[:name.rfind('/')]
+        # zip のファイル名を取得
+        zip_file_name = target_dir[len('./src/handlers/'):].replace('/', '_') + '.zip'
+        # zip 作成
+        files = get_bundle_files(target_dir, vendor_modules, vendor_distributions, full)
+        zip_size = make_deploy_zip(zip_file_name, files)
+
+        before = get_files_size(list_files(target_dir)) + shared_size
+        after = get_files_size(files)
+        total_before += before
+        total_after += after
+        print('{0:<60} {1:>9} -> {2:>9} (zip: {3})'.format(
+            zip_file_name, format_size(before), format_size(after), format_size(zip_size)))
+
+    print('{0:<60} {1:>9} -> {2:>9}'.format('total', format_size(total_before), format_size(total_after)))
+
 
-# 各 handler ファイル毎に、共通ライブラリと venv のライブラリを含めて zip ファイルを作成する
-for name in glob.iglob('src/handlers/**/handler.py', recursive=True):
-    # 実行ディレクトリパスを取得
-    target_dir = './' + name[:name.rfind('/')]
-    # zip のファイル名を取得
-    zip_file_name = target_dir[len('./src/handlers/'):].replace('/', '_') + '.zip'
-    # zip 作成
-    make_deploy_zip(zip_file_name, target_dir)
+if __name__ == '__main__':
+    main()
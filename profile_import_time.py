@@ -0,0 +1,169 @@
+import os
+import re
+import sys
+import glob
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+# handler.py 毎に Lambda の初期化時(コールドスタート時)の import 時間を計測する
+# handler.py、共通ライブラリを zip と同じ構成で一時ディレクトリに配置し、別プロセスで import して -X importtime の結果を集計する
+# 前提
+# python3.7 以上で実行すること（-X importtime は python3.7 から利用可能）
+# pip install が完了していること（依存ライブラリが import 可能であること）
+#
+# 実行例
+# python profile_import_time.py                          # 全 handler の初期化時間を一覧表示
+# python profile_import_time.py me/articles/drafts/publish --depth 3   # 指定 handler の import ツリーを表示
+
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$')
+
+# import 時に参照される環境変数のダミー値
+DUMMY_ENV_VARS = {
+    'AWS_DEFAULT_REGION': 'ap-northeast-1',
+    'AWS_REGION': 'ap-northeast-1',
+    'AWS_ACCESS_KEY_ID': 'dummy',
+    'AWS_SECRET_ACCESS_KEY': 'dummy',
+    'AWS_SESSION_TOKEN': 'dummy',
+    'ELASTIC_SEARCH_ENDPOINT': 'localhost',
+    'PRIVATE_CHAIN_EXECUTE_API_HOST': 'localhost',
+    'PRIVATE_CHAIN_AWS_ACCESS_KEY': 'dummy',
+    'PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY': 'dummy'
+}
+
+
+class ImportNode:
+    def __init__(self, name, self_us, cumulative_us, depth):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+        self.children = []
+
+
+# -X importtime の出力を import ツリーに変換する
+# 出力は子モジュールが先に出力される(後置順)ため、インデントの深さを基に親子関係を組み立てる
+def parse_import_time(output):
+    pending = {}
+    roots = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        depth = (len(match.group(3)) - 1) // 2
+        node = ImportNode(match.group(4), int(match.group(1)), int(match.group(2)), depth)
+        node.children = pending.pop(depth + 1, [])
+        if depth == 0:
+            roots.append(node)
+        else:
+            pending.setdefault(depth, []).append(node)
+
+    return roots
+
+
+def copy_files(src_dir, dest_dir):
+    for name in os.listdir(src_dir):
+        if os.path.isfile(os.path.join(src_dir, name)):
+            shutil.copy(os.path.join(src_dir, name), dest_dir)
+
+
+def profile_handler(handler_path):
+    handler_dir = os.path.dirname(handler_path)
+    work_dir = tempfile.mkdtemp()
+    try:
+        # deploy 用 zip と同じく、handler ディレクトリと共通ライブラリを同一階層に配置する
+        copy_files(handler_dir, work_dir)
+        copy_files('./src/common', work_dir)
+        env = dict(os.environ)
+        for key, value in DUMMY_ENV_VARS.items():
+            env.setdefault(key, value)
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import handler'],
+            cwd=work_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+    finally:
+        shutil.rmtree(work_dir)
+
+    if result.returncode != 0:
+        raise Exception(result.stderr.splitlines()[-1] if result.stderr else 'import failed')
+
+    # 計測用プロセス自体の起動時の import(encodings、site 等)は除外し、handler の import のみを対象とする
+    return [root for root in parse_import_time(result.stderr) if root.name == 'handler']
+
+
+def collect_modules(nodes, modules=None):
+    modules = {} if modules is None else modules
+    for node in nodes:
+        # 最上位のパッケージ単位で自身の import 時間を合算する
+        package = node.name.split('.')[0]
+        modules[package] = modules.get(package, 0) + node.self_us
+        collect_modules(node.children, modules)
+
+    return modules
+
+
+def get_function_name(handler_path):
+    return handler_path[len('src/handlers/'):handler_path.rfind('/')]
+
+
+def print_tree(nodes, max_depth, min_us, indent=0):
+    for node in sorted(nodes, key=lambda n: n.cumulative_us, reverse=True):
+        if node.cumulative_us < min_us:
+            continue
+        print('{0:>10.1f} ms {1:>10.1f} ms  {2}{3}'.format(
+            node.cumulative_us / 1000, node.self_us / 1000, '  ' * indent, node.name))
+        if indent < max_depth:
+            print_tree(node.children, max_depth, min_us, indent + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='handler.py 毎の import 時間を計測する')
+    parser.add_argument('targets', nargs='*', help='計測対象の handler のパス(src/handlers 配下、部分一致)')
+    parser.add_argument('--depth', type=int, default=2, help='import ツリーを表示する深さ')
+    parser.add_argument('--min-ms', type=float, default=1.0, help='表示対象とする import 時間(ms)の下限')
+    parser.add_argument('--top', type=int, default=5, help='一覧表示時に表示する時間のかかるパッケージの数')
+    args = parser.parse_args()
+
+    handler_paths = sorted(glob.glob('src/handlers/**/handler.py', recursive=True))
+    if args.targets:
+        handler_paths = [p for p in handler_paths if any(t in get_function_name(p) for t in args.targets)]
+
+    results = []
+    for handler_path in handler_paths:
+        function_name = get_function_name(handler_path)
+        try:
+            roots = profile_handler(handler_path)
+        except Exception as e:
+            print('{0}: {1}'.format(function_name, e), file=sys.stderr)
+            continue
+        results.append((function_name, roots))
+
+    # 対象を指定した場合は import ツリーを表示する
+    if args.targets:
+        for function_name, roots in results:
+            print('== ' + function_name)
+            print('{0:>13} {1:>13}  {2}'.format('cumulative', 'self', 'module'))
+            print_tree(roots, args.depth, args.min_ms * 1000)
+        return
+
+    # 指定しない場合は handler 毎の初期化時間と時間のかかっているパッケージを一覧表示する
+    total_us = 0
+    for function_name, roots in sorted(results, key=lambda r: sum(n.cumulative_us for n in r[1]), reverse=True):
+        cumulative_us = sum(n.cumulative_us for n in roots)
+        total_us += cumulative_us
+        modules = sorted(collect_modules(roots).items(), key=lambda m: m[1], reverse=True)[:args.top]
+        print('{0:>10.1f} ms  {1:<55} {2}'.format(
+            cumulative_us / 1000,
+            function_name,
+            ', '.join('{0}={1:.1f}'.format(name, us / 1000) for name, us in modules)
+        ))
+    print('{0:>10.1f} ms  total ({1} functions)'.format(total_us / 1000, len(results)))
+
+
+if __name__ == '__main__':
+    main()
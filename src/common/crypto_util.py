@@ -1,7 +1,9 @@
 import os
 import base64
-from Crypto.Cipher import AES
 from botocore.exceptions import ClientError
+from lazy_import import LazyModule
+
+AES = LazyModule('Crypto.Cipher.AES')
 
 
 class CryptoUtil:
@@ -1,18 +1,34 @@
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import settings
 from boto3.dynamodb.conditions import Key
 from jsonschema import ValidationError
 from record_not_found_error import RecordNotFoundError
 from not_authorized_error import NotAuthorizedError
+from ttl_cache import TTLCache
+
+topic_cache = TTLCache(settings.TOPIC_CACHE_TTL, settings.TTL_CACHE_MAX_SIZE)
+screened_article_cache = TTLCache(settings.SCREENED_ARTICLE_CACHE_TTL, settings.TTL_CACHE_MAX_SIZE)
 
 
 class DBUtil:
 
     @staticmethod
-    def exists_article(dynamodb, article_id, user_id=None, status=None):
+    def get_article_info(dynamodb, article_id, request_cache=None):
         article_info_table = dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': article_id}).get('Item')
+
+        if request_cache is None:
+            return article_info_table.get_item(Key={'article_id': article_id}).get('Item')
+
+        return request_cache.get_item(article_info_table, {'article_id': article_id})
+
+    @classmethod
+    def exists_article(cls, dynamodb, article_id, user_id=None, status=None, request_cache=None):
+        article_info = cls.get_article_info(dynamodb, article_id, request_cache)
 
         if article_info is None:
             return False
@@ -24,9 +40,8 @@ class DBUtil:
 
     @classmethod
     def validate_article_existence(cls, dynamodb, article_id, user_id=None, status=None, version=None,
-                                   is_purchased=None):
-        article_info_table = dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': article_id}).get('Item')
+                                   is_purchased=None, request_cache=None):
+        article_info = cls.get_article_info(dynamodb, article_id, request_cache)
 
         if article_info is None:
             raise RecordNotFoundError('Record Not Found')
@@ -42,9 +57,8 @@ class DBUtil:
         return True
 
     @classmethod
-    def validate_latest_price(cls, dynamodb, article_id, price):
-        article_info_table = dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': article_id}).get('Item')
+    def validate_latest_price(cls, dynamodb, article_id, price, request_cache=None):
+        article_info = cls.get_article_info(dynamodb, article_id, request_cache)
         if article_info.get('price') is None or price != article_info['price']:
             raise RecordNotFoundError('Price was changed')
 
@@ -74,6 +88,12 @@ class DBUtil:
 
         return False
 
+    @staticmethod
+    def get_user_id_status(user_id, status):
+        # ArticleInfo の user_id_status-sort_key-index のキー
+        # ユーザーの記事をステータス毎に取得する際に、FilterExpression を使わずキー条件のみで取得するために利用する
+        return '#'.join([user_id, status])
+
     @staticmethod
     def validate_user_existence(dynamodb, user_id):
         users_table = dynamodb.Table(os.environ['USERS_TABLE_NAME'])
@@ -119,6 +139,93 @@ class DBUtil:
             raise RecordNotFoundError('Record Not Found')
         return comment
 
+    @classmethod
+    def batch_get_articles(cls, dynamodb, article_ids, filter_status=None):
+        if not article_ids:
+            return []
+
+        # batch_get_item は同一キーを重複して指定するとエラーになるため重複を除外する
+        unique_article_ids = list(dict.fromkeys(article_ids))
+        articles = cls.batch_get_items(
+            dynamodb,
+            os.environ['ARTICLE_INFO_TABLE_NAME'],
+            [{'article_id': article_id} for article_id in unique_article_ids]
+        )
+        fetched_articles = {article['article_id']: article for article in articles}
+
+        # dynamodbのbatch_get_itemsは順序が保証されないため、article_idsを駆動表にして順序を並べなおす
+        return [
+            fetched_articles[article_id]
+            for article_id in article_ids
+            if fetched_articles.get(article_id) and
+            (filter_status is None or fetched_articles[article_id]['status'] == filter_status)
+        ]
+
+    @staticmethod
+    def batch_get_items(dynamodb, table_name, keys):
+        items = []
+        # batch_get_itemが100件よりも多い件数を扱うとエラーになるため100件ごと区切って処理する
+        for index in range(0, len(keys), settings.DYNAMO_BATCH_GET_MAX):
+            request_items = {
+                table_name: {
+                    'Keys': keys[index:index + settings.DYNAMO_BATCH_GET_MAX]
+                }
+            }
+
+            retry_count = 0
+            while request_items:
+                if retry_count > settings.DYNAMO_BATCH_GET_RETRY_MAX_COUNT:
+                    raise Exception('Failed to get {0}. UnprocessedKeys remained after retries'.format(table_name))
+                # UnprocessedKeys が返却された場合は指数バックオフで待機してから再取得する
+                if retry_count > 0:
+                    time.sleep(settings.DYNAMO_BATCH_GET_RETRY_INITIAL_WAIT * (2 ** (retry_count - 1)))
+
+                response = dynamodb.batch_get_item(RequestItems=request_items)
+                items.extend(response['Responses'].get(table_name, []))
+
+                request_items = response.get('UnprocessedKeys')
+                retry_count += 1
+
+        return items
+
+    @staticmethod
+    def query_in_parallel(dynamodb, table_name, query_params_list,
+                          max_workers=settings.DYNAMO_PARALLEL_QUERY_MAX_WORKERS):
+        if not query_params_list:
+            return []
+
+        # boto3 の resource はスレッドセーフではないため、スレッドセーフな client 経由で問い合わせる
+        # (resource の meta.client は Key 条件式や Python の型への変換をそのまま利用できる)
+        client = dynamodb.meta.client
+
+        def query(query_params):
+            return client.query(TableName=table_name, **query_params)['Items']
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(query_params_list))) as executor:
+            return list(executor.map(query, query_params_list))
+
+    @staticmethod
+    def count_in_parallel(dynamodb, table_name, query_params_list,
+                          max_workers=settings.DYNAMO_PARALLEL_QUERY_MAX_WORKERS):
+        if not query_params_list:
+            return []
+
+        client = dynamodb.meta.client
+
+        def count(query_params):
+            # 1回の query で読み込めるデータ量(1MB)を超える場合はページングして合算する
+            query_params = dict(query_params, Select='COUNT')
+            response = client.query(TableName=table_name, **query_params)
+            total = response['Count']
+            while 'LastEvaluatedKey' in response:
+                query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                response = client.query(TableName=table_name, **query_params)
+                total += response['Count']
+            return total
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(query_params_list))) as executor:
+            return list(executor.map(count, query_params_list))
+
     @staticmethod
     def items_values_empty_to_none(values):
         for k, v in values.items():
@@ -127,48 +234,152 @@ class DBUtil:
 
     @staticmethod
     def query_all_items(dynamodb_table, query_params):
+        return list(DBUtil.iterate_query_items(dynamodb_table, query_params))
+
+    @staticmethod
+    def scan_all_items(dynamodb_table, scan_params=None):
+        return list(DBUtil.iterate_scan_items(dynamodb_table, scan_params))
 
-        response = dynamodb_table.query(**query_params)
-        items = response['Items']
+    @classmethod
+    def iterate_query_items(cls, dynamodb_table, query_params, max_items=None):
+        # ページ毎に問い合わせながら Items を1件ずつ返却する
+        # 全件をリストに保持しないため、件数に依らずメモリの使用量は1ページ分で済む
+        # 呼び出し元が途中で読み込みを止めた場合、以降のページは問い合わせない
+        return cls.__iterate_items(dynamodb_table.query, query_params, max_items)
 
-        while 'LastEvaluatedKey' in response:
-            query_params.update({'ExclusiveStartKey': response['LastEvaluatedKey']})
-            response = dynamodb_table.query(**query_params)
-            items.extend(response['Items'])
+    @classmethod
+    def iterate_scan_items(cls, dynamodb_table, scan_params=None, max_items=None):
+        return cls.__iterate_items(dynamodb_table.scan, scan_params, max_items)
 
-        return items
+    @staticmethod
+    def __iterate_items(request, params, max_items):
+        # 呼び出し元の params は変更しない
+        params = dict(params or {})
+        count = 0
+        while max_items is None or count < max_items:
+            if max_items is not None:
+                # 上限件数より多く読み込まないようにする(Limit はフィルタ前の件数のため、不足分は次のページで取得する)
+                params['Limit'] = min(params.get('Limit', max_items - count), max_items - count)
+            response = request(**params)
+            for item in response['Items']:
+                yield item
+                count += 1
+            if 'LastEvaluatedKey' not in response:
+                return
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
 
     @staticmethod
-    def validate_topic(dynamodb, topic_name):
-        topic_table = dynamodb.Table(os.environ['TOPIC_TABLE_NAME'])
+    def iterate_scan_items_in_parallel(dynamodb, table_name, scan_params=None,
+                                       total_segments=settings.DYNAMO_PARALLEL_SCAN_TOTAL_SEGMENTS):
+        # テーブルを total_segments 個のセグメントに分割して並列に scan し、Items を1件ずつ返却する(順序は保証しない)
+        # 読み込んだページは上限のあるキューを経由して返却するため、保持するのは各セグメントの数ページ分のみとなる
+        # バッチ、メンテナンス用の全件走査を想定している
+        client = dynamodb.meta.client
+        pages = queue.Queue(maxsize=total_segments)
+        stopped = threading.Event()
+        segment_done = object()
+
+        def put(page):
+            # 呼び出し元が読み込みを止めた場合は破棄する
+            while not stopped.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scan(segment):
+            params = dict(scan_params or {}, Segment=segment, TotalSegments=total_segments)
+            try:
+                while not stopped.is_set():
+                    response = client.scan(TableName=table_name, **params)
+                    put(response['Items'])
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except Exception as e:
+                put(e)
+            finally:
+                put(segment_done)
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            for segment in range(total_segments):
+                executor.submit(scan, segment)
+            try:
+                remaining = total_segments
+                while remaining > 0:
+                    page = pages.get()
+                    if page is segment_done:
+                        remaining -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        yield from page
+            finally:
+                stopped.set()
 
-        query_params = {
-            'IndexName': 'index_hash_key-order-index',
-            'KeyConditionExpression': Key('index_hash_key').eq(settings.TOPIC_INDEX_HASH_KEY)
-        }
+    @staticmethod
+    def get_topics(dynamodb, bypass_cache=False):
+        def load_topics():
+            topic_table = dynamodb.Table(os.environ['TOPIC_TABLE_NAME'])
 
-        topics = topic_table.query(**query_params)['Items']
+            query_params = {
+                'IndexName': 'index_hash_key-order-index',
+                'KeyConditionExpression': Key('index_hash_key').eq(settings.TOPIC_INDEX_HASH_KEY)
+            }
+
+            return topic_table.query(**query_params)['Items']
+
+        return topic_cache.get_or_load(settings.TOPIC_INDEX_HASH_KEY, load_topics, bypass=bypass_cache)
+
+    @classmethod
+    def validate_topic(cls, dynamodb, topic_name):
+        topics = cls.get_topics(dynamodb)
 
         if topic_name not in [topic['name'] for topic in topics]:
             raise ValidationError('Bad Request: Invalid topic')
         return True
 
     @staticmethod
-    def validate_user_existence_in_thread(dynamodb, replyed_user_id, parent_comment_id):
+    def get_screened_article_ids(dynamodb, article_type, bypass_cache=False):
+        def load_screened_article_ids():
+            screened_article_table = dynamodb.Table(os.environ['SCREENED_ARTICLE_TABLE_NAME'])
+            screened_article = screened_article_table.get_item(Key={'article_type': article_type}).get('Item')
+
+            if not screened_article or not screened_article.get('articles'):
+                return []
+
+            return screened_article['articles']
 
+        return screened_article_cache.get_or_load(article_type, load_screened_article_ids, bypass=bypass_cache)
+
+    @classmethod
+    def validate_user_existence_in_thread(cls, dynamodb, replyed_user_id, parent_comment_id, thread_user_ids=None):
+        # 呼び出し元でスレッドを取得済みの場合は再度読み込まない
+        if thread_user_ids is None:
+            thread_user_ids = cls.get_thread_user_ids(dynamodb, parent_comment_id)
+
+        if replyed_user_id not in thread_user_ids:
+            raise ValidationError("Bad Request: {replyed_user_id} doesn't exist in thread"
+                                  .format(replyed_user_id=replyed_user_id))
+
+        return True
+
+    @classmethod
+    def get_thread_user_ids(cls, dynamodb, parent_comment_id):
+        """
+        スレッド内のコメントのユーザーと親コメントのユーザーを返却する(重複あり)
+        返信時の存在確認と通知対象の算出で同じスレッドを読み込まないよう、結果を使い回す
+        """
         comment_table = dynamodb.Table(os.environ['COMMENT_TABLE_NAME'])
 
         query_params = {
             'IndexName': 'parent_id-sort_key-index',
-            'KeyConditionExpression': Key('parent_id').eq(parent_comment_id)
+            'KeyConditionExpression': Key('parent_id').eq(parent_comment_id),
+            'ProjectionExpression': 'user_id'
         }
 
-        thread_comments = comment_table.query(**query_params)['Items']
-        thread_user_ids = [comment['user_id'] for comment in thread_comments]
+        thread_user_ids = [comment['user_id'] for comment in cls.iterate_query_items(comment_table, query_params)]
         parent_comment = comment_table.get_item(Key={'comment_id': parent_comment_id})['Item']
 
-        if replyed_user_id not in thread_user_ids + [parent_comment['user_id']]:
-            raise ValidationError("Bad Request: {replyed_user_id} doesn't exist in thread"
-                                  .format(replyed_user_id=replyed_user_id))
-
-        return True
+        return thread_user_ids + [parent_comment['user_id']]
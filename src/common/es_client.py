@@ -0,0 +1,73 @@
+import os
+import time
+import logging
+import settings
+
+
+class ESClient:
+    """
+    Elasticsearch クライアントを生成し、コンテナ単位でキャッシュする
+    elasticsearch、requests_aws4auth の import 及びクライアントの生成は、初めて利用された時点まで遅延させる
+    Lambda の実行ロールの一時認証情報(AWS_SESSION_TOKEN)が更新された場合はクライアントを作り直す
+    """
+    client = None
+    session_token = None
+    construction_time = None
+
+    @classmethod
+    def get_client(cls):
+        session_token = os.environ.get('AWS_SESSION_TOKEN')
+        if cls.client is None or cls.session_token != session_token:
+            started_at = time.time()
+            cls.client = cls.__create_client(session_token)
+            cls.session_token = session_token
+            cls.construction_time = time.time() - started_at
+            logging.info('es_client: constructed in {0:.3f}s'.format(cls.construction_time))
+
+        return cls.client
+
+    @classmethod
+    def clear(cls):
+        cls.client = None
+        cls.session_token = None
+        cls.construction_time = None
+
+    @staticmethod
+    def __create_client(session_token):
+        from elasticsearch import Elasticsearch, RequestsHttpConnection
+        from requests.adapters import HTTPAdapter
+        from requests_aws4auth import AWS4Auth
+
+        awsauth = AWS4Auth(
+            os.environ['AWS_ACCESS_KEY_ID'],
+            os.environ['AWS_SECRET_ACCESS_KEY'],
+            os.environ['AWS_REGION'],
+            'es',
+            session_token=session_token
+        )
+        client = Elasticsearch(
+            hosts=[{'host': os.environ['ELASTIC_SEARCH_ENDPOINT'], 'port': 443}],
+            http_auth=awsauth,
+            use_ssl=True,
+            verify_certs=True,
+            connection_class=RequestsHttpConnection,
+            timeout=settings.ES_TIMEOUT,
+            max_retries=settings.ES_MAX_RETRIES,
+            retry_on_timeout=True
+        )
+        # RequestsHttpConnection はプールサイズを引数で指定できないため、Session のアダプタを差し替える
+        for connection in client.transport.connection_pool.connections:
+            connection.session.mount('https://', HTTPAdapter(pool_maxsize=settings.ES_POOL_MAX_SIZE))
+
+        return client
+
+
+class LazyElasticsearch:
+    """
+    Elasticsearch クライアントの代理オブジェクト
+    search、index 等の属性に初めてアクセスした時点で ESClient.get_client() によりクライアントを生成して処理を委譲する
+    Elasticsearch を利用しない処理経路ではクライアントの生成コストが発生しない
+    """
+
+    def __getattr__(self, name):
+        return getattr(ESClient.get_client(), name)
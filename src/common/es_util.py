@@ -1,8 +1,21 @@
 # -*- coding: utf-8 -*-
+import json
+import base64
+import settings
+from jsonschema import ValidationError
+
+
 class ESUtil:
+    # search_after で利用するソート対象のフィールド(_source のキー)
+    # from による深いページングはページ数に比例してクラスタの負荷が増えるため、cursor 指定時は search_after を利用する
+    # ソート値が重複した場合に取得漏れが発生しないよう、一意な値を最後のソート条件(tiebreaker)とする
+    RECENT_ARTICLES_SORT_FIELDS = ['sort_key', 'article_id']
+    POPULAR_ARTICLES_SORT_FIELDS = ['article_score', 'article_id']
+    # tags はドキュメントの _id に name を格納しているため、_id をソート条件とし name の値を利用する
+    TAG_SORT_FIELDS = ['count', 'name']
 
     @staticmethod
-    def search_tag(elasticsearch, word, limit, page):
+    def search_tag(elasticsearch, word, limit, page, cursor=None):
         body = {
             'query': {
                 'bool': {
@@ -19,11 +32,12 @@ class ESUtil:
                 }
             },
             'sort': [
-                {'count': 'desc'}
+                {'count': 'desc'},
+                {'_id': 'asc'}
             ],
-            'from': limit * (page - 1),
             'size': limit
         }
+        ESUtil.__set_pagination(body, limit, page, cursor)
 
         response = elasticsearch.search(
             index='tags',
@@ -35,7 +49,7 @@ class ESUtil:
         return tags
 
     @staticmethod
-    def search_article(elasticsearch, limit, page, word=None, tag=None):
+    def search_article(elasticsearch, limit, page, word=None, tag=None, cursor=None):
         body = {
             "query": {
                 "bool": {
@@ -44,11 +58,12 @@ class ESUtil:
                 }
             },
             "sort": [
-                {"sort_key": "desc"}
+                {"sort_key": "desc"},
+                {"article_id.keyword": "asc"}
             ],
-            "from": limit*(page-1),
             "size": limit
         }
+        ESUtil.__set_pagination(body, limit, page, cursor)
 
         # wordが渡ってきた場合は文字列検索をする
         if word:
@@ -86,24 +101,41 @@ class ESUtil:
         return res
 
     @staticmethod
-    def search_user(elasticsearch, word, limit, page):
+    def search_user(elasticsearch, word, limit, page, cursor=None):
         body = {
-            "query": {
-                "wildcard": {
-                    "search_name": f"*{word}*"
-                }
-            },
-            "from": limit*(page-1),
+            "query": ESUtil.__get_search_name_query(word),
+            "sort": [
+                {"_score": "desc"},
+                {"user_id": "asc"}
+            ],
             "size": limit
         }
+        ESUtil.__set_pagination(body, limit, page, cursor)
         res = elasticsearch.search(
                 index="users",
                 body=body
         )
         return res
 
+    # 前後の wildcard による部分一致検索は全ての語句を走査するため、N-gram で分割した search_name.ngram を検索する
+    @staticmethod
+    def __get_search_name_query(word):
+        # N-gram の長さに満たない検索語は、インデックスされた 1〜2文字の N-gram と完全一致するユーザーを検索する
+        if len(word) < settings.USER_SEARCH_NGRAM_SIZE:
+            return {
+                "term": {
+                    "search_name.ngram": word.lower()
+                }
+            }
+        # 3文字ずつに分割した N-gram が隣接して含まれるユーザーを検索する(match では隣接しない場合も一致する)
+        return {
+            "match_phrase": {
+                "search_name.trigram": word
+            }
+        }
+
     @staticmethod
-    def search_popular_articles(elasticsearch, params, limit, page):
+    def search_popular_articles(elasticsearch, params, limit, page, cursor=None):
         if not elasticsearch.indices.exists(index='article_scores'):
             return []
 
@@ -115,11 +147,12 @@ class ESUtil:
                 }
             },
             'sort': [
-                {'article_score': 'desc'}
+                {'article_score': 'desc'},
+                {'article_id.keyword': 'asc'}
             ],
-            'from': limit * (page - 1),
             'size': limit
         }
+        ESUtil.__set_pagination(body, limit, page, cursor)
 
         if params.get('topic'):
             body['query']['bool']['must'].append({'match': {'topic': params.get('topic')}})
@@ -134,7 +167,7 @@ class ESUtil:
         return articles
 
     @staticmethod
-    def search_recent_articles(elasticsearch, params, limit, page):
+    def search_recent_articles(elasticsearch, params, limit, page, cursor=None):
         body = {
             'query': {
                 'bool': {
@@ -142,11 +175,12 @@ class ESUtil:
                 }
             },
             'sort': [
-                {'sort_key': 'desc'}
+                {'sort_key': 'desc'},
+                {'article_id.keyword': 'asc'}
             ],
-            'from': limit * (page - 1),
             'size': limit
         }
+        ESUtil.__set_pagination(body, limit, page, cursor)
 
         if params.get('topic'):
             body['query']['bool']['must'].append({'match': {'topic': params.get('topic')}})
@@ -159,3 +193,39 @@ class ESUtil:
         articles = [item['_source'] for item in res['hits']['hits']]
 
         return articles
+
+    @staticmethod
+    def get_next_cursor(items, limit, sort_fields=None):
+        """
+        次のページを取得するための cursor を返却する。次のページが存在しない場合は None を返却する
+        sort_fields を指定した場合は items(_source のリスト)の値を、指定しない場合は items(hits)の sort の値を利用する
+        """
+        if len(items) < limit:
+            return None
+
+        last_item = items[-1]
+        sort_values = [last_item[field] for field in sort_fields] if sort_fields else last_item['sort']
+
+        return base64.urlsafe_b64encode(json.dumps(sort_values).encode('utf-8')).decode('utf-8')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            sort_values = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8'))
+        except (ValueError, TypeError):
+            raise ValidationError('cursor is invalid')
+
+        if not isinstance(sort_values, list) or len(sort_values) == 0:
+            raise ValidationError('cursor is invalid')
+
+        return sort_values
+
+    @staticmethod
+    def __set_pagination(body, limit, page, cursor):
+        # cursor が空文字の場合は cursor によるページングの1ページ目とする
+        if cursor is not None:
+            if cursor:
+                body['search_after'] = ESUtil.decode_cursor(cursor)
+            return
+
+        body['from'] = limit * (page - 1)
@@ -0,0 +1,74 @@
+import base64
+import math
+from io import BytesIO
+
+from jsonschema import ValidationError
+from PIL import Image
+
+
+class ImageUtil:
+    """
+    API で受け取った画像のデコード、検証、縮小、S3 へのアップロード用データの作成を行う
+    base64 のデコードと Image.open は1リクエストにつき1度のみ行い、検証時に開いた Image をそのまま縮小に利用する
+    """
+
+    @staticmethod
+    def decode_base64_image(base64_image_data):
+        """
+        base64 文字列をデコードし、デコード後のバイト列と Image を返却する
+        Image.open はヘッダのみを読み込むため、検証の時点ではピクセルデータのデコードは行わない
+        """
+        try:
+            image_data = base64.b64decode(base64_image_data)
+            image = Image.open(BytesIO(image_data))
+        except Exception:
+            raise ValidationError('Bad Request: No supported image format')
+
+        return image_data, image
+
+    @staticmethod
+    def shrink(image, width, height):
+        """
+        アスペクト比を維持したまま (width, height) に収まるよう image を縮小する
+        JPEG の場合は draft により 1/2〜1/8 に縮小した状態でデコードし、元のサイズでのデコードを避ける
+        """
+        size = (int(width), int(height))
+        w, h = image.size
+        ratio = min(size[0] / w, size[1] / h)
+        if ratio < 1:
+            # 縮小後のサイズ以上となる範囲で最も小さい縮小率でデコードする(JPEG 以外では何もしない)
+            image.draft(image.mode, (math.ceil(w * ratio), math.ceil(h * ratio)))
+        image.thumbnail(size, Image.LANCZOS)
+
+        return image
+
+    @staticmethod
+    def crop_center(image, crop_width, crop_height):
+        w, h = image.size
+        return image.crop((
+            (w - crop_width) // 2,
+            (h - crop_height) // 2,
+            (w + crop_width) // 2,
+            (h + crop_height) // 2
+        ))
+
+    @classmethod
+    def get_fitted_image_data(cls, image_data, image, max_width, max_height, image_format):
+        """
+        (max_width, max_height) に収まるよう縮小した画像を、S3 の put_object の Body に指定できる形式で返却する
+        収まっている場合は再エンコードせず、デコード済みのバイト列をそのまま返却する
+        """
+        w, h = image.size
+        if w <= max_width and h <= max_height:
+            return image_data
+
+        return cls.to_upload_body(cls.shrink(image, max_width, max_height), image_format)
+
+    @staticmethod
+    def to_upload_body(image, image_format):
+        # getvalue() でバイト列にコピーせず、書き込んだ BytesIO を先頭に戻してそのまま Body として渡す
+        body = BytesIO()
+        image.save(body, format=image_format)
+        body.seek(0)
+
+        return body
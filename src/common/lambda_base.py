@@ -6,6 +6,7 @@ from jsonschema import ValidationError
 from record_not_found_error import RecordNotFoundError
 from not_authorized_error import NotAuthorizedError
 from not_verified_user_error import NotVerifiedUserError
+from request_cache import RequestCache
 
 
 class LambdaBase(metaclass=ABCMeta):
@@ -18,6 +19,7 @@ class LambdaBase(metaclass=ABCMeta):
         self.elasticsearch = elasticsearch
         self.params = None
         self.headers = None
+        self.request_cache = RequestCache()
 
     @abstractmethod
     def get_schema(self):
@@ -87,6 +89,11 @@ class LambdaBase(metaclass=ABCMeta):
                 'statusCode': 500,
                 'body': json.dumps({'message': 'Internal server error'})
             }
+        finally:
+            # 同一リクエスト内で削減できた DynamoDB への問い合わせ数を確認できるようにする
+            cache_stats = self.request_cache.get_stats()
+            if cache_stats['hits'] > 0:
+                logger.info('request_cache: {0}'.format(json.dumps(cache_stats)))
 
     def __get_params(self):
         target_params = [
@@ -0,0 +1,33 @@
+import importlib
+import threading
+
+
+class LazyModule:
+    """
+    モジュールの import を属性への初回アクセス時まで遅延させる代理オブジェクト
+    bleach、Crypto、jwt 等の import に時間のかかるモジュールを、利用しない処理経路の Lambda 初期化時に読み込まないために利用する
+    on_load には import 直後に1度だけ実行する処理(アルゴリズムの登録等)を指定する
+    """
+
+    def __init__(self, name, on_load=None):
+        self.__name = name
+        self.__on_load = on_load
+        self.__module = None
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        return getattr(self.__load(), attr)
+
+    def __load(self):
+        if self.__module is None:
+            with self.__lock:
+                if self.__module is None:
+                    module = importlib.import_module(self.__name)
+                    if self.__on_load is not None:
+                        self.__on_load(module)
+                    self.__module = module
+
+        return self.__module
+
+    def is_loaded(self):
+        return self.__module is not None
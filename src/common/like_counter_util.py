@@ -0,0 +1,88 @@
+import os
+from botocore.exceptions import ClientError
+from db_util import DBUtil
+
+
+class LikeCounterUtil:
+    """
+    記事・コメントのいいね数を LikeCounter テーブルで管理する
+    いいね数の取得時に ArticleLikedUser / CommentLikedUser を COUNT で query すると、いいね数に比例して
+    読み込みコストが増えるため、いいね作成時にカウンタを加算し、取得時は get_item のみで済むようにする
+    カウンタとの乖離は LikeCountersReconcile で再集計して補正する
+    """
+
+    @staticmethod
+    def get_counter_id(counter_type, target_id):
+        return '-'.join([counter_type, target_id])
+
+    @classmethod
+    def increment(cls, dynamodb, counter_type, target_id):
+        like_counter_table = dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        response = like_counter_table.update_item(
+            Key={'counter_id': cls.get_counter_id(counter_type, target_id)},
+            UpdateExpression='SET counter_type = :counter_type, target_id = :target_id ADD #count :increment',
+            ExpressionAttributeNames={'#count': 'count'},
+            ExpressionAttributeValues={
+                ':counter_type': counter_type,
+                ':target_id': target_id,
+                ':increment': 1
+            },
+            ReturnValues='UPDATED_NEW'
+        )
+
+        return int(response['Attributes']['count'])
+
+    @classmethod
+    def get_count(cls, dynamodb, counter_type, target_id):
+        like_counter_table = dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        counter = like_counter_table.get_item(
+            Key={'counter_id': cls.get_counter_id(counter_type, target_id)}
+        ).get('Item')
+
+        return int(counter['count']) if counter else 0
+
+    @classmethod
+    def get_counts(cls, dynamodb, counter_type, target_ids):
+        unique_target_ids = list(dict.fromkeys(target_ids))
+        counters = DBUtil.batch_get_items(
+            dynamodb,
+            os.environ['LIKE_COUNTER_TABLE_NAME'],
+            [{'counter_id': cls.get_counter_id(counter_type, target_id)} for target_id in unique_target_ids]
+        )
+        counts = {counter['target_id']: int(counter['count']) for counter in counters}
+
+        return {target_id: counts.get(target_id, 0) for target_id in unique_target_ids}
+
+    @classmethod
+    def update_count(cls, dynamodb, counter_type, target_id, count, observed_count=None):
+        """
+        カウンタを count に更新する。読み込んだ時点から変わっていない場合のみ更新し、更新した場合は True を返却する
+        読み込み後にいいね作成時の加算が行われた場合は、加算を上書きで失わないよう更新しない
+        :param observed_count: 読み込んだ時点のカウンタの値(カウンタが存在しなかった場合は None)
+        """
+        like_counter_table = dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        values = {
+            ':counter_type': counter_type,
+            ':target_id': target_id,
+            ':count': count
+        }
+        if observed_count is None:
+            condition_expression = 'attribute_not_exists(counter_id)'
+        else:
+            condition_expression = '#count = :observed_count'
+            values[':observed_count'] = observed_count
+
+        try:
+            like_counter_table.update_item(
+                Key={'counter_id': cls.get_counter_id(counter_type, target_id)},
+                UpdateExpression='SET counter_type = :counter_type, target_id = :target_id, #count = :count',
+                ConditionExpression=condition_expression,
+                ExpressionAttributeNames={'#count': 'count'},
+                ExpressionAttributeValues=values
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            return False
+
+        return True
@@ -1,23 +1,138 @@
+import logging
 import os
 import time
 
 import settings
+from botocore.exceptions import ClientError
+from db_util import DBUtil
 from time_util import TimeUtil
+from ttl_cache import TTLCache
+
+unread_notification_manager_cache = TTLCache(
+    settings.UNREAD_NOTIFICATION_MANAGER_CACHE_TTL,
+    settings.UNREAD_NOTIFICATION_MANAGER_CACHE_MAX_SIZE
+)
 
 
 class NotificationUtil:
+    # 未読フラグの更新結果の件数(コンテナ毎の累計)
+    # written: 書き込んだ件数、already_unread: 既に未読のため書き込まなかった件数、cached: キャッシュにより問い合わせなかった件数
+    unread_notification_manager_stats = {'written': 0, 'already_unread': 0, 'cached': 0}
 
-    @staticmethod
-    def notify_article_comment(dynamodb, article_info, comment, target_user_id, comment_type):
-        if comment_type not in settings.COMMENT_NOTIFICATION_TYPES:
-            raise ValueError('Invalid comment type ' + comment_type)
+    @classmethod
+    def notify_article_comment(cls, dynamodb, article_info, comment, target_user_id, comment_type):
+        notification_table = dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
+
+        notification_table.put_item(
+            Item=cls.__get_article_comment_notification(article_info, comment, target_user_id, comment_type)
+        )
+
+    @classmethod
+    def notify_article_comments(cls, dynamodb, article_info, comment, targets):
+        """
+        targets の (通知先のユーザーID, 通知種別) 毎に通知を作成する
+        スレッドへの返信のように通知先が多い場合に1件ずつ put_item しないよう、batch_writer でまとめて書き込む
+        """
+        notifications = [
+            cls.__get_article_comment_notification(article_info, comment, target_user_id, comment_type)
+            for target_user_id, comment_type in targets
+        ]
 
         notification_table = dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
+        with notification_table.batch_writer() as batch:
+            for notification in notifications:
+                batch.put_item(Item=notification)
+
+    @classmethod
+    def update_unread_notification_manager(cls, dynamodb, user_id, use_cache=False):
+        """
+        通知先のユーザーを未読扱いに更新する。既に未読の場合は書き込まない
+        use_cache を指定した場合、直近に未読扱いにしたユーザーは DynamoDB への問い合わせも行わない
+        書き込んだ場合は True を返却する
+        """
+        if use_cache and unread_notification_manager_cache.exists(user_id):
+            cls.__count_unread_notification_manager_results(cached=1)
+            return False
+
+        unread_notification_manager_table = dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
+
+        try:
+            unread_notification_manager_table.update_item(
+                Key={'user_id': user_id},
+                UpdateExpression='set unread = :unread',
+                ConditionExpression='attribute_not_exists(unread) OR unread <> :unread',
+                ExpressionAttributeValues={':unread': True}
+            )
+            written = True
+        except ClientError as e:
+            # 既に未読の場合は条件不一致となるため、書き込み不要として扱う
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            written = False
+
+        if use_cache:
+            unread_notification_manager_cache.set(user_id, True)
+        cls.__count_unread_notification_manager_results(written=int(written), already_unread=int(not written))
+
+        return written
+
+    @classmethod
+    def update_unread_notification_managers(cls, dynamodb, user_ids, use_cache=False):
+        """
+        update_unread_notification_manager を複数ユーザー分まとめて行う
+        batch_writer では条件付きの書き込みができないため、batch_get で現在の未読フラグを取得し、未読でないユーザーのみ書き込む
+        書き込んだユーザーIDのリストを返却する
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        target_user_ids = [
+            user_id for user_id in user_ids if not (use_cache and unread_notification_manager_cache.exists(user_id))
+        ]
+
+        managers = DBUtil.batch_get_items(
+            dynamodb,
+            os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'],
+            [{'user_id': user_id} for user_id in target_user_ids]
+        ) if target_user_ids else []
+        unread_user_ids = {manager['user_id'] for manager in managers if manager.get('unread')}
+        write_user_ids = [user_id for user_id in target_user_ids if user_id not in unread_user_ids]
 
-        notification_id = '-'.join([comment_type, target_user_id, comment['comment_id']])
+        # UnreadNotificationManager は user_id と unread のみを持つため、update_item ではなく put_item で上書きしてまとめて書き込む
+        unread_notification_manager_table = dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
+        with unread_notification_manager_table.batch_writer(overwrite_by_pkeys=['user_id']) as batch:
+            for user_id in write_user_ids:
+                batch.put_item(Item={'user_id': user_id, 'unread': True})
+
+        if use_cache:
+            for user_id in target_user_ids:
+                unread_notification_manager_cache.set(user_id, True)
+        cls.__count_unread_notification_manager_results(
+            written=len(write_user_ids),
+            already_unread=len(unread_user_ids),
+            cached=len(user_ids) - len(target_user_ids)
+        )
+
+        return write_user_ids
+
+    @classmethod
+    def get_unread_notification_manager_stats(cls):
+        return dict(cls.unread_notification_manager_stats)
+
+    @classmethod
+    def __count_unread_notification_manager_results(cls, written=0, already_unread=0, cached=0):
+        results = {'written': written, 'already_unread': already_unread, 'cached': cached}
+        for key, count in results.items():
+            cls.unread_notification_manager_stats[key] += count
+
+        # 書き込みを省略した件数をログのメトリクスフィルタで集計できるよう出力する
+        logging.info('unread_notification_manager: {0}'.format(results))
+
+    @staticmethod
+    def __get_article_comment_notification(article_info, comment, target_user_id, comment_type):
+        if comment_type not in settings.COMMENT_NOTIFICATION_TYPES:
+            raise ValueError('Invalid comment type ' + comment_type)
 
-        notification_table.put_item(Item={
-            'notification_id': notification_id,
+        return {
+            'notification_id': '-'.join([comment_type, target_user_id, comment['comment_id']]),
             'user_id': target_user_id,
             'article_id': article_info['article_id'],
             'article_user_id': article_info['user_id'],
@@ -26,14 +141,4 @@ class NotificationUtil:
             'sort_key': TimeUtil.generate_sort_key(),
             'type': comment_type,
             'created_at': int(time.time())
-        })
-
-    @staticmethod
-    def update_unread_notification_manager(dynamodb, user_id):
-        unread_notification_manager_table = dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
-
-        unread_notification_manager_table.update_item(
-            Key={'user_id': user_id},
-            UpdateExpression='set unread = :unread',
-            ExpressionAttributeValues={':unread': True}
-        )
+        }
@@ -0,0 +1,65 @@
+import logging
+import math
+import settings
+
+
+class PaginationUtil:
+    @classmethod
+    def query_filtered_page(cls, dynamodb_table, query_params, limit, key_names):
+        """
+        FilterExpression を指定した query で、条件に合う項目を limit 件取得する
+        Limit は条件に合うかを判定する前の読み込み件数のため、limit 件に満たない場合は続きを query する
+        その際、それまでの読み込み件数と条件に合った件数の比率から、残りの件数を取得するのに必要な読み込み件数を見積もり、
+        1回の query で読み込む件数を増やすことで問い合わせ回数を抑える
+        :param key_names: 続きを取得する際の ExclusiveStartKey に含める属性(テーブルとインデックスのキー)
+        :return: query の戻り値と同じ形式の dict
+                 (Items、返却件数の Count、全ての query の読み込み件数を合計した ScannedCount、
+                 最後の query の ResponseMetadata、続きが存在する場合は LastEvaluatedKey)
+        """
+        params = dict(query_params)
+        items = []
+        scanned_count = 0
+        request_count = 0
+        page_size = limit
+        last_evaluated_key = None
+
+        while True:
+            params['Limit'] = page_size
+            response = dynamodb_table.query(**params)
+            scanned_count += response['ScannedCount']
+            request_count += 1
+
+            remaining = limit - len(items)
+            items.extend(response['Items'][:remaining])
+            # ページの途中で limit 件に達した場合は、最後に返却する項目から続きを取得する
+            if len(items) == limit and (len(response['Items']) > remaining or 'LastEvaluatedKey' in response):
+                last_evaluated_key = {key_name: items[-1][key_name] for key_name in key_names}
+                break
+            if len(items) == limit or 'LastEvaluatedKey' not in response:
+                break
+
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            page_size = cls.__get_next_page_size(page_size, limit - len(items), len(items), scanned_count)
+
+        logging.info('query_filtered_page: read {0} items, returned {1} items, {2} requests'.format(
+            scanned_count, len(items), request_count))
+
+        result = {
+            'Items': items,
+            'Count': len(items),
+            'ScannedCount': scanned_count,
+            'ResponseMetadata': response['ResponseMetadata']
+        }
+        if last_evaluated_key is not None:
+            result['LastEvaluatedKey'] = last_evaluated_key
+        return result
+
+    @staticmethod
+    def __get_next_page_size(page_size, remaining, matched_count, scanned_count):
+        # 条件に合う項目がまだ無い場合は比率が分からないため、読み込み件数を一定の割合で増やす
+        if matched_count == 0:
+            next_page_size = page_size * settings.DYNAMO_FILTERED_QUERY_PAGE_GROWTH_RATE
+        else:
+            next_page_size = math.ceil(remaining * scanned_count / matched_count)
+
+        return max(remaining, min(next_page_size, settings.DYNAMO_FILTERED_QUERY_MAX_PAGE_SIZE))
@@ -0,0 +1,144 @@
+import os
+import json
+import time
+import random
+import logging
+import threading
+import requests
+import settings
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from aws_requests_auth.aws_auth import AWSRequestsAuth
+
+
+class PrivateChainClient:
+    """
+    プライベートチェーン API へのリクエストを行うクライアント
+    Session をモジュールレベル(クラス変数)で保持し、warm コンテナ間で TLS コネクションと署名用の認証情報を再利用する
+    呼び出し元のレスポンス判定を変えないよう、requests の Response をそのまま返却する
+    """
+    session = None
+    auth = None
+    auth_key = None
+    metrics = {}
+    metrics_lock = threading.Lock()
+
+    @classmethod
+    def post(cls, endpoint, payload=None, headers=None):
+        url = cls.get_base_url() + '/' + endpoint
+        # wallet/tip 等のトランザクション発行は再送すると二重に実行される恐れがあるため、リトライ対象外とする
+        max_count = settings.PRIVATE_CHAIN_RETRY_MAX_COUNT \
+            if endpoint in settings.PRIVATE_CHAIN_RETRYABLE_ENDPOINTS else 0
+
+        count = 0
+        while True:
+            started_at = time.time()
+            try:
+                response = cls.get_session().post(
+                    url,
+                    auth=cls.get_auth(),
+                    headers=headers,
+                    data=payload,
+                    timeout=(settings.PRIVATE_CHAIN_CONNECT_TIMEOUT, settings.PRIVATE_CHAIN_READ_TIMEOUT)
+                )
+            except requests.exceptions.RequestException as e:
+                cls.__add_metrics(endpoint, time.time() - started_at, is_error=True)
+                if count >= max_count:
+                    raise e
+            else:
+                is_server_error = response.status_code >= 500
+                cls.__add_metrics(endpoint, time.time() - started_at, is_error=is_server_error)
+                if not is_server_error or count >= max_count:
+                    return response
+
+            # 同時に失敗したリクエストが一斉に再送されないよう、待機時間にゆらぎを持たせる
+            time.sleep(random.uniform(0, settings.PRIVATE_CHAIN_RETRY_INITIAL_WAIT * (2 ** count)))
+            count += 1
+            with cls.metrics_lock:
+                cls.metrics[endpoint]['retries'] += 1
+
+    @classmethod
+    def get_transaction_receipts(cls, transaction_hashes, headers=None,
+                                 max_workers=settings.PRIVATE_CHAIN_POOL_MAX_SIZE):
+        """
+        複数トランザクションの transaction/receipt を並列に取得し、トランザクションハッシュをキーとした dict で返却する
+        個別のリクエストで発生した例外は他のリクエストに影響させないよう、Response の代わりに例外を格納する
+        """
+        transaction_hashes = list(dict.fromkeys(transaction_hashes))
+        if len(transaction_hashes) == 0:
+            return {}
+
+        def get_receipt(transaction_hash):
+            try:
+                return cls.post('transaction/receipt', payload=json.dumps({'transaction_hash': transaction_hash}),
+                                headers=headers)
+            except Exception as e:
+                return e
+
+        # 各スレッドで Session が重複して生成されないよう、事前に生成しておく
+        cls.get_session()
+        # コネクションプールの上限を超えて並列化しても待ちが発生するだけのため、ワーカ数はプールサイズに合わせる
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(transaction_hashes))) as executor:
+            responses = list(executor.map(get_receipt, transaction_hashes))
+
+        return dict(zip(transaction_hashes, responses))
+
+    @staticmethod
+    def get_base_url():
+        return 'https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] + '/' + settings.PRIVATE_CHAIN_API_STAGE
+
+    @classmethod
+    def get_session(cls):
+        if cls.session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.PRIVATE_CHAIN_POOL_MAX_SIZE)
+            session.mount('https://', adapter)
+            cls.session = session
+
+        return cls.session
+
+    @classmethod
+    def get_auth(cls):
+        # テスト等で環境変数が変更された場合は認証情報を作り直す
+        auth_key = (
+            os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'],
+            os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'],
+            os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST']
+        )
+        if cls.auth is None or cls.auth_key != auth_key:
+            cls.auth = AWSRequestsAuth(aws_access_key=auth_key[0],
+                                       aws_secret_access_key=auth_key[1],
+                                       aws_host=auth_key[2],
+                                       aws_region=settings.PRIVATE_CHAIN_AWS_REGION,
+                                       aws_service='execute-api')
+            cls.auth_key = auth_key
+
+        return cls.auth
+
+    @classmethod
+    def get_metrics(cls):
+        return cls.metrics
+
+    @classmethod
+    def reset_metrics(cls):
+        with cls.metrics_lock:
+            cls.metrics = {}
+
+    @classmethod
+    def __add_metrics(cls, endpoint, elapsed, is_error):
+        # get_transaction_receipts では複数スレッドから更新されるためロックする
+        with cls.metrics_lock:
+            metrics = cls.metrics.setdefault(endpoint, {
+                'count': 0,
+                'errors': 0,
+                'retries': 0,
+                'total_time': 0.0,
+                'max_time': 0.0
+            })
+            metrics['count'] += 1
+            metrics['total_time'] += elapsed
+            metrics['max_time'] = max(metrics['max_time'], elapsed)
+            if is_error:
+                metrics['errors'] += 1
+
+        logging.info('private_chain: endpoint={0} elapsed={1:.3f} error={2}'.format(endpoint, elapsed, is_error))
@@ -0,0 +1,42 @@
+class RequestCache:
+    """
+    リクエスト単位で DynamoDB の get_item 結果を保持する Identity Map
+    同一リクエスト内では同じテーブル・キーのアイテムを DynamoDB から高々1回のみ取得する
+    LambdaBase のインスタンスごとに生成されるため、リクエストを跨いでキャッシュが残ることはない
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_item(self, table, key):
+        cache_key = self.__get_cache_key(table.name, key)
+
+        if cache_key in self.items:
+            self.hits += 1
+            return self.items[cache_key]
+
+        self.misses += 1
+        # 存在しないアイテム(None)もキャッシュし、同一リクエスト内での再問い合わせを防ぐ
+        item = table.get_item(Key=key).get('Item')
+        self.items[cache_key] = item
+
+        return item
+
+    # 同一リクエスト内で対象アイテムを更新した場合は invalidate を呼び出し、再取得させること
+    def invalidate(self, table_name, key):
+        self.items.pop(self.__get_cache_key(table_name, key), None)
+
+    def clear(self):
+        self.items = {}
+
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    @staticmethod
+    def __get_cache_key(table_name, key):
+        return (table_name,) + tuple(sorted(key.items()))
@@ -114,6 +114,10 @@ parameters = {
         'minimum': 1,
         'maximum': 100000
     },
+    'cursor': {
+        'type': 'string',
+        'maxLength': 1024
+    },
     'query': {
         'type': 'string',
         'minLength': 1,
@@ -129,6 +133,16 @@ parameters = {
         'minLength': 1,
         'maxLength': 25
     },
+    'article_ids': {
+        'type': 'array',
+        'items': {
+            'type': 'string',
+            'minLength': 12,
+            'maxLength': 12
+        },
+        'minItems': 1,
+        'maxItems': 100
+    },
     'tags': {
         'type': 'array',
         'items': {
@@ -253,6 +267,15 @@ ng_user_name = [
 
 LIKED_RETRY_COUNT = 3
 
+# LikeCounter テーブルのカウンタの種別(counter_id の接頭辞)
+ARTICLE_LIKE_COUNTER_TYPE = 'article_like'
+COMMENT_LIKE_COUNTER_TYPE = 'comment_like'
+
+# TokenDistribution の distribution_type(TokenDistributionTotal テーブルの集計項目)
+TOKEN_DISTRIBUTION_TYPES = ['article', 'like', 'tip', 'bonus']
+# 加算済みのストリームのレコードの記録の保持期間(ストリームのレコードの保持期間である24時間より長くする)
+TOKEN_DISTRIBUTION_APPLIED_RECORD_EXPIRATION_DAYS = 2
+
 ARTICLE_IMAGE_MAX_WIDTH = 3840
 ARTICLE_IMAGE_MAX_HEIGHT = 2160
 
@@ -261,6 +284,12 @@ USER_ICON_HEIGHT = 240
 
 S3_ARTICLES_IMAGES_PATH = 'd/api/articles_images/'
 S3_INFO_ICON_PATH = 'd/api/info_icon/'
+# 記事画像から作成する表示幅毎の派生画像の保存先と幅
+# S3_ARTICLES_IMAGES_PATH 配下の作成イベントで処理を行うため、派生画像は別のパスに保存する
+S3_ARTICLES_IMAGES_DERIVATIVES_PATH = 'd/api/articles_images_derivatives/'
+ARTICLE_IMAGE_DERIVATIVE_WIDTHS = [1280, 640]
+# 非同期処理で縮小して上書きした記事画像に付与するメタデータ(上書きによる作成イベントを処理対象外とする)
+ARTICLE_IMAGE_PROCESSED_METADATA_KEY = 'processed'
 
 LIKE_NOTIFICATION_TYPE = 'like'
 COMMENT_NOTIFICATION_TYPE = 'comment'
@@ -276,10 +305,148 @@ COMMENT_NOTIFICATION_TYPES = [
 ARTICLE_SCORE_INDEX_NAME = 'article_scores'
 TOPIC_INDEX_HASH_KEY = 'topic'
 
+# warm コンテナ上で保持するキャッシュの有効期限(秒)と最大エントリ数
+TOPIC_CACHE_TTL = 300
+SCREENED_ARTICLE_CACHE_TTL = 60
+TTL_CACHE_MAX_SIZE = 16
+# 通知の未読フラグを立てたユーザーを warm コンテナ上で保持する期間(秒)と最大エントリ数
+# 保持中にユーザーが通知を既読にした場合、次の通知で未読フラグが立たないため短く設定する
+UNREAD_NOTIFICATION_MANAGER_CACHE_TTL = 10
+UNREAD_NOTIFICATION_MANAGER_CACHE_MAX_SIZE = 10000
+
 TAG_DENIED_SYMBOL_PATTERN = '([!-,./:-@[-`{-~]|--| {2})'
 TAG_ALLOWED_SYMBOLS = ['-', ' ']
+# タグのカウント再集計時に1度に取得する集計結果の件数
+TAG_COUNT_AGGREGATION_SIZE = 10000
+# タグのカウント再集計時に作成する tags インデックスの設定(elasticsearch-setup.py と同一)
+TAG_INDEX_SETTINGS = {
+    'settings': {
+        'analysis': {
+            'normalizer': {
+                'lowercase_normalizer': {
+                    'type': 'custom',
+                    'char_filter': [],
+                    'filter': ['lowercase']
+                }
+            },
+            'filter': {
+                'autocomplete_filter': {
+                    'type': 'edge_ngram',
+                    'min_gram': 1,
+                    'max_gram': 20
+                }
+            },
+            'analyzer': {
+                'autocomplete': {
+                    'type': 'custom',
+                    'tokenizer': 'keyword',
+                    'filter': [
+                        'lowercase',
+                        'autocomplete_filter'
+                    ]
+                }
+            }
+        }
+    },
+    'mappings': {
+        'tag': {
+            'properties': {
+                'name': {
+                    'type': 'keyword',
+                    'normalizer': 'lowercase_normalizer'
+                },
+                'name_with_analyzer': {
+                    'type': 'text',
+                    'analyzer': 'autocomplete'
+                },
+                'created_at': {
+                    'type': 'integer'
+                }
+            }
+        }
+    }
+}
 
 
+# users インデックスの search_name は部分一致検索のため、1〜3文字の N-gram を search_name.ngram に、
+# 3文字の N-gram を search_name.trigram に格納する
+# 検索語が USER_SEARCH_NGRAM_SIZE 文字未満の場合は search_name.ngram を、以上の場合は検索語を3文字ずつに分割し
+# search_name.trigram に対して連続して含むユーザーを検索する
+# Elasticsearch 6.2 には index.max_ngram_diff がなく(6.4 以降)、min_gram と max_gram の差の上限もないため指定しない
+USER_SEARCH_NGRAM_SIZE = 3
+USERS_INDEX_SETTINGS = {
+    'settings': {
+        'index': {
+            'number_of_replicas': '1'
+        },
+        'analysis': {
+            'analyzer': {
+                'default': {
+                    'tokenizer': 'keyword'
+                },
+                'search_name_ngram': {
+                    'type': 'custom',
+                    'tokenizer': 'search_name_ngram',
+                    'filter': ['lowercase']
+                },
+                'search_name_trigram': {
+                    'type': 'custom',
+                    'tokenizer': 'search_name_trigram',
+                    'filter': ['lowercase']
+                }
+            },
+            'tokenizer': {
+                'search_name_ngram': {
+                    'type': 'ngram',
+                    'min_gram': 1,
+                    'max_gram': USER_SEARCH_NGRAM_SIZE
+                },
+                'search_name_trigram': {
+                    'type': 'ngram',
+                    'min_gram': USER_SEARCH_NGRAM_SIZE,
+                    'max_gram': USER_SEARCH_NGRAM_SIZE
+                }
+            },
+            'normalizer': {
+                'lowcase': {
+                    'type': 'custom',
+                    'char_filter': [],
+                    'filter': ['lowercase']
+                }
+            }
+        }
+    },
+    'mappings': {
+        'user': {
+            'properties': {
+                'user_id': {
+                    'type': 'keyword',
+                    'copy_to': 'search_name'
+                },
+                'user_display_name': {
+                    'type': 'keyword',
+                    'copy_to': 'search_name'
+                },
+                'search_name': {
+                    'type': 'keyword',
+                    'normalizer': 'lowcase',
+                    'fields': {
+                        'ngram': {
+                            'type': 'text',
+                            'analyzer': 'search_name_ngram'
+                        },
+                        # N-gram の位置が連続するよう、3文字の N-gram のみを格納する
+                        'trigram': {
+                            'type': 'text',
+                            'analyzer': 'search_name_trigram'
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
 YAHOO_API_WELL_KNOWN_URL = 'https://auth.login.yahoo.co.jp/yconnect/v2/.well-known/openid-configuration'
 YAHOO_API_PUBLIC_KEY_URL = 'https://auth.login.yahoo.co.jp/yconnect/v2/public-keys'
 YAHOO_USERNAME_PREFIX = 'Yahoo-'
@@ -313,10 +480,29 @@ LINE_LOGIN_REQUEST_SCOPE = '&scope=openid%20profile'
 PASSWORD_LENGTH = 32
 AES_IV_BYTES = 16
 DYNAMO_BATCH_GET_MAX = 100
+DYNAMO_BATCH_GET_RETRY_MAX_COUNT = 5
+DYNAMO_BATCH_GET_RETRY_INITIAL_WAIT = 0.05
+DYNAMO_PARALLEL_QUERY_MAX_WORKERS = 10
+DYNAMO_PARALLEL_SCAN_TOTAL_SEGMENTS = 8
+# FilterExpression 付きの一覧取得で、1回の query で読み込む件数の上限と、条件に合う項目が無かった場合の読み込み件数の増加率
+DYNAMO_FILTERED_QUERY_MAX_PAGE_SIZE = 500
+DYNAMO_FILTERED_QUERY_PAGE_GROWTH_RATE = 4
 
-POLLING_INITIAL_COUNT = 0
-POLLING_MAX_COUNT = 10
 ETH_ZERO_ADDRESS = '0000000000000000000000000000000000000000'
 ARTICLE_PURCHASE_TYPE = 'purchase'
 ARTICLE_PURCHASED_TYPE = 'purchased'
 ARTICLE_PURCHASE_ERROR_TYPE = 'purchase_error'
+
+PRIVATE_CHAIN_API_STAGE = 'production'
+PRIVATE_CHAIN_AWS_REGION = 'ap-northeast-1'
+PRIVATE_CHAIN_CONNECT_TIMEOUT = 3.05
+PRIVATE_CHAIN_READ_TIMEOUT = 20
+PRIVATE_CHAIN_POOL_MAX_SIZE = 10
+PRIVATE_CHAIN_RETRY_MAX_COUNT = 3
+PRIVATE_CHAIN_RETRY_INITIAL_WAIT = 0.1
+# 5xx 時に再送しても二重実行とならないエンドポイント
+PRIVATE_CHAIN_RETRYABLE_ENDPOINTS = ['wallet/balance', 'transaction/receipt']
+
+ES_TIMEOUT = 10
+ES_MAX_RETRIES = 2
+ES_POOL_MAX_SIZE = 10
@@ -3,64 +3,63 @@ import time
 
 import settings
 from jsonschema import ValidationError
+from lazy_import import LazyModule
+
+helpers = LazyModule('elasticsearch.helpers')
 
 
 class TagUtil:
+    """
+    ElasticSearchに存在しないタグを作成する
+    タグのカウントは rebuild_tag_index で記事から集計するため、ここでは更新しない
+    タグの存在チェックは msearch、作成は _bulk でまとめて行い、タグ数に関わらず ES へのリクエストを2回以内とする
+    tags には get_items_case_insensitive で取得済みの結果を指定でき、含まれるタグ名は存在チェックを行わない
+    """
     @classmethod
-    def create_and_count(cls, elasticsearch, before_tag_names, after_tag_names):
-        if before_tag_names is None:
-            before_tag_names = []
-
-        if after_tag_names is None:
-            after_tag_names = []
+    def create_tags(cls, elasticsearch, tag_names, tags=None):
+        if not tag_names:
+            return
 
-        for tag_name in after_tag_names:
-            if before_tag_names is None or tag_name not in before_tag_names:
+        # 大文字小文字区別せずに存在チェックを行いDB(ES)にすでに存在する値を取得する
+        tags = dict(tags) if tags is not None else {}
+        tags.update(cls.get_items_case_insensitive(
+            elasticsearch,
+            [tag_name for tag_name in tag_names if tag_name not in tags]
+        ))
 
-                # 大文字小文字区別せずに存在チェックを行いDB(ES)にすでに存在する値を取得する
-                tag = cls.__get_item_case_insensitive(elasticsearch, tag_name)
+        # 大文字小文字のみ異なるタグが指定された場合は、最初のタグのみを作成する
+        new_tag_names = {}
+        for tag_name in tag_names:
+            if tags[tag_name] is None:
+                new_tag_names.setdefault(tag_name.lower(), tag_name)
 
-                if tag:
-                    # タグが追加された場合カウントを+1する
-                    cls.update_count(elasticsearch, tag['name'], 1)
-                # タグがDB(ES)に存在しない場合は新規作成する
-                else:
-                    cls.create_tag(elasticsearch, tag_name)
+        if not new_tag_names:
+            return
 
-        # タグが外された場合カウントを-1する
-        for tag_name in before_tag_names:
-            if tag_name not in after_tag_names:
-                tag = cls.__get_item_case_insensitive(elasticsearch, tag_name)
-                if tag and tag['count'] > 0:
-                    cls.update_count(elasticsearch, tag['name'], -1)
+        actions = []
+        for tag_name in new_tag_names.values():
+            actions.extend([
+                {'create': {'_id': tag_name}},
+                cls.__get_new_tag(tag_name)
+            ])
 
-    @classmethod
-    def update_count(cls, elasticsearch, tag_name, num):
-        update_script = {
-            'script': {
-                'source': 'ctx._source.count += params.count',
-                'lang': 'painless',
-                'params': {
-                    'count': num
-                }
-            }
-        }
+        response = elasticsearch.bulk(index='tags', doc_type='tag', body=actions)
 
-        elasticsearch.update(index='tags', doc_type='tag', id=tag_name, body=update_script)
+        # 並行して同じタグが作成された場合(409)はエラーとしない
+        if response.get('errors'):
+            failed_items = [item['create'] for item in response['items']
+                            if item['create'].get('error') and item['create'].get('status') != 409]
+            if failed_items:
+                raise Exception('Failed to create tags: {0}'.format(failed_items))
 
     """
-    ここで作成されたtagが検索対象になるまで(__get_item_case_insensitiveの条件として引っかかってくるまで)1sほどかかる
+    ここで作成されたtagが検索対象になるまで(get_items_case_insensitiveの条件として引っかかってくるまで)1sほどかかる
     これはESのセグメントマージという仕様によるものでどうしても回避したい場合は `elasticsearch.indices.refresh(index='tags')` をcreate後に行う必要がある
     しかし、ESのデフォルト挙動を無理やり変えることになり、返ってパフォーマンス低下が起きる可能性もあるので特に何もしていない
     """
     @classmethod
     def create_tag(cls, elasticsearch, tag_name):
-        tag = {
-            'name': tag_name,
-            'name_with_analyzer': tag_name,
-            'count': 1,
-            'created_at': int(time.time())
-        }
+        tag = cls.__get_new_tag(tag_name)
 
         elasticsearch.index(
             index='tags',
@@ -72,16 +71,23 @@ class TagUtil:
     """
     与えられたタグ名をElasticSearchに問い合わせ(大文字小文字区別せず)
     すでに存在する場合はElasticSearchに存在する文字列に完全一致する形に変換し、タグ名の配列を返却する
+    tags には get_items_case_insensitive で取得済みの結果を指定でき、含まれるタグ名は ES への問い合わせを行わない
     """
     @classmethod
-    def get_tags_with_name_collation(cls, elasticsearch, tag_names):
+    def get_tags_with_name_collation(cls, elasticsearch, tag_names, tags=None):
         if not tag_names:
             return tag_names
 
+        tags = dict(tags) if tags is not None else {}
+        tags.update(cls.get_items_case_insensitive(
+            elasticsearch,
+            [tag_name for tag_name in tag_names if tag_name not in tags]
+        ))
+
         results = []
 
         for tag_name in tag_names:
-            tag = cls.__get_item_case_insensitive(elasticsearch, tag_name)
+            tag = tags.get(tag_name)
 
             if tag:
                 results.append(tag['name'])
@@ -104,27 +110,164 @@ class TagUtil:
                 if tag[0] == symbol or tag[-1] == symbol:
                     raise ValidationError("tags don't support {str} with start and end of character".format(str=symbol))
 
+    """
+    記事(articles)に設定されたタグの記事数を集計してタグのカウントとした新しいインデックスを作成し、tags エイリアスを切り替える
+    公開処理の度にカウントを更新すると、ES への書き込みが公開処理のリクエスト内で発生し、失敗時にカウントがずれるため、
+    定期実行(TagsCountRebuild)で全体を再集計する
+    """
     @classmethod
-    def __get_item_case_insensitive(cls, elasticsearch, tag_name):
+    def rebuild_tag_index(cls, elasticsearch):
+        started_at = int(time.time())
+        index_name = 'tags-{0}'.format(int(time.time() * 1000))
+
+        counts = cls.aggregate_tag_counts(elasticsearch)
+
+        elasticsearch.indices.create(index=index_name, body=settings.TAG_INDEX_SETTINGS)
+        tag_count, _ = helpers.bulk(elasticsearch, cls.__get_rebuild_actions(elasticsearch, index_name, counts))
+
+        if elasticsearch.indices.exists(index='tags'):
+            # 集計中に公開処理で作成されたタグを新しいインデックスに反映する
+            created_tags = helpers.scan(
+                elasticsearch,
+                index='tags',
+                query={'query': {'range': {'created_at': {'gte': started_at}}}}
+            )
+            # 集計済みのタグ(409)はエラーとしない
+            helpers.bulk(elasticsearch, ({
+                '_op_type': 'create',
+                '_index': index_name,
+                '_type': 'tag',
+                '_id': item['_id'],
+                '_source': item['_source']
+            } for item in created_tags), raise_on_error=False)
+
+        elasticsearch.indices.refresh(index=index_name)
+
+        # エイリアスの切り替えは1度の update_aliases で行い、tags の参照が途切れないようにする
+        actions = [{'add': {'index': index_name, 'alias': 'tags'}}]
+        old_index_names = []
+        if elasticsearch.indices.exists_alias(name='tags'):
+            old_index_names = list(elasticsearch.indices.get_alias(name='tags').keys())
+            actions.extend([{'remove': {'index': old_index_name, 'alias': 'tags'}} for old_index_name in old_index_names])
+        elif elasticsearch.indices.exists(index='tags'):
+            # 初回はエイリアスと同名のインデックスを削除し、エイリアスに置き換える
+            actions.append({'remove_index': {'index': 'tags'}})
+        elasticsearch.indices.update_aliases(body={'actions': actions})
+
+        for old_index_name in old_index_names:
+            elasticsearch.indices.delete(index=old_index_name)
+
+        return {
+            'index': index_name,
+            'tag_count': tag_count
+        }
+
+    """
+    記事(articles)に設定されたタグ毎の記事数を composite(terms) aggregation で集計する
+    小文字に変換したタグ名をキー、タグ名と記事数を値とした dict を返却する
+    """
+    @staticmethod
+    def aggregate_tag_counts(elasticsearch):
+        if not elasticsearch.indices.exists(index='articles'):
+            return {}
+
         body = {
-            'query': {
-                'bool': {
-                    'must': [
-                        {'term': {'name': tag_name}}
-                    ]
+            'size': 0,
+            'aggs': {
+                'tags': {
+                    'composite': {
+                        'size': settings.TAG_COUNT_AGGREGATION_SIZE,
+                        'sources': [
+                            {'name': {'terms': {'field': 'tags.keyword'}}}
+                        ]
+                    }
                 }
             }
         }
 
-        res = elasticsearch.search(
+        counts = {}
+        while True:
+            response = elasticsearch.search(index='articles', body=body)
+            aggregation = response['aggregations']['tags']
+
+            for bucket in aggregation['buckets']:
+                name = bucket['key']['name']
+                aggregated = counts.setdefault(name.lower(), {'name': name, 'count': 0, 'max_doc_count': 0})
+                # 大文字小文字のみ異なるタグは合算し、記事数の多い表記をタグ名とする
+                aggregated['count'] += bucket['doc_count']
+                if bucket['doc_count'] > aggregated['max_doc_count']:
+                    aggregated['name'] = name
+                    aggregated['max_doc_count'] = bucket['doc_count']
+
+            if not aggregation['buckets'] or aggregation.get('after_key') is None:
+                break
+            body['aggs']['tags']['composite']['after'] = aggregation['after_key']
+
+        return {key: {'name': value['name'], 'count': value['count']} for key, value in counts.items()}
+
+    """
+    与えられた複数のタグ名を1度の msearch でElasticSearchに問い合わせ(大文字小文字区別せず)
+    タグ名をキー、ElasticSearchに存在するタグ(存在しない場合は None)を値とした dict を返却する
+    """
+    @classmethod
+    def get_items_case_insensitive(cls, elasticsearch, tag_names):
+        tag_names = list(dict.fromkeys(tag_names or []))
+        if not tag_names:
+            return {}
+
+        body = []
+        for tag_name in tag_names:
+            body.extend([
+                {},
+                {
+                    'query': {
+                        'bool': {
+                            'must': [
+                                {'term': {'name': tag_name}}
+                            ]
+                        }
+                    }
+                }
+            ])
+
+        res = elasticsearch.msearch(
             index='tags',
             doc_type='tag',
             body=body
         )
 
-        tags = [item['_source'] for item in res['hits']['hits']]
+        results = {}
+        for tag_name, response in zip(tag_names, res['responses']):
+            if response.get('error'):
+                raise Exception('Failed to search tag: {0}'.format(response['error']))
+            tags = [item['_source'] for item in response['hits']['hits']]
+            results[tag_name] = tags[0] if tags else None
+
+        return results
+
+    @classmethod
+    def __get_rebuild_actions(cls, elasticsearch, index_name, counts):
+        counts = dict(counts)
+
+        # 既存のタグは作成日時等を引き継ぎ、カウントのみを集計結果に置き換える
+        if elasticsearch.indices.exists(index='tags'):
+            for item in helpers.scan(elasticsearch, index='tags'):
+                tag = item['_source']
+                aggregated = counts.pop(tag['name'].lower(), None)
+                tag['count'] = aggregated['count'] if aggregated else 0
+                yield {'_index': index_name, '_type': 'tag', '_id': item['_id'], '_source': tag}
 
-        if not tags:
-            return None
+        # 記事に設定されているが tags に存在しないタグは新規に作成する
+        for aggregated in counts.values():
+            tag = cls.__get_new_tag(aggregated['name'])
+            tag['count'] = aggregated['count']
+            yield {'_index': index_name, '_type': 'tag', '_id': tag['name'], '_source': tag}
 
-        return tags[0]
+    @staticmethod
+    def __get_new_tag(tag_name):
+        return {
+            'name': tag_name,
+            'name_with_analyzer': tag_name,
+            'count': 1,
+            'created_at': int(time.time())
+        }
@@ -1,7 +1,9 @@
 import settings
-import bleach
 import os
 from urllib.parse import urlparse
+from lazy_import import LazyModule
+
+bleach = LazyModule('bleach')
 
 
 class TextSanitizer:
@@ -0,0 +1,94 @@
+import os
+import time
+import settings
+from botocore.exceptions import ClientError
+
+
+class TokenDistributionTotalUtil:
+    """
+    ユーザー毎のトークン付与量の合計を distribution_type 別に TokenDistributionTotal テーブルで管理する
+    付与量の取得時に TokenDistribution を全件 query して合算すると、付与履歴の件数に比例して
+    読み込みコストが増えるため、TokenDistribution のストリームから合計を加算し、取得時は get_item のみで済むようにする
+    ストリームのレコードは再処理されても1度のみ加算する
+    合計との乖離は TokenDistributionTotalsRebuild で再集計して補正する
+    """
+
+    @staticmethod
+    def get_empty_totals():
+        return {distribution_type: 0 for distribution_type in settings.TOKEN_DISTRIBUTION_TYPES}
+
+    @staticmethod
+    def add(dynamodb, event_id, quantities_by_user):
+        """
+        ストリームのレコード(event_id)の加算量をユーザー毎の合計に加算する。加算した場合は True を返却する
+        ストリームの再処理で同じレコードを二重に加算しないよう、加算済みのレコードを TokenDistributionAppliedRecord に記録し、
+        記録と加算を1つのトランザクションで行う。記録済みのレコードは加算しない
+        :param quantities_by_user: user_id 毎の distribution_type 別の加算量(減算時は負の値)
+        """
+        updates = []
+        for user_id, quantities in sorted(quantities_by_user.items()):
+            quantities = {k: v for k, v in quantities.items() if v != 0}
+            if not quantities:
+                continue
+
+            names = {}
+            values = {}
+            expressions = []
+            for i, (distribution_type, quantity) in enumerate(sorted(quantities.items())):
+                names['#type{0}'.format(i)] = distribution_type
+                values[':quantity{0}'.format(i)] = quantity
+                expressions.append('#type{0} :quantity{0}'.format(i))
+
+            updates.append({
+                'Update': {
+                    'TableName': os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'],
+                    'Key': {'user_id': user_id},
+                    'UpdateExpression': 'ADD ' + ', '.join(expressions),
+                    'ExpressionAttributeNames': names,
+                    'ExpressionAttributeValues': values
+                }
+            })
+
+        if not updates:
+            return False
+
+        applied_record = {
+            'Put': {
+                'TableName': os.environ['TOKEN_DISTRIBUTION_APPLIED_RECORD_TABLE_NAME'],
+                'Item': {
+                    'event_id': event_id,
+                    'expiration_time': int(time.time()) +
+                    settings.TOKEN_DISTRIBUTION_APPLIED_RECORD_EXPIRATION_DAYS * 24 * 60 * 60
+                },
+                'ConditionExpression': 'attribute_not_exists(event_id)'
+            }
+        }
+
+        try:
+            dynamodb.meta.client.transact_write_items(TransactItems=[applied_record] + updates)
+        except ClientError as e:
+            # 記録済みのレコードの場合は加算済みのため、条件不一致となったトランザクションは加算不要として扱う
+            reasons = e.response.get('CancellationReasons') or [{}]
+            if e.response['Error']['Code'] == 'TransactionCanceledException' and \
+                    reasons[0].get('Code') == 'ConditionalCheckFailed':
+                return False
+            raise
+
+        return True
+
+    @classmethod
+    def get_totals(cls, dynamodb, user_id):
+        token_distribution_total_table = dynamodb.Table(os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'])
+        total = token_distribution_total_table.get_item(Key={'user_id': user_id}).get('Item', {})
+
+        result = cls.get_empty_totals()
+        result.update({k: total[k] for k in result if k in total})
+        return result
+
+    @staticmethod
+    def put_totals(dynamodb, totals):
+        # totals: user_id 毎の distribution_type 別の合計
+        token_distribution_total_table = dynamodb.Table(os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'])
+        with token_distribution_total_table.batch_writer() as batch:
+            for user_id, quantities in totals.items():
+                batch.put_item(Item=dict(quantities, user_id=user_id))
@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Lambda の warm コンテナが再利用される間、モジュールレベルで保持されるキャッシュ
+    更新頻度の低いマスタ系データ(topic、screened_article 等)の DynamoDB 問い合わせを削減するために利用する
+    ttl 秒を経過したエントリは再取得し、max_size を超えた場合は古いエントリから破棄する
+    """
+    instances = []
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        TTLCache.instances.append(self)
+
+    def get_or_load(self, key, loader, bypass=False):
+        if not bypass:
+            entry = self.items.get(key)
+            if entry is not None and not self.__is_expired(entry):
+                self.hits += 1
+                return entry['value']
+
+        self.misses += 1
+        value = loader()
+        self.set(key, value)
+
+        return value
+
+    def set(self, key, value):
+        self.items.pop(key, None)
+        self.items[key] = {
+            'value': value,
+            'stored_at': time.time()
+        }
+
+        while len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+
+    # 有効期限内のエントリが存在するかを返却する(hits、misses は加算しない)
+    def exists(self, key):
+        entry = self.items.get(key)
+        return entry is not None and not self.__is_expired(entry)
+
+    # キャッシュされてからの経過秒数を返却する。キャッシュされていない場合は None
+    def get_age(self, key):
+        entry = self.items.get(key)
+
+        if entry is None:
+            return None
+
+        return time.time() - entry['stored_at']
+
+    # key を指定しない場合は全てのエントリを破棄する
+    def invalidate(self, key=None):
+        if key is None:
+            self.items.clear()
+        else:
+            self.items.pop(key, None)
+
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.items)
+        }
+
+    @classmethod
+    def invalidate_all(cls):
+        for instance in cls.instances:
+            instance.invalidate()
+
+    def __is_expired(self, entry):
+        return time.time() - entry['stored_at'] >= self.ttl
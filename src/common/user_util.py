@@ -1,13 +1,12 @@
 import re
 import os
 import json
-import requests
 import settings
 import logging
 import string
 import secrets
 from exceptions import PrivateChainApiError
-from aws_requests_auth.aws_auth import AWSRequestsAuth
+from private_chain_client import PrivateChainClient
 from botocore.exceptions import ClientError
 from record_not_found_error import RecordNotFoundError
 from not_verified_user_error import NotVerifiedUserError
@@ -225,17 +224,7 @@ class UserUtil:
 
     @staticmethod
     def __create_new_account_on_private_chain():
-        auth = AWSRequestsAuth(
-            aws_access_key=os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'],
-            aws_secret_access_key=os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'],
-            aws_host=os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'],
-            aws_region='ap-northeast-1',
-            aws_service='execute-api'
-        )
-        response = requests.post(
-            'https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] + '/production/accounts/new',
-            auth=auth
-        )
+        response = PrivateChainClient.post('accounts/new')
         if response.status_code is not 200:
             raise PrivateChainApiError(response.text)
         return json.loads(response.text)['result']
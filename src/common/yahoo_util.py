@@ -2,16 +2,21 @@ import json
 import settings
 import requests
 import time
-import jwt
 import hashlib
 import base64
 from nonce_util import NonceUtil
 from exceptions import YahooOauthError
 from exceptions import YahooVerifyException
 from botocore.exceptions import ClientError
-from jwt.contrib.algorithms.pycrypto import RSAAlgorithm
+from lazy_import import LazyModule
 
-jwt.register_algorithm('RS256', RSAAlgorithm(RSAAlgorithm.SHA256))
+
+def register_rs256_algorithm(module):
+    from jwt.contrib.algorithms.pycrypto import RSAAlgorithm
+    module.register_algorithm('RS256', RSAAlgorithm(RSAAlgorithm.SHA256))
+
+
+jwt = LazyModule('jwt', on_load=register_rs256_algorithm)
 
 
 class YahooUtil:
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import logging
+import settings
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from db_util import DBUtil
+from lambda_base import LambdaBase
+
+
+class ArticleInfosBackfill(LambdaBase):
+    """
+    ArticleInfo の user_id_status を user_id と status から設定する
+    user_id_status が存在しないデータは user_id_status-sort_key-index に含まれず、
+    UsersArticlesPublic 等の一覧で取得できないため、GSI の追加後に実行して補完する
+    テーブルはセグメント毎に並列に scan し、更新も並列に行う
+    """
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        table_name = os.environ['ARTICLE_INFO_TABLE_NAME']
+        scan_params = {
+            'ProjectionExpression': 'article_id, user_id, #status, user_id_status',
+            'ExpressionAttributeNames': {'#status': 'status'}
+        }
+        article_infos = [
+            article_info for article_info in DBUtil.iterate_scan_items_in_parallel(self.dynamodb, table_name, scan_params)
+            if article_info.get('user_id_status') !=
+            DBUtil.get_user_id_status(article_info['user_id'], article_info['status'])
+        ]
+
+        client = self.dynamodb.meta.client
+
+        def update(article_info):
+            try:
+                # 実行中にステータスが変更された場合は、変更した処理で設定されるため更新しない
+                client.update_item(
+                    TableName=table_name,
+                    Key={'article_id': article_info['article_id']},
+                    UpdateExpression='set user_id_status = :user_id_status',
+                    ConditionExpression='#status = :status',
+                    ExpressionAttributeNames={'#status': 'status'},
+                    ExpressionAttributeValues={
+                        ':user_id_status': DBUtil.get_user_id_status(article_info['user_id'], article_info['status']),
+                        ':status': article_info['status']
+                    }
+                )
+                return True
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                    return False
+                raise
+
+        with ThreadPoolExecutor(max_workers=settings.DYNAMO_PARALLEL_QUERY_MAX_WORKERS) as executor:
+            updated = sum(executor.map(update, article_infos))
+
+        results = {'targets': len(article_infos), 'updated': updated}
+        logging.info(results)
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps(results)
+        }
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import boto3
+from article_infos_backfill import ArticleInfosBackfill
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    article_infos_backfill = ArticleInfosBackfill(event=event, context=context, dynamodb=dynamodb)
+    return article_infos_backfill.main()
@@ -4,6 +4,7 @@ import json
 import settings
 from db_util import DBUtil
 from lambda_base import LambdaBase
+from pagination_util import PaginationUtil
 from boto3.dynamodb.conditions import Key
 from jsonschema import validate
 from decimal_encoder import DecimalEncoder
@@ -46,7 +47,6 @@ class ArticlesCommentsIndex(LambdaBase):
             limit = int(self.params.get('limit'))
 
         query_params = {
-            'Limit': limit,
             'IndexName': 'article_id-sort_key-index',
             'KeyConditionExpression': Key('article_id').eq(self.params.get('article_id')),
             'FilterExpression': 'attribute_not_exists(parent_id)',
@@ -62,42 +62,27 @@ class ArticlesCommentsIndex(LambdaBase):
 
             query_params.update({'ExclusiveStartKey': last_evaluated_key})
 
-        response = comment_table.query(**query_params)
-
-        items = response['Items']
-
-        while 'LastEvaluatedKey' in response and len(response['Items']) < limit:
-            query_params.update({'ExclusiveStartKey': response['LastEvaluatedKey']})
-            response = comment_table.query(**query_params)
-            items.extend(response['Items'])
-
-            if len(items) >= limit:
-                last_evaluated_key = {
-                    'comment_id': items[limit - 1]['comment_id'],
-                    'article_id': items[limit - 1]['article_id'],
-                    'sort_key': int(items[limit - 1]['sort_key'])
-                }
-                response.update({'LastEvaluatedKey': last_evaluated_key})
-                break
-
-        response['Items'] = items[:limit]
+        response = PaginationUtil.query_filtered_page(
+            comment_table, query_params, limit, ['comment_id', 'article_id', 'sort_key'])
 
         return response
 
     def __get_comments_with_replies(self, comments):
-        comment_table = self.dynamodb.Table(os.environ['COMMENT_TABLE_NAME'])
-
-        items = []
-
-        for comment in comments:
-            query_params = {
+        # 親コメントごとのリプライ取得は互いに独立しているため並列に問い合わせる
+        query_params_list = [
+            {
                 'IndexName': 'parent_id-sort_key-index',
                 'KeyConditionExpression': Key('parent_id').eq(comment['comment_id']),
                 'ScanIndexForward': False
             }
+            for comment in comments
+        ]
 
-            replies = comment_table.query(**query_params)['Items']
+        replies_list = DBUtil.query_in_parallel(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], query_params_list)
+
+        items = []
 
+        for comment, replies in zip(comments, replies_list):
             if replies:
                 comment['replies'] = replies
 
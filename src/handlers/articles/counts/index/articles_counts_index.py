@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import settings
+from boto3.dynamodb.conditions import Key
+from db_util import DBUtil
+from decimal_encoder import DecimalEncoder
+from lambda_base import LambdaBase
+from like_counter_util import LikeCounterUtil
+from parameter_util import ParameterUtil
+from jsonschema import validate
+
+
+class ArticlesCountsIndex(LambdaBase):
+    """
+    記事一覧の各記事の「いいね」数、コメント数、ALISトークン数をまとめて取得する
+    記事毎に /articles/{article_id}/likes、/articles/{article_id}/alistoken を呼び出さずに済むよう、
+    最大100件の記事を BatchGetItem でまとめて取得する
+    """
+    def get_schema(self):
+        return {
+            'type': 'object',
+            'properties': {
+                'article_ids': settings.parameters['article_ids']
+            },
+            'required': ['article_ids']
+        }
+
+    def validate_params(self):
+        # article_ids はカンマ区切りで指定する
+        if self.params.get('article_ids') is not None:
+            self.params['article_ids'] = self.params['article_ids'].split(',')
+        validate(self.params, self.get_schema())
+        ParameterUtil.validate_array_unique(self.params['article_ids'], 'article_ids')
+
+    def exec_main_proc(self):
+        # 公開中の記事のみを対象とする(存在しない記事、非公開の記事は結果に含めない)
+        articles = DBUtil.batch_get_articles(self.dynamodb, self.params['article_ids'], filter_status='public')
+        article_ids = [article['article_id'] for article in articles]
+
+        likes_counts = LikeCounterUtil.get_counts(self.dynamodb, settings.ARTICLE_LIKE_COUNTER_TYPE, article_ids)
+        comments_counts = self.__get_comments_counts(article_ids)
+        alis_tokens = self.__get_alis_tokens(article_ids)
+
+        items = [
+            {
+                'article_id': article_id,
+                'likes_count': likes_counts[article_id],
+                'comments_count': comments_count,
+                'alis_token': alis_tokens.get(article_id, 0)
+            }
+            for article_id, comments_count in zip(article_ids, comments_counts)
+        ]
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'Items': items}, cls=DecimalEncoder)
+        }
+
+    def __get_comments_counts(self, article_ids):
+        query_params_list = [
+            {
+                'IndexName': 'article_id-sort_key-index',
+                'KeyConditionExpression': Key('article_id').eq(article_id)
+            }
+            for article_id in article_ids
+        ]
+
+        return DBUtil.count_in_parallel(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], query_params_list)
+
+    def __get_alis_tokens(self, article_ids):
+        article_evaluated_manage_table = self.dynamodb.Table(os.environ['ARTICLE_EVALUATED_MANAGE_TABLE_NAME'])
+        article_evaluated_manage = article_evaluated_manage_table.get_item(Key={'type': 'alistoken'}).get('Item')
+
+        if article_evaluated_manage is None or not article_ids:
+            return {}
+
+        article_alis_tokens = DBUtil.batch_get_items(
+            self.dynamodb,
+            os.environ['ARTICLE_ALIS_TOKEN_TABLE_NAME'],
+            [
+                {'evaluated_at': article_evaluated_manage['active_evaluated_at'], 'article_id': article_id}
+                for article_id in article_ids
+            ]
+        )
+
+        return {item['article_id']: item['alis_token'] for item in article_alis_tokens}
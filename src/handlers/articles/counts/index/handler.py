@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import boto3
+from articles_counts_index import ArticlesCountsIndex
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    articles_counts_index = ArticlesCountsIndex(event=event, context=context, dynamodb=dynamodb)
+    return articles_counts_index.main()
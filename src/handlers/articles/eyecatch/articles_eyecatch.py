@@ -1,6 +1,6 @@
 import json
-import os
 
+from db_util import DBUtil
 from decimal_encoder import DecimalEncoder
 from lambda_base import LambdaBase
 
@@ -13,10 +13,9 @@ class ArticlesEyecatch(LambdaBase):
         pass
 
     def exec_main_proc(self):
-        screened_article_table = self.dynamodb.Table(os.environ['SCREENED_ARTICLE_TABLE_NAME'])
-        eyecatch_articles = screened_article_table.get_item(Key={'article_type': 'eyecatch'}).get('Item')
+        eyecatch_article_ids = DBUtil.get_screened_article_ids(self.dynamodb, 'eyecatch')
 
-        if not eyecatch_articles or not eyecatch_articles.get('articles'):
+        if not eyecatch_article_ids:
             items = [None, None, None]
 
             return {
@@ -24,18 +23,13 @@ class ArticlesEyecatch(LambdaBase):
                 'body': json.dumps({'Items': items})
             }
 
-        items = [self.__get_public_article(article_id) for article_id in eyecatch_articles['articles']]
+        public_articles = {
+            article['article_id']: article
+            for article in DBUtil.batch_get_articles(self.dynamodb, eyecatch_article_ids, filter_status='public')
+        }
+        items = [public_articles.get(article_id) for article_id in eyecatch_article_ids]
 
         return {
             'statusCode': 200,
             'body': json.dumps({'Items': items}, cls=DecimalEncoder)
         }
-
-    def __get_public_article(self, article_id):
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': article_id}).get('Item')
-
-        if not article_info or not article_info['status'] == 'public':
-            return None
-
-        return article_info
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 import json
-import os
 import settings
 from db_util import DBUtil
 from lambda_base import LambdaBase
 from jsonschema import validate, ValidationError
-from boto3.dynamodb.conditions import Key
 from decimal_encoder import DecimalEncoder
+from like_counter_util import LikeCounterUtil
 
 
 class ArticlesLikesShow(LambdaBase):
@@ -33,14 +32,13 @@ class ArticlesLikesShow(LambdaBase):
         )
 
     def exec_main_proc(self):
-        query_params = {
-            'KeyConditionExpression': Key('article_id').eq(self.event['pathParameters']['article_id']),
-            'Select': 'COUNT'
-        }
-        article_liked_user_table = self.dynamodb.Table(os.environ['ARTICLE_LIKED_USER_TABLE_NAME'])
-        response = article_liked_user_table.query(**query_params)
+        count = LikeCounterUtil.get_count(
+            self.dynamodb,
+            settings.ARTICLE_LIKE_COUNTER_TYPE,
+            self.event['pathParameters']['article_id']
+        )
 
         return {
             'statusCode': 200,
-            'body': json.dumps({'count': response['Count']}, cls=DecimalEncoder)
+            'body': json.dumps({'count': count}, cls=DecimalEncoder)
         }
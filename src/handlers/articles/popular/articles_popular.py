@@ -16,6 +16,7 @@ class ArticlesPopular(LambdaBase):
             'properties': {
                 'limit': settings.parameters['limit'],
                 'page': settings.parameters['page'],
+                'cursor': settings.parameters['cursor'],
                 'topic': settings.parameters['topic']
             }
         }
@@ -32,12 +33,18 @@ class ArticlesPopular(LambdaBase):
         limit = int(self.params['limit']) if self.params.get('limit') else settings.articles_popular_default_limit
         page = int(self.params['page']) if self.params.get('page') else 1
 
-        articles = ESUtil.search_popular_articles(self.elasticsearch, self.params, limit, page)
+        cursor = self.params.get('cursor')
+
+        articles = ESUtil.search_popular_articles(self.elasticsearch, self.params, limit, page, cursor=cursor)
 
         response = {
             'Items': articles
         }
 
+        # cursor が指定された場合は次のページを取得するための cursor を返却する
+        if cursor is not None:
+            response['Cursor'] = ESUtil.get_next_cursor(articles, limit, ESUtil.POPULAR_ARTICLES_SORT_FIELDS)
+
         return {
             'statusCode': 200,
             'body': json.dumps(response, cls=DecimalEncoder)
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import os
 import json
 import settings
 from db_util import DBUtil
@@ -26,14 +25,14 @@ class ArticlesPriceShow(LambdaBase):
             self.dynamodb,
             self.params['article_id'],
             status='public',
-            is_purchased=True
+            is_purchased=True,
+            request_cache=self.request_cache
         )
 
     def exec_main_proc(self):
         params = self.event.get('pathParameters')
 
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': params['article_id']}).get('Item')
+        article_info = DBUtil.get_article_info(self.dynamodb, params['article_id'], self.request_cache)
 
         if article_info is None:
             return {
@@ -16,6 +16,7 @@ class ArticlesRecent(LambdaBase):
             'properties': {
                 'limit': settings.parameters['limit'],
                 'page': settings.parameters['page'],
+                'cursor': settings.parameters['cursor'],
                 'topic': settings.parameters['topic']
             }
         }
@@ -33,12 +34,18 @@ class ArticlesRecent(LambdaBase):
             else settings.article_recent_default_limit
         page = int(self.params.get('page')) if self.params.get('page') is not None else 1
 
-        articles = ESUtil.search_recent_articles(self.elasticsearch, self.params, limit, page)
+        cursor = self.params.get('cursor')
+
+        articles = ESUtil.search_recent_articles(self.elasticsearch, self.params, limit, page, cursor=cursor)
 
         response = {
             'Items': articles
         }
 
+        # cursor が指定された場合は次のページを取得するための cursor を返却する
+        if cursor is not None:
+            response['Cursor'] = ESUtil.get_next_cursor(articles, limit, ESUtil.RECENT_ARTICLES_SORT_FIELDS)
+
         return {
             'statusCode': 200,
             'body': json.dumps(response, cls=DecimalEncoder)
@@ -30,16 +30,16 @@ class ArticlesShow(LambdaBase):
         DBUtil.validate_article_existence(
             self.dynamodb,
             params['article_id'],
-            status='public'
+            status='public',
+            request_cache=self.request_cache
         )
 
     def exec_main_proc(self):
         params = self.event.get('pathParameters')
 
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
         article_content_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_TABLE_NAME'])
 
-        article_info = article_info_table.get_item(Key={'article_id': params['article_id']}).get('Item')
+        article_info = DBUtil.get_article_info(self.dynamodb, params['article_id'], self.request_cache)
         article_content = article_content_table.get_item(Key={'article_id': params['article_id']}).get('Item')
 
         if article_info is None or article_content is None:
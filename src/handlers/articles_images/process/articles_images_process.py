@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+from io import BytesIO
+from urllib.parse import unquote_plus
+
+import settings
+from image_util import ImageUtil
+from lambda_base import LambdaBase
+from PIL import Image
+
+
+class ArticlesImagesProcess(LambdaBase):
+    """
+    署名付き URL(MeArticlesImageUploadUrlShow)でアップロードされた記事画像を、S3 の作成イベントを受けて処理する
+    上限サイズ(ARTICLE_IMAGE_MAX_WIDTH/HEIGHT)を超える画像は縮小して上書きし、表示幅毎の派生画像と WebP を作成する
+    デコードは1画像につき1回のみとし、縮小した画像から順に小さい派生画像を作成する
+    """
+
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        processed_keys = []
+        for record in self.event['Records']:
+            bucket = record['s3']['bucket']['name']
+            # イベントのキーは URL エンコードされている
+            key = unquote_plus(record['s3']['object']['key'])
+            if not key.startswith(settings.S3_ARTICLES_IMAGES_PATH):
+                continue
+
+            if self.__process_image(bucket, key):
+                processed_keys.append(key)
+
+        logging.info('records: {0}, processed: {1}'.format(len(self.event['Records']), len(processed_keys)))
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'processed_keys': processed_keys})
+        }
+
+    def __process_image(self, bucket, key):
+        response = self.s3.Object(bucket, key).get()
+        # 本処理で縮小して上書きした画像は処理済みのため対象外とする
+        if response['Metadata'].get(settings.ARTICLE_IMAGE_PROCESSED_METADATA_KEY):
+            return False
+
+        image_data = response['Body'].read()
+        try:
+            image = Image.open(BytesIO(image_data))
+        except Exception:
+            # 再試行しても処理できないため、ログのみ出力して後続のレコードを処理する
+            logging.warning('Not supported image format: ' + key)
+            return False
+
+        # アニメーション GIF 等は縮小すると1フレーム目のみとなるため、アップロードされた画像のまま利用する
+        if getattr(image, 'is_animated', False):
+            return False
+
+        image_format = image.format
+        # 署名付き URL でのアップロード時は Content-Type が指定されない場合があるため、画像の形式から決定する
+        content_type = Image.MIME.get(image_format, response['ContentType'])
+
+        w, h = image.size
+        if w > settings.ARTICLE_IMAGE_MAX_WIDTH or h > settings.ARTICLE_IMAGE_MAX_HEIGHT:
+            ImageUtil.shrink(image, settings.ARTICLE_IMAGE_MAX_WIDTH, settings.ARTICLE_IMAGE_MAX_HEIGHT)
+            self.s3.Bucket(bucket).put_object(
+                Body=ImageUtil.to_upload_body(image, image_format),
+                Key=key,
+                ContentType=content_type,
+                Metadata={settings.ARTICLE_IMAGE_PROCESSED_METADATA_KEY: 'true'}
+            )
+
+        # 派生画像のキーは記事画像のキーのパスを置き換え、幅を付与したものとする
+        # (例: d/api/articles_images_derivatives/{user_id}/{article_id}/{uuid}_640.jpg)
+        key_base, ext = os.path.splitext(
+            settings.S3_ARTICLES_IMAGES_DERIVATIVES_PATH + key[len(settings.S3_ARTICLES_IMAGES_PATH):]
+        )
+        self.__put_derivative(bucket, key_base + '.webp', image, 'webp')
+
+        # 大きい幅から順に、直前に作成した画像を縮小して作成する
+        derivative = image
+        for width in sorted(settings.ARTICLE_IMAGE_DERIVATIVE_WIDTHS, reverse=True):
+            if width >= derivative.size[0]:
+                continue
+
+            derivative = ImageUtil.shrink(derivative.copy(), width, derivative.size[1])
+            self.__put_derivative(bucket, key_base + '_' + str(width) + ext, derivative, image_format, content_type)
+            self.__put_derivative(bucket, key_base + '_' + str(width) + '.webp', derivative, 'webp')
+
+        return True
+
+    def __put_derivative(self, bucket, key, image, image_format, content_type=None):
+        if image_format == 'webp':
+            content_type = 'image/webp'
+            # WebP はパレット、CMYK 等の形式で保存できないため変換する
+            if image.mode not in ['RGB', 'RGBA']:
+                image = image.convert('RGBA' if 'transparency' in image.info or 'A' in image.mode else 'RGB')
+
+        self.s3.Bucket(bucket).put_object(
+            Body=ImageUtil.to_upload_body(image, image_format),
+            Key=key,
+            ContentType=content_type
+        )
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+import boto3
+from articles_images_process import ArticlesImagesProcess
+
+s3 = boto3.resource('s3')
+
+
+def lambda_handler(event, context):
+    articles_images_process = ArticlesImagesProcess(event=event, context=context, s3=s3)
+    response = articles_images_process.main()
+    # 失敗時は例外を送出し、S3 イベントによる非同期呼び出しを再試行させる
+    if response['statusCode'] != 200:
+        raise Exception('Failed to process articles images')
+    return response
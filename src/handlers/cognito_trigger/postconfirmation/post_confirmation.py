@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import json
-import requests
-from aws_requests_auth.aws_auth import AWSRequestsAuth
+from private_chain_client import PrivateChainClient
 from lambda_base import LambdaBase
 
 
@@ -50,11 +49,5 @@ class PostConfirmation(LambdaBase):
 
     @staticmethod
     def __create_new_account():
-        auth = AWSRequestsAuth(aws_access_key=os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'],
-                               aws_secret_access_key=os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'],
-                               aws_host=os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'],
-                               aws_region='ap-northeast-1',
-                               aws_service='execute-api')
-        response = requests.post('https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] +
-                                 '/production/accounts/new', auth=auth)
+        response = PrivateChainClient.post('accounts/new')
         return json.loads(response.text)['result']
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import logging
+from boto3.dynamodb.conditions import Attr
+from db_util import DBUtil
+from lambda_base import LambdaBase
+
+
+class CommentLikedUsersBackfill(LambdaBase):
+    """
+    article_id を保持していない CommentLikedUser のデータに、コメントの article_id を設定する
+    article_id が存在しないデータは article_id-index、article_id-user_id-index に含まれず、
+    MeArticlesCommentsLikesIndex で取得できないため、GSI の追加後に実行して補完する
+    """
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        comment_liked_user_table = self.dynamodb.Table(os.environ['COMMENT_LIKED_USER_TABLE_NAME'])
+        liked_users = DBUtil.scan_all_items(
+            comment_liked_user_table,
+            {'FilterExpression': Attr('article_id').not_exists()}
+        )
+
+        comment_ids = list(dict.fromkeys([liked_user['comment_id'] for liked_user in liked_users]))
+        comments = DBUtil.batch_get_items(
+            self.dynamodb,
+            os.environ['COMMENT_TABLE_NAME'],
+            [{'comment_id': comment_id} for comment_id in comment_ids]
+        )
+        article_ids = {comment['comment_id']: comment['article_id'] for comment in comments}
+
+        updated = 0
+        for liked_user in liked_users:
+            # 削除済みのコメントは対象外とする
+            if liked_user['comment_id'] not in article_ids:
+                continue
+            comment_liked_user_table.update_item(
+                Key={'comment_id': liked_user['comment_id'], 'user_id': liked_user['user_id']},
+                UpdateExpression='set article_id = :article_id',
+                ExpressionAttributeValues={':article_id': article_ids[liked_user['comment_id']]}
+            )
+            updated += 1
+
+        results = {'targets': len(liked_users), 'updated': updated}
+        logging.info(results)
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps(results)
+        }
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import boto3
+from comment_liked_users_backfill import CommentLikedUsersBackfill
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    comment_liked_users_backfill = CommentLikedUsersBackfill(event=event, context=context, dynamodb=dynamodb)
+    return comment_liked_users_backfill.main()
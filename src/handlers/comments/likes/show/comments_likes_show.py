@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
 import json
-import os
 import settings
 
-from boto3.dynamodb.conditions import Key
 from decimal_encoder import DecimalEncoder
 from lambda_base import LambdaBase
+from like_counter_util import LikeCounterUtil
 from jsonschema import validate
 
 
@@ -23,16 +22,13 @@ class CommentsLikesShow(LambdaBase):
         validate(self.params, self.get_schema())
 
     def exec_main_proc(self):
-        comment_liked_user_table = self.dynamodb.Table(os.environ['COMMENT_LIKED_USER_TABLE_NAME'])
-
-        query_params = {
-            'KeyConditionExpression': Key('comment_id').eq(self.event['pathParameters']['comment_id']),
-            'Select': 'COUNT'
-        }
-
-        response = comment_liked_user_table.query(**query_params)
+        count = LikeCounterUtil.get_count(
+            self.dynamodb,
+            settings.COMMENT_LIKE_COUNTER_TYPE,
+            self.event['pathParameters']['comment_id']
+        )
 
         return {
             'statusCode': 200,
-            'body': json.dumps({'count': response['Count']}, cls=DecimalEncoder)
+            'body': json.dumps({'count': count}, cls=DecimalEncoder)
         }
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import boto3
+from like_counters_reconcile import LikeCountersReconcile
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    like_counters_reconcile = LikeCountersReconcile(event=event, context=context, dynamodb=dynamodb)
+    return like_counters_reconcile.main()
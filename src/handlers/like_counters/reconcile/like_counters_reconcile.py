@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import logging
+import settings
+from boto3.dynamodb.conditions import Attr
+from db_util import DBUtil
+from lambda_base import LambdaBase
+from like_counter_util import LikeCounterUtil
+
+
+class LikeCountersReconcile(LambdaBase):
+    """
+    ArticleLikedUser / CommentLikedUser を集計し、LikeCounter テーブルのいいね数を再作成する
+    初回のカウンタ作成(バックフィル)と、加算漏れ等によるカウンタの乖離の補正に利用する
+    集計結果と異なるカウンタのみを、集計前に読み込んだ値から変わっていない場合に限り更新する
+    """
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        targets = [
+            (settings.ARTICLE_LIKE_COUNTER_TYPE, os.environ['ARTICLE_LIKED_USER_TABLE_NAME'], 'article_id'),
+            (settings.COMMENT_LIKE_COUNTER_TYPE, os.environ['COMMENT_LIKED_USER_TABLE_NAME'], 'comment_id')
+        ]
+
+        results = {}
+        for counter_type, table_name, key_name in targets:
+            # 集計中のいいね作成による加算を検知できるよう、集計前にカウンタを読み込む
+            current_counts = self.__get_current_counts(counter_type)
+            counts = self.__count_liked_users(table_name, key_name)
+
+            # いいねが存在しなくなったカウンタは 0 とする
+            updated_counts = {target_id: 0 for target_id in current_counts if target_id not in counts}
+            updated_counts.update({
+                target_id: count for target_id, count in counts.items() if current_counts.get(target_id) != count
+            })
+
+            # 読み込み後に加算されたカウンタは、集計結果に加算が反映されているか判断できないため更新しない
+            skipped = 0
+            for target_id, count in updated_counts.items():
+                if not LikeCounterUtil.update_count(
+                        self.dynamodb, counter_type, target_id, count, current_counts.get(target_id)):
+                    skipped += 1
+
+            results[counter_type] = {
+                'targets': len(counts),
+                'updated': len(updated_counts) - skipped,
+                'skipped': skipped
+            }
+            logging.info('{0}: {1}'.format(counter_type, results[counter_type]))
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps(results)
+        }
+
+    def __count_liked_users(self, table_name, key_name):
+        counts = {}
+        scan_params = {
+            'ProjectionExpression': '#key',
+            'ExpressionAttributeNames': {'#key': key_name}
+        }
+        for item in DBUtil.iterate_scan_items_in_parallel(self.dynamodb, table_name, scan_params):
+            counts[item[key_name]] = counts.get(item[key_name], 0) + 1
+
+        return counts
+
+    def __get_current_counts(self, counter_type):
+        like_counter_table = self.dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        scan_params = {
+            'FilterExpression': Attr('counter_type').eq(counter_type)
+        }
+
+        return {item['target_id']: int(item['count'])
+                for item in DBUtil.iterate_scan_items(like_counter_table, scan_params)}
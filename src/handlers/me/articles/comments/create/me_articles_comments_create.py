@@ -11,6 +11,7 @@ from db_util import DBUtil
 from hashids import Hashids
 from lambda_base import LambdaBase
 from jsonschema import validate, ValidationError
+from notification_util import NotificationUtil
 from time_util import TimeUtil
 from text_sanitizer import TextSanitizer
 from user_util import UserUtil
@@ -33,7 +34,8 @@ class MeArticlesCommentsCreate(LambdaBase):
             raise ValidationError('Request parameter is required')
 
         validate(self.params, self.get_schema())
-        DBUtil.validate_article_existence(self.dynamodb, self.params['article_id'], status='public')
+        DBUtil.validate_article_existence(self.dynamodb, self.params['article_id'], status='public',
+                                          request_cache=self.request_cache)
 
     def exec_main_proc(self):
         sort_key = TimeUtil.generate_sort_key()
@@ -59,12 +61,11 @@ class MeArticlesCommentsCreate(LambdaBase):
 
         # 優先度が低いため通知処理は失敗しても握り潰して200を返す（ログは出して検知できるようにする）
         try:
-            article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-            article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']})['Item']
+            article_info = DBUtil.get_article_info(self.dynamodb, self.params['article_id'], self.request_cache)
 
             if self.__is_notifiable_comment(article_info, user_id):
                 self.__create_comment_notification(article_info, comment_id, user_id)
-                self.__update_unread_notification_manager(article_info)
+                NotificationUtil.update_unread_notification_manager(self.dynamodb, article_info['user_id'])
 
         except Exception as err:
             logging.fatal(err)
@@ -94,15 +95,6 @@ class MeArticlesCommentsCreate(LambdaBase):
             'created_at': int(time.time())
         })
 
-    def __update_unread_notification_manager(self, article_info):
-        unread_notification_manager_table = self.dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
-
-        unread_notification_manager_table.update_item(
-            Key={'user_id': article_info['user_id']},
-            UpdateExpression='set unread = :unread',
-            ExpressionAttributeValues={':unread': True}
-        )
-
     def __generate_comment_id(self, target):
         hashids = Hashids(salt=os.environ['SALT_FOR_ARTICLE_ID'], min_length=settings.COMMENT_ID_LENGTH)
         return hashids.encode(target)
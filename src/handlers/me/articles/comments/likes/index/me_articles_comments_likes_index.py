@@ -28,14 +28,15 @@ class MeArticlesCommentsLikesIndex(LambdaBase):
 
         comment_liked_user_table = self.dynamodb.Table(os.environ['COMMENT_LIKED_USER_TABLE_NAME'])
 
+        # 記事に対する全ユーザーのいいねを読み込まないよう、article_id と user_id をキーとした GSI で自身のいいねのみを取得する
         query_params = {
-            'IndexName': 'article_id-index',
-            'KeyConditionExpression': Key('article_id').eq(self.params['article_id']),
+            'IndexName': 'article_id-user_id-index',
+            'KeyConditionExpression': Key('article_id').eq(self.params['article_id']) & Key('user_id').eq(user_id)
         }
 
-        result = DBUtil.query_all_items(comment_liked_user_table, query_params)
+        result = DBUtil.iterate_query_items(comment_liked_user_table, query_params)
 
-        comment_ids = [liked_user['comment_id'] for liked_user in result if liked_user['user_id'] == user_id]
+        comment_ids = [liked_user['comment_id'] for liked_user in result]
 
         return {
             'statusCode': 200,
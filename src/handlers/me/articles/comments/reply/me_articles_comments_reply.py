@@ -4,8 +4,6 @@ import logging
 import os
 import traceback
 
-from boto3.dynamodb.conditions import Key
-
 import settings
 import time
 
@@ -42,7 +40,11 @@ class MeArticlesCommentsReply(LambdaBase):
         DBUtil.validate_article_existence(self.dynamodb, self.params['article_id'], status='public')
         DBUtil.validate_parent_comment_existence(self.dynamodb, self.params['parent_id'])
         DBUtil.validate_user_existence(self.dynamodb, self.params['replyed_user_id'])
-        DBUtil.validate_user_existence_in_thread(self.dynamodb, self.params['replyed_user_id'], self.params['parent_id'])
+        # スレッドの読み込みは存在確認と通知対象の算出で共用する
+        self.thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, self.params['parent_id'])
+        DBUtil.validate_user_existence_in_thread(
+            self.dynamodb, self.params['replyed_user_id'], self.params['parent_id'], thread_user_ids=self.thread_user_ids
+        )
 
     def exec_main_proc(self):
         sort_key = TimeUtil.generate_sort_key()
@@ -73,7 +75,7 @@ class MeArticlesCommentsReply(LambdaBase):
             article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
             article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']})['Item']
 
-            self.__create_comment_notifications(article_info, comment)
+            self.__create_comment_notifications(article_info, comment, self.thread_user_ids)
 
         except Exception as err:
             logging.fatal(err)
@@ -84,50 +86,34 @@ class MeArticlesCommentsReply(LambdaBase):
                 'body': json.dumps({'comment_id': comment_id})
             }
 
-    def __create_comment_notifications(self, article_info, comment):
-        notification_tagets = []
+    def __create_comment_notifications(self, article_info, comment, thread_user_ids):
+        notification_targets = []
 
         # 返信先のユーザーへの通知(自分自身に返信も可能なため、その場合は通知しない)
         if not self.params['replyed_user_id'] == comment['user_id']:
-            NotificationUtil.notify_article_comment(
-                self.dynamodb, article_info, comment, self.params['replyed_user_id'], settings.COMMENT_REPLY_NOTIFICATION_TYPE
-            )
-            notification_tagets.append(self.params['replyed_user_id'])
+            notification_targets.append((self.params['replyed_user_id'], settings.COMMENT_REPLY_NOTIFICATION_TYPE))
 
         # スレッド内のユーザへの通知
         thread_notification_targets = self.__get_thread_notification_targets(
-            comment['user_id'], self.params['replyed_user_id'], self.params['parent_id'])
-        notification_tagets.extend(thread_notification_targets)
-        for target_user_id in thread_notification_targets:
-            NotificationUtil.notify_article_comment(
-                self.dynamodb, article_info, comment, target_user_id, settings.COMMENT_THREAD_NOTIFICATION_TYPE
-            )
+            comment['user_id'], self.params['replyed_user_id'], thread_user_ids)
+        notification_targets.extend(
+            [(target_user_id, settings.COMMENT_THREAD_NOTIFICATION_TYPE) for target_user_id in thread_notification_targets]
+        )
 
         # 記事作成者が上記の通知処理の対象に含まれていない、かつコメントの登録者ではない場合は記事作成者に通知する
-        if not article_info['user_id'] in notification_tagets and not article_info['user_id'] == comment['user_id']:
-            NotificationUtil.notify_article_comment(
-                self.dynamodb, article_info, comment, article_info['user_id'], settings.COMMENT_NOTIFICATION_TYPE
-            )
-            notification_tagets.append(article_info['user_id'])
+        target_user_ids = [target_user_id for target_user_id, _ in notification_targets]
+        if not article_info['user_id'] in target_user_ids and not article_info['user_id'] == comment['user_id']:
+            notification_targets.append((article_info['user_id'], settings.COMMENT_NOTIFICATION_TYPE))
+            target_user_ids.append(article_info['user_id'])
 
-        # 通知ユーザは通知未読扱いに更新する
-        for target_user_id in notification_tagets:
-            NotificationUtil.update_unread_notification_manager(self.dynamodb, target_user_id)
-
-    def __get_thread_notification_targets(self, user_id, replyed_user_id, parent_id):
-        comment_table = self.dynamodb.Table(os.environ['COMMENT_TABLE_NAME'])
-
-        query_params = {
-            'IndexName': 'parent_id-sort_key-index',
-            'KeyConditionExpression': Key('parent_id').eq(parent_id)
-        }
-
-        thread_comments = comment_table.query(**query_params)['Items']
-        thread_user_ids = [comment['user_id'] for comment in thread_comments]
-        parent_comment = comment_table.get_item(Key={'comment_id': parent_id})['Item']
+        # 通知対象のユーザー数に関わらず書き込み回数が増えないよう、通知の作成と未読扱いへの更新はまとめて行う
+        NotificationUtil.notify_article_comments(self.dynamodb, article_info, comment, notification_targets)
+        NotificationUtil.update_unread_notification_managers(self.dynamodb, target_user_ids)
 
+    @staticmethod
+    def __get_thread_notification_targets(user_id, replyed_user_id, thread_user_ids):
         # スレッドコメントのユーザーと親コメントのユーザーが通知対象になる
-        target_user_ids = list(set(thread_user_ids + [parent_comment['user_id']]))
+        target_user_ids = list(set(thread_user_ids))
 
         # 通知対象から返信先のユーザーと返信したユーザーを削除する。存在しない場合は無視して後続処理を続ける
         for user_id in [user_id, replyed_user_id]:
@@ -138,15 +124,6 @@ class MeArticlesCommentsReply(LambdaBase):
 
         return target_user_ids
 
-    def __update_unread_notification_manager(self, article_info):
-        unread_notification_manager_table = self.dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
-
-        unread_notification_manager_table.update_item(
-            Key={'user_id': article_info['user_id']},
-            UpdateExpression='set unread = :unread',
-            ExpressionAttributeValues={':unread': True}
-        )
-
     def __generate_comment_id(self, target):
         hashids = Hashids(salt=os.environ['SALT_FOR_ARTICLE_ID'], min_length=settings.COMMENT_ID_LENGTH)
         return hashids.encode(target)
@@ -49,10 +49,12 @@ class MeArticlesDraftsArticleIdCreate(LambdaBase):
     def __create_article_info(self, sort_key, article_id):
         article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
 
+        user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
         article_info = {
             'article_id': article_id,
-            'user_id': self.event['requestContext']['authorizer']['claims']['cognito:username'],
+            'user_id': user_id,
             'status': 'draft',
+            'user_id_status': DBUtil.get_user_id_status(user_id, 'draft'),
             'sort_key': sort_key,
             'created_at': int(time.time()),
             'version': 2
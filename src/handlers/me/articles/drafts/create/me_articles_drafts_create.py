@@ -66,10 +66,12 @@ class MeArticlesDraftsCreate(LambdaBase):
     def __create_article_info(self, params, sort_key, article_id):
         article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
 
+        user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
         article_info = {
             'article_id': article_id,
-            'user_id': self.event['requestContext']['authorizer']['claims']['cognito:username'],
+            'user_id': user_id,
             'status': 'draft',
+            'user_id_status': DBUtil.get_user_id_status(user_id, 'draft'),
             'title': TextSanitizer.sanitize_text(params.get('title')),
             'overview': TextSanitizer.sanitize_text(params.get('overview')),
             'eye_catch_url': params.get('eye_catch_url'),
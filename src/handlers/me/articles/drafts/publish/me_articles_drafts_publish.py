@@ -50,24 +50,29 @@ class MeArticlesDraftsPublish(LambdaBase):
         self.__create_article_history_and_update_sort_key()
 
         article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info_before = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+
+        # タグの存在チェックをまとめて行い、タグ名の照合とタグの作成で共有する
+        tags = TagUtil.get_items_case_insensitive(self.elasticsearch, self.params.get('tags'))
 
         article_info_table.update_item(
             Key={
                 'article_id': self.params['article_id'],
             },
-            UpdateExpression='set #attr = :article_status, sync_elasticsearch = :one, topic = :topic, tags = :tags',
+            UpdateExpression='set #attr = :article_status, user_id_status = :user_id_status, sync_elasticsearch = :one, '
+                             'topic = :topic, tags = :tags',
             ExpressionAttributeNames={'#attr': 'status'},
             ExpressionAttributeValues={
                 ':article_status': 'public',
+                ':user_id_status': DBUtil.get_user_id_status(
+                    self.event['requestContext']['authorizer']['claims']['cognito:username'], 'public'),
                 ':one': 1,
                 ':topic': self.params['topic'],
-                ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'))
+                ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'), tags=tags)
             }
         )
 
         try:
-            TagUtil.create_and_count(self.elasticsearch, article_info_before.get('tags'), self.params.get('tags'))
+            TagUtil.create_tags(self.elasticsearch, self.params.get('tags'), tags=tags)
         except Exception as e:
             logging.fatal(e)
             traceback.print_exc()
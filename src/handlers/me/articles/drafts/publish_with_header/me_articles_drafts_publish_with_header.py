@@ -69,21 +69,23 @@ class MeArticlesDraftsPublishWithHeader(LambdaBase):
         self.__create_article_history_and_update_sort_key()
 
         article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info_before = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+
+        # タグの存在チェックをまとめて行い、タグ名の照合とタグの作成で共有する
+        tags = TagUtil.get_items_case_insensitive(self.elasticsearch, self.params.get('tags'))
         article_content_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_TABLE_NAME'])
 
         # 有料記事の場合
         if is_priced:
             self.__update_paid_body(article_content_table)
-            self.__update_paid_article_info(article_info_table)
+            self.__update_paid_article_info(article_info_table, tags)
         # 無料記事の場合
         else:
             # 有料記事から無料記事にする場合のみを考慮している
             self.__remove_price_and_paid_body(article_info_table, article_content_table)
-            self.__update_article_info(article_info_table)
+            self.__update_article_info(article_info_table, tags)
 
         try:
-            TagUtil.create_and_count(self.elasticsearch, article_info_before.get('tags'), self.params.get('tags'))
+            TagUtil.create_tags(self.elasticsearch, self.params.get('tags'), tags=tags)
         except Exception as e:
             logging.fatal(e)
             traceback.print_exc()
@@ -92,17 +94,19 @@ class MeArticlesDraftsPublishWithHeader(LambdaBase):
             'statusCode': 200
         }
 
-    def __update_article_info(self, article_info_table):
+    def __update_article_info(self, article_info_table, tags):
         info_expression_attribute_values = {
             ':article_status': 'public',
+            ':user_id_status': DBUtil.get_user_id_status(
+                self.event['requestContext']['authorizer']['claims']['cognito:username'], 'public'),
             ':one': 1,
             ':topic': self.params['topic'],
-            ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags')),
+            ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'), tags=tags),
             ':eye_catch_url': self.params.get('eye_catch_url')
         }
 
-        info_update_expression = 'set #attr = :article_status, sync_elasticsearch = :one, topic = :topic, tags = ' \
-                                 ':tags, eye_catch_url=:eye_catch_url'
+        info_update_expression = 'set #attr = :article_status, user_id_status = :user_id_status, ' \
+                                 'sync_elasticsearch = :one, topic = :topic, tags = :tags, eye_catch_url=:eye_catch_url'
 
         article_info_table.update_item(
             Key={
@@ -113,18 +117,21 @@ class MeArticlesDraftsPublishWithHeader(LambdaBase):
             ExpressionAttributeValues=info_expression_attribute_values
         )
 
-    def __update_paid_article_info(self, article_info_table):
+    def __update_paid_article_info(self, article_info_table, tags):
         info_expression_attribute_values = {
             ':article_status': 'public',
+            ':user_id_status': DBUtil.get_user_id_status(
+                self.event['requestContext']['authorizer']['claims']['cognito:username'], 'public'),
             ':one': 1,
             ':topic': self.params['topic'],
-            ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags')),
+            ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'), tags=tags),
             ':eye_catch_url': self.params.get('eye_catch_url'),
             ':price': self.params.get('price')
         }
 
-        info_update_expression = 'set #attr = :article_status, sync_elasticsearch = :one, topic = :topic, tags = ' \
-                                 ':tags, eye_catch_url=:eye_catch_url, price = :price'
+        info_update_expression = 'set #attr = :article_status, user_id_status = :user_id_status, ' \
+                                 'sync_elasticsearch = :one, topic = :topic, tags = :tags, eye_catch_url=:eye_catch_url, ' \
+                                 'price = :price'
 
         article_info_table.update_item(
             Key={
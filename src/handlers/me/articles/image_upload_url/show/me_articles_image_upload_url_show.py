@@ -52,8 +52,8 @@ class MeArticlesImageUploadUrlShow(LambdaBase):
             HttpMethod='PUT'
         )
 
-        show_url = 'https://' + os.environ['DOMAIN'] +\
-            '/d/api/articles_images/' + user_id + '/' + self.params['article_id'] + '/' + file_name
+        # アップロード後の縮小、派生画像の作成は S3 の作成イベントを受けて ArticlesImagesProcess で行う
+        show_url = 'https://' + os.environ['DOMAIN'] + '/' + key
 
         return {
             'statusCode': 200,
@@ -2,13 +2,11 @@
 import os
 import settings
 import uuid
-import base64
 import json
 from db_util import DBUtil
+from image_util import ImageUtil
 from lambda_base import LambdaBase
-from jsonschema import validate, ValidationError
-from PIL import Image
-from io import BytesIO
+from jsonschema import validate
 from user_util import UserUtil
 
 
@@ -53,18 +51,13 @@ class MeArticlesImagesCreate(LambdaBase):
             }]
         }
 
-    def validate_image_data(self, image_data):
-        try:
-            Image.open(BytesIO(base64.b64decode(image_data)))
-        except Exception:
-            raise ValidationError('Bad Request: No supported image format')
-
     def validate_params(self):
         UserUtil.verified_phone_and_email(self.event)
         # single
         # params
         validate(self.params, self.get_schema())
-        self.validate_image_data(self.params['article_image'])
+        # デコードした画像は縮小時にそのまま利用する
+        self.image_data, self.image = ImageUtil.decode_base64_image(self.params['article_image'])
         # headers
         validate(self.event.get('headers'), self.get_headers_schema())
 
@@ -82,7 +75,13 @@ class MeArticlesImagesCreate(LambdaBase):
         user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
         key = settings.S3_ARTICLES_IMAGES_PATH + \
             user_id + '/' + self.params['article_id'] + '/' + str(uuid.uuid4()) + '.' + ext
-        image_data = self.__get_save_image_data(base64.b64decode(self.params['article_image']), ext)
+        image_data = ImageUtil.get_fitted_image_data(
+            self.image_data,
+            self.image,
+            settings.ARTICLE_IMAGE_MAX_WIDTH,
+            settings.ARTICLE_IMAGE_MAX_HEIGHT,
+            ext
+        )
 
         self.s3.Bucket(os.environ['DIST_S3_BUCKET_NAME']).put_object(
             Body=image_data,
@@ -94,14 +93,3 @@ class MeArticlesImagesCreate(LambdaBase):
             'statusCode': 200,
             'body': json.dumps({'image_url': 'https://' + os.environ['DOMAIN'] + '/' + key})
         }
-
-    def __get_save_image_data(self, image_data, ext):
-        image = Image.open(BytesIO(image_data))
-        w, h = image.size
-        if w <= settings.ARTICLE_IMAGE_MAX_WIDTH and h <= settings.ARTICLE_IMAGE_MAX_HEIGHT:
-            return image_data
-
-        image.thumbnail((settings.ARTICLE_IMAGE_MAX_WIDTH, settings.ARTICLE_IMAGE_MAX_HEIGHT), Image.ANTIALIAS)
-        buf = BytesIO()
-        image.save(buf, format=ext)
-        return buf.getvalue()
@@ -5,10 +5,11 @@ import time
 import json
 import logging
 import traceback
-from boto3.dynamodb.conditions import Key
 from db_util import DBUtil
 from botocore.exceptions import ClientError
 from lambda_base import LambdaBase
+from like_counter_util import LikeCounterUtil
+from notification_util import NotificationUtil
 from jsonschema import validate, ValidationError
 from time_util import TimeUtil
 from user_util import UserUtil
@@ -34,7 +35,8 @@ class MeArticlesLikeCreate(LambdaBase):
         DBUtil.validate_article_existence(
             self.dynamodb,
             self.event['pathParameters']['article_id'],
-            status='public'
+            status='public',
+            request_cache=self.request_cache
         )
 
     def exec_main_proc(self):
@@ -51,10 +53,16 @@ class MeArticlesLikeCreate(LambdaBase):
                 raise
 
         try:
-            article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-            article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
-            self.__create_like_notification(article_info)
-            self.__update_unread_notification_manager(article_info)
+            # いいね数のカウンタを加算し、加算後のいいね数を通知に利用する
+            liked_count = LikeCounterUtil.increment(
+                self.dynamodb,
+                settings.ARTICLE_LIKE_COUNTER_TYPE,
+                self.event['pathParameters']['article_id']
+            )
+            article_info = DBUtil.get_article_info(self.dynamodb, self.params['article_id'], self.request_cache)
+            self.__create_like_notification(article_info, liked_count)
+            # いいねは通知の頻度が高いため、直近に未読扱いにしたユーザーへの問い合わせも省略する
+            NotificationUtil.update_unread_notification_manager(self.dynamodb, article_info['user_id'], use_cache=True)
         except Exception as e:
             logging.fatal(e)
             traceback.print_exc()
@@ -63,13 +71,11 @@ class MeArticlesLikeCreate(LambdaBase):
             'statusCode': 200
         }
 
-    def __create_like_notification(self, article_info):
+    def __create_like_notification(self, article_info, liked_count):
         notification_table = self.dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
         notification_id = '-'.join([settings.LIKE_NOTIFICATION_TYPE, article_info['user_id'], article_info['article_id']])
         notification = notification_table.get_item(Key={'notification_id': notification_id}).get('Item')
 
-        liked_count = self.__get_article_likes_count()
-
         if notification:
             notification_table.update_item(
                 Key={
@@ -95,15 +101,6 @@ class MeArticlesLikeCreate(LambdaBase):
                 }
             )
 
-    def __update_unread_notification_manager(self, article_info):
-        unread_notification_manager_table = self.dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
-
-        unread_notification_manager_table.update_item(
-            Key={'user_id': article_info['user_id']},
-            UpdateExpression='set unread = :unread',
-            ExpressionAttributeValues={':unread': True}
-        )
-
     def __create_article_liked_user(self, article_liked_user_table):
         epoch = int(time.time())
         article_liked_user = {
@@ -120,15 +117,4 @@ class MeArticlesLikeCreate(LambdaBase):
         )
 
     def __get_article_user_id(self, article_id):
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        return article_info_table.get_item(Key={'article_id': article_id}).get('Item').get('user_id')
-
-    def __get_article_likes_count(self):
-        query_params = {
-            'KeyConditionExpression': Key('article_id').eq(self.event['pathParameters']['article_id']),
-            'Select': 'COUNT'
-        }
-        article_liked_user_table = self.dynamodb.Table(os.environ['ARTICLE_LIKED_USER_TABLE_NAME'])
-        response = article_liked_user_table.query(**query_params)
-
-        return response['Count']
+        return DBUtil.get_article_info(self.dynamodb, article_id, self.request_cache).get('user_id')
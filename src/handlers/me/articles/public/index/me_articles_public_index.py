@@ -2,8 +2,10 @@
 import os
 import json
 import settings
-from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.conditions import Key
+from db_util import DBUtil
 from lambda_base import LambdaBase
+from pagination_util import PaginationUtil
 from jsonschema import validate
 from decimal_encoder import DecimalEncoder
 from parameter_util import ParameterUtil
@@ -32,42 +34,25 @@ class MeArticlesPublicIndex(LambdaBase):
         if self.params.get('limit'):
             limit = int(self.params.get('limit'))
 
+        # ステータス毎のインデックスからキー条件のみで取得する(他のステータスの記事を読み込まない)
+        user_id_status = DBUtil.get_user_id_status(user_id, 'public')
         query_params = {
-            'Limit': limit,
-            'IndexName': 'user_id-sort_key-index',
-            'KeyConditionExpression': Key('user_id').eq(user_id),
-            'FilterExpression': Attr('status').eq('public'),
+            'IndexName': 'user_id_status-sort_key-index',
+            'KeyConditionExpression': Key('user_id_status').eq(user_id_status),
             'ScanIndexForward': False
         }
 
         if self.params.get('article_id') is not None and self.params.get('sort_key') is not None:
             LastEvaluatedKey = {
-                'user_id': user_id,
+                'user_id_status': user_id_status,
                 'article_id': self.params['article_id'],
                 'sort_key': int(self.params['sort_key'])
             }
 
             query_params.update({'ExclusiveStartKey': LastEvaluatedKey})
 
-        response = article_info_table.query(**query_params)
-
-        items = response['Items']
-
-        while 'LastEvaluatedKey' in response and len(response['Items']) < limit:
-            query_params.update({'ExclusiveStartKey': response['LastEvaluatedKey']})
-            response = article_info_table.query(**query_params)
-            items.extend(response['Items'])
-
-            if len(items) >= limit:
-                LastEvaluatedKey = {
-                    'user_id': user_id,
-                    'article_id': items[limit - 1]['article_id'],
-                    'sort_key': int(items[limit - 1]['sort_key'])
-                }
-                response.update({'LastEvaluatedKey': LastEvaluatedKey})
-                break
-
-        response['Items'] = items[:limit]
+        response = PaginationUtil.query_filtered_page(
+            article_info_table, query_params, limit, ['user_id', 'article_id', 'sort_key'])
 
         return {
             'statusCode': 200,
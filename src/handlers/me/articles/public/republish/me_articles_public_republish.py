@@ -50,19 +50,19 @@ class MeArticlesPublicRepublish(LambdaBase):
         article_content_edit_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_EDIT_TABLE_NAME'])
         article_content_edit = article_content_edit_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
 
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info_before = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+        # タグの存在チェックをまとめて行い、タグ名の照合とタグの作成で共有する
+        tags = TagUtil.get_items_case_insensitive(self.elasticsearch, self.params.get('tags'))
 
         self.__validate_article_content_edit(article_content_edit)
 
         self.__create_article_history(article_content_edit)
-        self.__update_article_info(article_content_edit)
+        self.__update_article_info(article_content_edit, tags)
         self.__update_article_content(article_content_edit)
 
         article_content_edit_table.delete_item(Key={'article_id': self.params['article_id']})
 
         try:
-            TagUtil.create_and_count(self.elasticsearch, article_info_before.get('tags'), self.params.get('tags'))
+            TagUtil.create_tags(self.elasticsearch, self.params.get('tags'), tags=tags)
         except Exception as e:
             logging.fatal(e)
             traceback.print_exc()
@@ -71,7 +71,7 @@ class MeArticlesPublicRepublish(LambdaBase):
             'statusCode': 200
         }
 
-    def __update_article_info(self, article_content_edit):
+    def __update_article_info(self, article_content_edit, tags):
         article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
 
         article_info_table.update_item(
@@ -79,14 +79,17 @@ class MeArticlesPublicRepublish(LambdaBase):
                 'article_id': self.params['article_id'],
             },
             UpdateExpression=("set title = :title, overview=:overview, eye_catch_url=:eye_catch_url, "
-                              "sync_elasticsearch=:sync_elasticsearch, topic=:topic, tags=:tags"),
+                              "sync_elasticsearch=:sync_elasticsearch, topic=:topic, tags=:tags, "
+                              "user_id_status=:user_id_status"),
             ExpressionAttributeValues={
                 ':title': article_content_edit['title'],
                 ':overview': article_content_edit['overview'],
                 ':eye_catch_url': article_content_edit['eye_catch_url'],
                 ':sync_elasticsearch': 1,
                 ':topic': self.params['topic'],
-                ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'))
+                ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'), tags=tags),
+                ':user_id_status': DBUtil.get_user_id_status(
+                    self.event['requestContext']['authorizer']['claims']['cognito:username'], 'public')
             }
         )
 
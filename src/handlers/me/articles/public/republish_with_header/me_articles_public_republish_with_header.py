@@ -64,7 +64,9 @@ class MeArticlesPublicRepublishWithHeader(LambdaBase):
 
         # 共通処理
         article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info_before = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+
+        # タグの存在チェックをまとめて行い、タグ名の照合とタグの作成で共有する
+        tags = TagUtil.get_items_case_insensitive(self.elasticsearch, self.params.get('tags'))
         article_content_edit_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_EDIT_TABLE_NAME'])
         article_content_edit = article_content_edit_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
         article_content_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_TABLE_NAME'])
@@ -75,19 +77,19 @@ class MeArticlesPublicRepublishWithHeader(LambdaBase):
         if is_priced:
             self.__create_paid_article_history(article_content_edit)
             self.__update_paid_article_content(article_content_edit)
-            self.__update_paid_article_info(article_content_edit, article_info_table)
+            self.__update_paid_article_info(article_content_edit, article_info_table, tags)
         # 無料記事の場合
         else:
             # 有料記事から無料記事にする場合を考慮している
             self.__remove_price_and_paid_body(article_info_table, article_content_table)
             self.__create_article_history(article_content_edit)
             self.__update_article_content(article_content_edit)
-            self.__update_article_info(article_content_edit, article_info_table)
+            self.__update_article_info(article_content_edit, article_info_table, tags)
 
         article_content_edit_table.delete_item(Key={'article_id': self.params['article_id']})
 
         try:
-            TagUtil.create_and_count(self.elasticsearch, article_info_before.get('tags'), self.params.get('tags'))
+            TagUtil.create_tags(self.elasticsearch, self.params.get('tags'), tags=tags)
         except Exception as e:
             logging.fatal(e)
             traceback.print_exc()
@@ -96,30 +98,35 @@ class MeArticlesPublicRepublishWithHeader(LambdaBase):
             'statusCode': 200
         }
 
-    def __update_article_info(self, article_content_edit, article_info_table):
+    def __update_article_info(self, article_content_edit, article_info_table, tags):
         article_info_table.update_item(
             Key={
                 'article_id': self.params['article_id'],
             },
             UpdateExpression=("set title = :title, eye_catch_url=:eye_catch_url, "
-                              "sync_elasticsearch=:sync_elasticsearch, topic=:topic, tags=:tags"),
+                              "sync_elasticsearch=:sync_elasticsearch, topic=:topic, tags=:tags, "
+                              "user_id_status=:user_id_status"),
             ExpressionAttributeValues={
                 ':title': article_content_edit['title'],
                 ':eye_catch_url': self.params.get('eye_catch_url'),
                 ':sync_elasticsearch': 1,
                 ':topic': self.params['topic'],
-                ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'))
+                ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'), tags=tags),
+                ':user_id_status': DBUtil.get_user_id_status(
+                    self.event['requestContext']['authorizer']['claims']['cognito:username'], 'public')
             }
         )
 
-    def __update_paid_article_info(self, article_content_edit, article_info_table):
+    def __update_paid_article_info(self, article_content_edit, article_info_table, tags):
         info_expression_attribute_values = {
             ':title': article_content_edit['title'],
             ':eye_catch_url': self.params.get('eye_catch_url'),
             ':one': 1,
             ':topic': self.params['topic'],
-            ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags')),
-            ':price': self.params.get('price')
+            ':tags': TagUtil.get_tags_with_name_collation(self.elasticsearch, self.params.get('tags'), tags=tags),
+            ':price': self.params.get('price'),
+            ':user_id_status': DBUtil.get_user_id_status(
+                self.event['requestContext']['authorizer']['claims']['cognito:username'], 'public')
         }
 
         article_info_table.update_item(
@@ -127,7 +134,8 @@ class MeArticlesPublicRepublishWithHeader(LambdaBase):
                 'article_id': self.params['article_id'],
             },
             UpdateExpression='set sync_elasticsearch = :one, topic = :topic, tags = :tags,'
-                             ' eye_catch_url=:eye_catch_url, title = :title, price = :price',
+                             ' eye_catch_url=:eye_catch_url, title = :title, price = :price,'
+                             ' user_id_status = :user_id_status',
             ExpressionAttributeValues=info_expression_attribute_values
         )
 
@@ -28,14 +28,14 @@ class MeArticlesPublicShow(LambdaBase):
             self.dynamodb,
             self.params['article_id'],
             user_id=self.event['requestContext']['authorizer']['claims']['cognito:username'],
-            status='public'
+            status='public',
+            request_cache=self.request_cache
         )
 
     def exec_main_proc(self):
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
         article_content_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_TABLE_NAME'])
 
-        article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+        article_info = DBUtil.get_article_info(self.dynamodb, self.params['article_id'], self.request_cache)
         article_content = article_content_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
 
         if 'price' in article_info:
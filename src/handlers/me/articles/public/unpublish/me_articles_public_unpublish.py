@@ -37,12 +37,18 @@ class MeArticlesPublicUnpublish(LambdaBase):
             Key={
                 'article_id': self.params['article_id'],
             },
-            UpdateExpression='set #attr = :article_status, #sync_elasticsearch = :one',
+            UpdateExpression='set #attr = :article_status, user_id_status = :user_id_status, '
+                             '#sync_elasticsearch = :one',
             ExpressionAttributeNames={
                 '#attr': 'status',
                 '#sync_elasticsearch': 'sync_elasticsearch'
             },
-            ExpressionAttributeValues={':article_status': 'draft', ':one': 1}
+            ExpressionAttributeValues={
+                ':article_status': 'draft',
+                ':user_id_status': DBUtil.get_user_id_status(
+                    self.event['requestContext']['authorizer']['claims']['cognito:username'], 'draft'),
+                ':one': 1
+            }
         )
 
         return {
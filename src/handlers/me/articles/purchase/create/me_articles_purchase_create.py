@@ -3,10 +3,6 @@ import os
 import settings
 import time
 import json
-import requests
-import hashlib
-import logging
-import traceback
 from boto3.dynamodb.conditions import Key
 from db_util import DBUtil
 from user_util import UserUtil
@@ -15,9 +11,8 @@ from jsonschema import validate, ValidationError
 from time_util import TimeUtil
 from record_not_found_error import RecordNotFoundError
 from exceptions import SendTransactionError
-from aws_requests_auth.aws_auth import AWSRequestsAuth
+from private_chain_client import PrivateChainClient
 from decimal_encoder import DecimalEncoder
-from time import sleep
 from decimal import Decimal
 
 
@@ -51,12 +46,14 @@ class MeArticlesPurchaseCreate(LambdaBase):
         DBUtil.validate_article_existence(
             self.dynamodb,
             self.params['article_id'],
-            status='public'
+            status='public',
+            request_cache=self.request_cache
         )
         DBUtil.validate_latest_price(
             self.dynamodb,
             self.params['article_id'],
-            self.params['price']
+            self.params['price'],
+            request_cache=self.request_cache
         )
         DBUtil.validate_not_purchased(
             self.dynamodb,
@@ -66,8 +63,7 @@ class MeArticlesPurchaseCreate(LambdaBase):
 
     def exec_main_proc(self):
         # get article info
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+        article_info = DBUtil.get_article_info(self.dynamodb, self.params['article_id'], self.request_cache)
         # does not purchase same user's article
         user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
         if article_info['user_id'] == user_id:
@@ -79,54 +75,25 @@ class MeArticlesPurchaseCreate(LambdaBase):
         user_eth_address = self.event['requestContext']['authorizer']['claims']['custom:private_eth_address']
         price = self.params['price']
 
-        auth = AWSRequestsAuth(aws_access_key=os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'],
-                               aws_secret_access_key=os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'],
-                               aws_host=os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'],
-                               aws_region='ap-northeast-1',
-                               aws_service='execute-api')
         headers = {'content-type': 'application/json'}
 
         sort_key = TimeUtil.generate_sort_key()
 
         # 購入のトランザクション処理
-        purchase_transaction = self.__create_purchase_transaction(auth, headers, user_eth_address,
-                                                                  article_user_eth_address, price)
-        # 購入記事データを作成
+        purchase_transaction = self.__create_purchase_transaction(headers, user_eth_address, article_user_eth_address, price)
+        # 購入記事データを処理中(doing)として作成
+        # トランザクションの承認確認、バーンのトランザクション発行、通知作成は PaidArticlesConfirm で非同期に行う
         self.__create_paid_article(paid_articles_table, article_info, purchase_transaction, sort_key)
-        # プライベートチェーンへのポーリングを行いトランザクションの承認状態を取得
-        transaction_status = self.__polling_to_private_chain(purchase_transaction, auth, headers)
-        # トランザクションの承認状態をpaid_artilcleに格納
-        self.__update_transaction_status(article_info, paid_articles_table, transaction_status, sort_key)
-
-        # 購入のトランザクションが成功した時のみバーンのトランザクションを発行する
-        if transaction_status == 'done':
-            try:
-                # 購入に成功した場合、著者の未読通知フラグをTrueにする
-                self.__update_unread_notification_manager(article_info['user_id'])
-                # 著者へ通知を作成
-                self.__notify_author(article_info, user_id)
-                # バーンのトランザクション処理
-                burn_transaction = self.__burn_transaction(price, user_eth_address, auth, headers)
-                # バーンのトランザクションを購入テーブルに格納
-                self.__add_burn_transaction_to_paid_article(burn_transaction, paid_articles_table,
-                                                            article_info, sort_key)
-            except Exception as err:
-                logging.fatal(err)
-                traceback.print_exc()
-        # 記事購入者へは購入処理中の場合以外で通知を作成
-        if transaction_status == 'done' or transaction_status == 'fail':
-            self.__update_unread_notification_manager(user_id)
-            self.__notify_purchaser(article_info, user_id, transaction_status)
 
         return {
             'statusCode': 200,
             'body': json.dumps({
-                'status': transaction_status
+                'status': 'doing'
             })
         }
 
     @staticmethod
-    def __create_purchase_transaction(auth, headers, user_eth_address, article_user_eth_address, price):
+    def __create_purchase_transaction(headers, user_eth_address, article_user_eth_address, price):
         purchase_price = format(int(Decimal(price) * Decimal(9) / Decimal(10)), '064x')
         purchase_payload = json.dumps(
             {
@@ -136,8 +103,7 @@ class MeArticlesPurchaseCreate(LambdaBase):
             }
         )
         # purchase article transaction
-        response = requests.post('https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] +
-                                 '/production/wallet/tip', auth=auth, headers=headers, data=purchase_payload)
+        response = PrivateChainClient.post('wallet/tip', payload=purchase_payload, headers=headers)
         # validate status code
         if response.status_code != 200:
             raise SendTransactionError('status code not 200')
@@ -180,58 +146,6 @@ class MeArticlesPurchaseCreate(LambdaBase):
             Item=paid_article
         )
 
-    @staticmethod
-    def __burn_transaction(price, user_eth_address, auth, headers):
-        burn_token = format(int(Decimal(price) / Decimal(10)), '064x')
-
-        burn_payload = json.dumps(
-            {
-                'from_user_eth_address': user_eth_address,
-                'to_user_eth_address': settings.ETH_ZERO_ADDRESS,
-                'tip_value': burn_token
-            }
-        )
-
-        # burn transaction
-        response = requests.post('https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] +
-                                 '/production/wallet/tip', auth=auth, headers=headers, data=burn_payload)
-
-        # validate status code
-        if response.status_code != 200:
-            raise SendTransactionError('status code not 200')
-
-        # exists error
-        if json.loads(response.text).get('error'):
-            raise SendTransactionError(json.loads(response.text).get('error'))
-
-        return json.loads(response.text).get('result').replace('"', '')
-
-    @staticmethod
-    def __add_burn_transaction_to_paid_article(burn_transaction, paid_articles_table, article_info, sort_key):
-        burn_transaction = {
-            ':burn_transaction': burn_transaction
-        }
-        paid_articles_table.update_item(
-            Key={
-                'article_id': article_info['article_id'],
-                'sort_key': sort_key
-            },
-            UpdateExpression="set burn_transaction = :burn_transaction",
-            ExpressionAttributeValues=burn_transaction
-        )
-
-    @staticmethod
-    def __update_transaction_status(article_info, paid_articles_table, transaction_status, sort_key):
-        paid_articles_table.update_item(
-            Key={
-                'article_id': article_info['article_id'],
-                'sort_key': sort_key
-            },
-            UpdateExpression="set #attr = :transaction_status",
-            ExpressionAttributeNames={'#attr': 'status'},
-            ExpressionAttributeValues={':transaction_status': transaction_status}
-        )
-
     def __get_user_private_eth_address(self, user_id):
         # user_id に紐づく private_eth_address を取得
         user_info = UserUtil.get_cognito_user_info(self.cognito, user_id)
@@ -241,88 +155,3 @@ class MeArticlesPurchaseCreate(LambdaBase):
             raise RecordNotFoundError('Record Not Found: private_eth_address')
 
         return private_eth_address[0]['Value']
-
-    @staticmethod
-    def __check_transaction_confirmation(purchase_transaction, auth, headers):
-        receipt_payload = json.dumps(
-            {
-                'transaction_hash': purchase_transaction
-            }
-        )
-        response = requests.post('https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] +
-                                 '/production/transaction/receipt', auth=auth, headers=headers, data=receipt_payload)
-
-        # validate status code
-        if response.status_code != 200:
-            raise SendTransactionError('status code not 200')
-
-        # exists error
-        if json.loads(response.text).get('error'):
-            raise SendTransactionError(json.loads(response.text).get('error'))
-
-        return response.text
-
-    def __polling_to_private_chain(self, purchase_transaction, auth, headers):
-        # 最大10回トランザクション詳細を問い合わせる(回数については問題がある場合検討)
-        count = settings.POLLING_INITIAL_COUNT
-        while count < settings.POLLING_MAX_COUNT:
-            count += 1
-            # 1秒待機
-            sleep(1)
-            # check whether transaction is completed
-            transaction_info = self.__check_transaction_confirmation(purchase_transaction, auth, headers)
-            result = json.loads(transaction_info).get('result')
-            # exists error
-            if json.loads(transaction_info).get('error'):
-                return 'fail'
-            # receiptがnullの場合countをインクリメントしてループ処理
-            if result is None or result['logs'] == 0:
-                continue
-            # transactionが承認済みであればstatusをdoneにする
-            if result['logs'][0].get('type') == 'mined':
-                return 'done'
-        return 'doing'
-
-    def __update_unread_notification_manager(self, user_id):
-        unread_notification_manager_table = self.dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
-        unread_notification_manager_table.update_item(
-            Key={'user_id': user_id},
-            UpdateExpression='set unread = :unread',
-            ExpressionAttributeValues={':unread': True}
-        )
-
-    def __notify_author(self, article_info, user_id):
-        notification_table = self.dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
-
-        notification_table.put_item(Item={
-            'notification_id': self.__get_randomhash(),
-            'user_id': article_info['user_id'],
-            'acted_user_id': user_id,
-            'article_id': article_info['article_id'],
-            'article_user_id': article_info['user_id'],
-            'article_title': article_info['title'],
-            'sort_key': TimeUtil.generate_sort_key(),
-            'type': settings.ARTICLE_PURCHASED_TYPE,
-            'price': int(article_info['price']),
-            'created_at': int(time.time())
-        })
-
-    def __notify_purchaser(self, article_info, user_id, transaction_status):
-        notification_table = self.dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
-
-        notification_table.put_item(Item={
-            'notification_id': self.__get_randomhash(),
-            'user_id': user_id,
-            'acted_user_id': user_id,
-            'article_id': article_info['article_id'],
-            'article_user_id': article_info['user_id'],
-            'article_title': article_info['title'],
-            'sort_key': TimeUtil.generate_sort_key(),
-            'type': settings.ARTICLE_PURCHASE_TYPE if transaction_status == 'done' else settings.ARTICLE_PURCHASE_ERROR_TYPE,
-            'price': int(article_info['price']),
-            'created_at': int(time.time())
-        })
-
-    @staticmethod
-    def __get_randomhash():
-        return hashlib.sha256((str(time.time()) + str(os.urandom(16))).encode('utf-8')).hexdigest()
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import boto3
+from me_articles_purchase_status_show import MeArticlesPurchaseStatusShow
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    me_articles_purchase_status_show = MeArticlesPurchaseStatusShow(event=event, context=context, dynamodb=dynamodb)
+    return me_articles_purchase_status_show.main()
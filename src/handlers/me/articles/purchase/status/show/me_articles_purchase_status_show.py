@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import settings
+from lambda_base import LambdaBase
+from jsonschema import validate
+from record_not_found_error import RecordNotFoundError
+from boto3.dynamodb.conditions import Key
+
+
+class MeArticlesPurchaseStatusShow(LambdaBase):
+    def get_schema(self):
+        return {
+            'type': 'object',
+            'properties': {
+                'article_id': settings.parameters['article_id']
+            },
+            'required': ['article_id']
+        }
+
+    def validate_params(self):
+        validate(self.params, self.get_schema())
+
+    def exec_main_proc(self):
+        paid_articles_table = self.dynamodb.Table(os.environ['PAID_ARTICLES_TABLE_NAME'])
+        user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
+
+        paid_articles = paid_articles_table.query(
+            IndexName='article_id-user_id-index',
+            KeyConditionExpression=Key('article_id').eq(self.params['article_id']) & Key('user_id').eq(user_id),
+        ).get('Items')
+
+        if len(paid_articles) == 0:
+            raise RecordNotFoundError('Record Not Found')
+
+        # 購入に失敗した後に再購入したケースを考慮し、最新の購入記事データの状態を返却する
+        paid_article = max(paid_articles, key=lambda p: p['sort_key'])
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'status': paid_article['status']
+            })
+        }
@@ -20,10 +20,12 @@ class MeArticlesPurchasedArticleIdsIndex(LambdaBase):
 
         query_params = {
             'IndexName': 'user_id-sort_key-index',
-            'KeyConditionExpression': Key('user_id').eq(user_id)
+            'KeyConditionExpression': Key('user_id').eq(user_id),
+            'ProjectionExpression': 'article_id, user_id, #status',
+            'ExpressionAttributeNames': {'#status': 'status'}
         }
 
-        result = DBUtil.query_all_items(paid_articles_table, query_params)
+        result = DBUtil.iterate_query_items(paid_articles_table, query_params)
 
         article_ids = [paid_article['article_id'] for paid_article in result if
                        paid_article['user_id'] == user_id and paid_article['status'] == 'done']
@@ -3,7 +3,9 @@ import os
 import json
 import settings
 from boto3.dynamodb.conditions import Key, Attr
+from db_util import DBUtil
 from lambda_base import LambdaBase
+from pagination_util import PaginationUtil
 from jsonschema import validate
 from decimal_encoder import DecimalEncoder
 from parameter_util import ParameterUtil
@@ -33,7 +35,6 @@ class MeArticlesPurchasedIndex(LambdaBase):
             limit = int(self.params.get('limit'))
 
         query_params = {
-            'Limit': limit,
             'IndexName': 'user_id-sort_key-index',
             'KeyConditionExpression': Key('user_id').eq(user_id),
             'FilterExpression': Attr('status').eq('done'),
@@ -49,33 +50,17 @@ class MeArticlesPurchasedIndex(LambdaBase):
 
             query_params.update({'ExclusiveStartKey': LastEvaluatedKey})
 
-        response = paid_articles_table.query(**query_params)
+        response = PaginationUtil.query_filtered_page(
+            paid_articles_table, query_params, limit, ['user_id', 'article_id', 'sort_key'])
+        article_ids = [item['article_id'] for item in response['Items']]
+        article_infos = DBUtil.batch_get_articles(self.dynamodb, article_ids)
 
-        items = response['Items']
+        if len(article_infos) != len(article_ids):
+            fetched_article_ids = [article_info['article_id'] for article_info in article_infos]
+            missing_article_ids = [article_id for article_id in article_ids if article_id not in fetched_article_ids]
+            raise Exception('Failed to get ArticleInfo. article_id: ' + ', '.join(missing_article_ids))
 
-        while 'LastEvaluatedKey' in response and len(response['Items']) < limit:
-            query_params.update({'ExclusiveStartKey': response['LastEvaluatedKey']})
-            response = paid_articles_table.query(**query_params)
-            items.extend(response['Items'])
-
-            if len(items) >= limit:
-                LastEvaluatedKey = {
-                    'user_id': user_id,
-                    'article_id': items[limit - 1]['article_id'],
-                    'sort_key': int(items[limit - 1]['sort_key'])
-                }
-                response.update({'LastEvaluatedKey': LastEvaluatedKey})
-                break
-
-        response['Items'] = items[:limit]
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-
-        for i in range(len(response['Items'])):
-            article_id = response['Items'][i]['article_id']
-            article_info = article_info_table.get_item(Key={'article_id': article_id}).get('Item')
-            if article_info is None:
-                raise Exception('Failed to get ArticleInfo. article_id: ' + article_id)
-            response['Items'][i] = article_info
+        response['Items'] = article_infos
 
         return {
             'statusCode': 200,
@@ -27,10 +27,10 @@ class MeArticlesPurchasedShow(LambdaBase):
             self.dynamodb,
             self.params['article_id'],
             status='public',
+            request_cache=self.request_cache
         )
 
     def exec_main_proc(self):
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
         article_content_table = self.dynamodb.Table(os.environ['ARTICLE_CONTENT_TABLE_NAME'])
         paid_articles_table = self.dynamodb.Table(os.environ['PAID_ARTICLES_TABLE_NAME'])
         user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
@@ -43,7 +43,7 @@ class MeArticlesPurchasedShow(LambdaBase):
         if len([i for i in paid_articles if i.get('status') == 'done']) != 1:
             raise NotAuthorizedError('Forbidden')
 
-        article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+        article_info = DBUtil.get_article_info(self.dynamodb, self.params['article_id'], self.request_cache)
         article_content = article_content_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
 
         # 記事が有料から無料になるケースを考慮し、無料記事の場合は本文（body）をそのまま返却する
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 import json
+import logging
 import os
 import settings
 import time
+import traceback
 
 from botocore.exceptions import ClientError
 from db_util import DBUtil
 from lambda_base import LambdaBase
+from like_counter_util import LikeCounterUtil
 from jsonschema import validate
 from user_util import UserUtil
 
@@ -55,4 +58,10 @@ class MeCommentsLikesCreate(LambdaBase):
             else:
                 raise
 
+        try:
+            LikeCounterUtil.increment(self.dynamodb, settings.COMMENT_LIKE_COUNTER_TYPE, comment['comment_id'])
+        except Exception as e:
+            logging.fatal(e)
+            traceback.print_exc()
+
         return {'statusCode': 200}
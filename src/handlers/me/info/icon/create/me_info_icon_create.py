@@ -2,12 +2,10 @@
 import os
 import settings
 import uuid
-import base64
 import json
+from image_util import ImageUtil
 from lambda_base import LambdaBase
-from jsonschema import validate, ValidationError
-from PIL import Image
-from io import BytesIO
+from jsonschema import validate
 
 
 class MeInfoIconCreate(LambdaBase):
@@ -50,17 +48,12 @@ class MeInfoIconCreate(LambdaBase):
             }]
         }
 
-    def validate_image_data(self, image_data):
-        try:
-            Image.open(BytesIO(base64.b64decode(image_data)))
-        except Exception:
-            raise ValidationError('Bad Request: No supported image format')
-
     def validate_params(self):
         # single
         # params
         validate(self.params, self.get_schema())
-        self.validate_image_data(self.params['icon_image'])
+        # デコードした画像は縮小時にそのまま利用する
+        self.image_data, self.image = ImageUtil.decode_base64_image(self.params['icon_image'])
         # headers
         validate(self.event.get('headers'), self.get_headers_schema())
 
@@ -71,7 +64,7 @@ class MeInfoIconCreate(LambdaBase):
         user_id = self.event['requestContext']['authorizer']['claims']['cognito:username']
         key = settings.S3_INFO_ICON_PATH + \
             user_id + '/icon/' + str(uuid.uuid4()) + '.' + ext
-        image_data = self.__get_save_image_data(base64.b64decode(self.params['icon_image']), ext)
+        image_data = self.__get_save_image_data(ext)
 
         self.s3.Bucket(os.environ['DIST_S3_BUCKET_NAME']).put_object(
             Body=image_data,
@@ -100,34 +93,23 @@ class MeInfoIconCreate(LambdaBase):
             }
         )
 
-    def __get_save_image_data(self, image_data, ext):
-        image = Image.open(BytesIO(image_data))
+    def __get_save_image_data(self, ext):
+        image = self.image
         w, h = image.size
         if w <= settings.USER_ICON_WIDTH and h <= settings.USER_ICON_HEIGHT:
-            return image_data
+            return self.image_data
 
         # resize to icon size
         if w >= h and (h > settings.USER_ICON_HEIGHT):
             resize_rate = h / settings.USER_ICON_HEIGHT
-            image.thumbnail((w / resize_rate, settings.USER_ICON_HEIGHT), Image.ANTIALIAS)
+            ImageUtil.shrink(image, w / resize_rate, settings.USER_ICON_HEIGHT)
         elif (h > w) and (w > settings.USER_ICON_WIDTH):
             resize_rate = w / settings.USER_ICON_WIDTH
-            image.thumbnail((settings.USER_ICON_WIDTH, h / resize_rate), Image.ANTIALIAS)
+            ImageUtil.shrink(image, settings.USER_ICON_WIDTH, h / resize_rate)
 
         # crop image to square
         w, h = image.size
         crop_width = settings.USER_ICON_WIDTH if w >= settings.USER_ICON_WIDTH else w
         crop_height = settings.USER_ICON_HEIGHT if h >= settings.USER_ICON_HEIGHT else h
-        crop_image = self.__crop_center(image, crop_width, crop_height)
-        buf = BytesIO()
-        crop_image.save(buf, format=ext)
-        return buf.getvalue()
-
-    def __crop_center(self, image_data, crop_width, crop_height):
-        w, h = image_data.size
-        return image_data.crop((
-            (w - crop_width) // 2,
-            (h - crop_height) // 2,
-            (w + crop_width) // 2,
-            (h + crop_height) // 2
-        ))
+        crop_image = ImageUtil.crop_center(image, crop_width, crop_height)
+        return ImageUtil.to_upload_body(crop_image, ext)
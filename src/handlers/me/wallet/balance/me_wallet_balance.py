@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
-import os
 import json
-import requests
-from aws_requests_auth.aws_auth import AWSRequestsAuth
+from private_chain_client import PrivateChainClient
 from lambda_base import LambdaBase
 
 
@@ -22,13 +20,7 @@ class MeWalletBalance(LambdaBase):
     def __get_balance(address):
         headers = {"content-type": "application/json"}
         payload = json.dumps({"private_eth_address": address[2:]})
-        auth = AWSRequestsAuth(aws_access_key=os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'],
-                               aws_secret_access_key=os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'],
-                               aws_host=os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'],
-                               aws_region='ap-northeast-1',
-                               aws_service='execute-api')
-        response = requests.post('https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] +
-                                 '/production/wallet/balance', auth=auth, headers=headers, data=payload)
+        response = PrivateChainClient.post('wallet/balance', payload=payload, headers=headers)
 
         return {
             'statusCode': 200,
@@ -2,17 +2,16 @@
 import os
 import settings
 import json
-import requests
 import time
 from time_util import TimeUtil
 from db_util import DBUtil
-from aws_requests_auth.aws_auth import AWSRequestsAuth
 from jsonschema import validate
 from lambda_base import LambdaBase
 from jsonschema import ValidationError
 from record_not_found_error import RecordNotFoundError
 from exceptions import SendTransactionError
 from user_util import UserUtil
+from private_chain_client import PrivateChainClient
 
 
 class MeWalletTip(LambdaBase):
@@ -40,13 +39,13 @@ class MeWalletTip(LambdaBase):
         DBUtil.validate_article_existence(
             self.dynamodb,
             self.params['article_id'],
-            status='public'
+            status='public',
+            request_cache=self.request_cache
         )
 
     def exec_main_proc(self):
         # get article info
-        article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
-        article_info = article_info_table.get_item(Key={'article_id': self.params['article_id']}).get('Item')
+        article_info = DBUtil.get_article_info(self.dynamodb, self.params['article_id'], self.request_cache)
         # validation
         # does not tip same user
         if article_info['user_id'] == self.event['requestContext']['authorizer']['claims']['cognito:username']:
@@ -75,13 +74,7 @@ class MeWalletTip(LambdaBase):
                 'tip_value': format(tip_value, '064x')
             }
         )
-        auth = AWSRequestsAuth(aws_access_key=os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'],
-                               aws_secret_access_key=os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'],
-                               aws_host=os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'],
-                               aws_region='ap-northeast-1',
-                               aws_service='execute-api')
-        response = requests.post('https://' + os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] +
-                                 '/production/wallet/tip', auth=auth, headers=headers, data=payload)
+        response = PrivateChainClient.post('wallet/tip', payload=payload, headers=headers)
 
         # exists error
         if json.loads(response.text).get('error'):
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+import boto3
+from paid_articles_confirm import PaidArticlesConfirm
+
+dynamodb = boto3.resource('dynamodb')
+cognito = boto3.client('cognito-idp')
+
+
+def lambda_handler(event, context):
+    paid_articles_confirm = PaidArticlesConfirm(event=event, context=context, dynamodb=dynamodb, cognito=cognito)
+    return paid_articles_confirm.main()
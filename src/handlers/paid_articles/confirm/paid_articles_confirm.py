@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+import os
+import settings
+import time
+import json
+import hashlib
+import logging
+import traceback
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from db_util import DBUtil
+from user_util import UserUtil
+from lambda_base import LambdaBase
+from notification_util import NotificationUtil
+from time_util import TimeUtil
+from record_not_found_error import RecordNotFoundError
+from exceptions import SendTransactionError
+from private_chain_client import PrivateChainClient
+from decimal import Decimal
+
+
+class PaidArticlesConfirm(LambdaBase):
+    """
+    処理中(status='doing')の購入記事データについてトランザクションの承認状態を確認する
+    MeArticlesPurchaseCreate ではポーリングを行わず、本処理を定期実行(CloudWatch Events)して非同期に確定させる
+    承認された場合はバーンのトランザクション発行と通知作成を行う
+    """
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        paid_articles_table = self.dynamodb.Table(os.environ['PAID_ARTICLES_TABLE_NAME'])
+        query_params = {
+            'IndexName': 'status-index',
+            'KeyConditionExpression': Key('status').eq('doing')
+        }
+        paid_articles = DBUtil.query_all_items(paid_articles_table, query_params)
+
+        headers = {'content-type': 'application/json'}
+
+        # 全ての購入トランザクションの receipt を並列に取得する
+        receipts = PrivateChainClient.get_transaction_receipts(
+            [paid_article['purchase_transaction'] for paid_article in paid_articles],
+            headers=headers
+        )
+
+        results = {'done': 0, 'fail': 0, 'doing': 0}
+        for paid_article in paid_articles:
+            # 1件の失敗で他の購入記事データの確認が止まらないよう、例外は記録して次の処理へ進む
+            try:
+                receipt = receipts[paid_article['purchase_transaction']]
+                transaction_status = self.__confirm_paid_article(paid_articles_table, paid_article, receipt, headers)
+                results[transaction_status] += 1
+            except Exception as err:
+                logging.fatal(err)
+                traceback.print_exc()
+                results['doing'] += 1
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps(results)
+        }
+
+    def __confirm_paid_article(self, paid_articles_table, paid_article, receipt, headers):
+        transaction_status = self.__get_transaction_status(receipt)
+        if transaction_status == 'doing':
+            return transaction_status
+
+        # 並行して実行された本処理と重複して通知・バーンを行わないよう、doing の場合のみ更新する
+        if not self.__update_transaction_status(paid_articles_table, paid_article, transaction_status):
+            return 'doing'
+
+        # 購入のトランザクションが成功した時のみバーンのトランザクションを発行する
+        if transaction_status == 'done':
+            try:
+                # 購入に成功した場合、著者の未読通知フラグをTrueにする
+                NotificationUtil.update_unread_notification_manager(self.dynamodb, paid_article['article_user_id'])
+                # 著者へ通知を作成
+                self.__notify_author(paid_article)
+                # バーンのトランザクション処理
+                user_eth_address = self.__get_user_private_eth_address(paid_article['user_id'])
+                burn_transaction = self.__burn_transaction(paid_article['price'], user_eth_address, headers)
+                # バーンのトランザクションを購入テーブルに格納
+                self.__add_burn_transaction_to_paid_article(burn_transaction, paid_articles_table, paid_article)
+            except Exception as err:
+                logging.fatal(err)
+                traceback.print_exc()
+        # 記事購入者へは購入処理中の場合以外で通知を作成
+        NotificationUtil.update_unread_notification_manager(self.dynamodb, paid_article['user_id'])
+        self.__notify_purchaser(paid_article, transaction_status)
+
+        return transaction_status
+
+    def __get_transaction_status(self, receipt):
+        # check whether transaction is completed
+        transaction_info = self.__check_transaction_confirmation(receipt)
+        result = json.loads(transaction_info).get('result')
+        # exists error
+        if json.loads(transaction_info).get('error'):
+            return 'fail'
+        # receiptがnullの場合は次回の実行時に再度確認する
+        if result is None or result['logs'] == 0:
+            return 'doing'
+        # transactionが承認済みであればstatusをdoneにする
+        if result['logs'][0].get('type') == 'mined':
+            return 'done'
+        return 'doing'
+
+    @staticmethod
+    def __check_transaction_confirmation(response):
+        # receipt の取得時に発生した例外
+        if isinstance(response, Exception):
+            raise response
+
+        # validate status code
+        if response.status_code != 200:
+            raise SendTransactionError('status code not 200')
+
+        # exists error
+        if json.loads(response.text).get('error'):
+            raise SendTransactionError(json.loads(response.text).get('error'))
+
+        return response.text
+
+    @staticmethod
+    def __update_transaction_status(paid_articles_table, paid_article, transaction_status):
+        try:
+            paid_articles_table.update_item(
+                Key={
+                    'article_id': paid_article['article_id'],
+                    'sort_key': paid_article['sort_key']
+                },
+                UpdateExpression="set #attr = :transaction_status",
+                ConditionExpression='#attr = :doing',
+                ExpressionAttributeNames={'#attr': 'status'},
+                ExpressionAttributeValues={':transaction_status': transaction_status, ':doing': 'doing'}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise e
+
+        return True
+
+    @staticmethod
+    def __burn_transaction(price, user_eth_address, headers):
+        burn_token = format(int(Decimal(price) / Decimal(10)), '064x')
+
+        burn_payload = json.dumps(
+            {
+                'from_user_eth_address': user_eth_address,
+                'to_user_eth_address': settings.ETH_ZERO_ADDRESS,
+                'tip_value': burn_token
+            }
+        )
+
+        # burn transaction
+        response = PrivateChainClient.post('wallet/tip', payload=burn_payload, headers=headers)
+
+        # validate status code
+        if response.status_code != 200:
+            raise SendTransactionError('status code not 200')
+
+        # exists error
+        if json.loads(response.text).get('error'):
+            raise SendTransactionError(json.loads(response.text).get('error'))
+
+        return json.loads(response.text).get('result').replace('"', '')
+
+    @staticmethod
+    def __add_burn_transaction_to_paid_article(burn_transaction, paid_articles_table, paid_article):
+        burn_transaction = {
+            ':burn_transaction': burn_transaction
+        }
+        paid_articles_table.update_item(
+            Key={
+                'article_id': paid_article['article_id'],
+                'sort_key': paid_article['sort_key']
+            },
+            UpdateExpression="set burn_transaction = :burn_transaction",
+            ExpressionAttributeValues=burn_transaction
+        )
+
+    def __get_user_private_eth_address(self, user_id):
+        # user_id に紐づく private_eth_address を取得
+        user_info = UserUtil.get_cognito_user_info(self.cognito, user_id)
+        private_eth_address = [a for a in user_info['UserAttributes'] if a.get('Name') == 'custom:private_eth_address']
+        # private_eth_address が存在しないケースは想定していないため、取得出来ない場合は例外とする
+        if len(private_eth_address) != 1:
+            raise RecordNotFoundError('Record Not Found: private_eth_address')
+
+        return private_eth_address[0]['Value']
+
+    def __notify_author(self, paid_article):
+        notification_table = self.dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
+
+        notification_table.put_item(Item={
+            'notification_id': self.__get_randomhash(),
+            'user_id': paid_article['article_user_id'],
+            'acted_user_id': paid_article['user_id'],
+            'article_id': paid_article['article_id'],
+            'article_user_id': paid_article['article_user_id'],
+            'article_title': paid_article['article_title'],
+            'sort_key': TimeUtil.generate_sort_key(),
+            'type': settings.ARTICLE_PURCHASED_TYPE,
+            'price': int(paid_article['price']),
+            'created_at': int(time.time())
+        })
+
+    def __notify_purchaser(self, paid_article, transaction_status):
+        notification_table = self.dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
+
+        notification_table.put_item(Item={
+            'notification_id': self.__get_randomhash(),
+            'user_id': paid_article['user_id'],
+            'acted_user_id': paid_article['user_id'],
+            'article_id': paid_article['article_id'],
+            'article_user_id': paid_article['article_user_id'],
+            'article_title': paid_article['article_title'],
+            'sort_key': TimeUtil.generate_sort_key(),
+            'type': settings.ARTICLE_PURCHASE_TYPE if transaction_status == 'done' else settings.ARTICLE_PURCHASE_ERROR_TYPE,
+            'price': int(paid_article['price']),
+            'created_at': int(time.time())
+        })
+
+    @staticmethod
+    def __get_randomhash():
+        return hashlib.sha256((str(time.time()) + str(os.urandom(16))).encode('utf-8')).hexdigest()
@@ -16,6 +16,7 @@ class SearchTags(LambdaBase):
             'properties': {
                 'limit': settings.parameters['limit'],
                 'page': settings.parameters['page'],
+                'cursor': settings.parameters['cursor'],
                 'query': settings.parameters['query']
             },
             'required': ['query']
@@ -30,7 +31,17 @@ class SearchTags(LambdaBase):
         limit = int(self.params.get('limit')) if self.params.get('limit') is not None else settings.TAG_SEARCH_DEFAULT_LIMIT
         page = int(self.params.get('page')) if self.params.get('page') is not None else 1
 
-        result = ESUtil.search_tag(self.elasticsearch, query, limit, page)
+        cursor = self.params.get('cursor')
+
+        result = ESUtil.search_tag(self.elasticsearch, query, limit, page, cursor=cursor)
+
+        # cursor が指定された場合は、次のページを取得するための cursor を Items と合わせて返却する
+        if cursor is not None:
+            result = {
+                'Items': result,
+                'Cursor': ESUtil.get_next_cursor(result, limit, ESUtil.TAG_SORT_FIELDS)
+            }
+
         return {
             'statusCode': 200,
             'body': json.dumps(result, cls=DecimalEncoder)
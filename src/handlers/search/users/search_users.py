@@ -15,6 +15,7 @@ class SearchUsers(LambdaBase):
             'properties': {
                 'limit': settings.parameters['limit'],
                 'page': settings.parameters['page'],
+                'cursor': settings.parameters['cursor'],
                 'query': settings.parameters['query']
             },
             'required': ['query']
@@ -28,10 +29,17 @@ class SearchUsers(LambdaBase):
         query = self.params['query']
         limit = int(self.params.get('limit')) if self.params.get('limit') is not None else settings.article_recent_default_limit
         page = int(self.params.get('page')) if self.params.get('page') is not None else 1
-        response = ESUtil.search_user(self.elasticsearch, query, limit, page)
+        cursor = self.params.get('cursor')
+        response = ESUtil.search_user(self.elasticsearch, query, limit, page, cursor=cursor)
         result = []
         for u in response["hits"]["hits"]:
             result.append(u["_source"])
+        # cursor が指定された場合は、次のページを取得するための cursor を Items と合わせて返却する
+        if cursor is not None:
+            result = {
+                'Items': result,
+                'Cursor': ESUtil.get_next_cursor(response["hits"]["hits"], limit)
+            }
         return {
             'statusCode': 200,
             'body': json.dumps(result, cls=DecimalEncoder)
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+from tags_count_rebuild import TagsCountRebuild
+from es_client import LazyElasticsearch
+
+elasticsearch = LazyElasticsearch()
+
+
+def lambda_handler(event, context):
+    tags_count_rebuild = TagsCountRebuild(event, context, elasticsearch=elasticsearch)
+    return tags_count_rebuild.main()
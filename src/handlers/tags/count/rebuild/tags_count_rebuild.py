@@ -0,0 +1,28 @@
+import json
+import logging
+import time
+
+from lambda_base import LambdaBase
+from tag_util import TagUtil
+
+
+class TagsCountRebuild(LambdaBase):
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        started_at = time.time()
+
+        # 記事のタグを集計し、タグのカウントを再作成したインデックスに切り替える
+        result = TagUtil.rebuild_tag_index(self.elasticsearch)
+
+        logging.info('rebuild tag index: {0}, tags: {1}, elapsed: {2:.1f}s'.format(
+            result['index'], result['tag_count'], time.time() - started_at))
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps(result)
+        }
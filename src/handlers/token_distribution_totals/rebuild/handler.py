@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import boto3
+from token_distribution_totals_rebuild import TokenDistributionTotalsRebuild
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    token_distribution_totals_rebuild = TokenDistributionTotalsRebuild(event=event, context=context, dynamodb=dynamodb)
+    return token_distribution_totals_rebuild.main()
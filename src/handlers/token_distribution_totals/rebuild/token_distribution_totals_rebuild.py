@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import logging
+from db_util import DBUtil
+from lambda_base import LambdaBase
+from token_distribution_total_util import TokenDistributionTotalUtil
+
+
+class TokenDistributionTotalsRebuild(LambdaBase):
+    """
+    TokenDistribution を並列 scan で集計し、TokenDistributionTotal のユーザー毎の合計を再作成する
+    初回の合計の作成(バックフィル)と、ストリームの再処理等による合計の乖離の補正に利用する
+    集計中に付与された分は上書きで失われるため、トークン付与のバッチが実行されていない時間帯に実行する
+    付与履歴が存在しなくなったユーザーの合計は 0 とする
+    """
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        scan_params = {
+            'ProjectionExpression': 'user_id, distribution_type, quantity'
+        }
+        items = DBUtil.iterate_scan_items_in_parallel(
+            self.dynamodb,
+            os.environ['TOKEN_DISTRIBUTION_TABLE_NAME'],
+            scan_params
+        )
+
+        # 付与履歴は保持せず、ユーザー毎の合計のみを保持する
+        totals = {}
+        distributions = 0
+        for item in items:
+            quantities = totals.setdefault(item['user_id'], TokenDistributionTotalUtil.get_empty_totals())
+            quantities[item['distribution_type']] = quantities.get(item['distribution_type'], 0) + item['quantity']
+            distributions += 1
+
+        # 付与履歴が存在しなくなったユーザーの合計は 0 とする
+        reset_totals = {
+            user_id: TokenDistributionTotalUtil.get_empty_totals()
+            for user_id in self.__get_current_total_user_ids() if user_id not in totals
+        }
+        TokenDistributionTotalUtil.put_totals(self.dynamodb, dict(totals, **reset_totals))
+
+        result = {
+            'distributions': distributions,
+            'users': len(totals),
+            'reset': len(reset_totals)
+        }
+        logging.info(result)
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps(result)
+        }
+
+    def __get_current_total_user_ids(self):
+        token_distribution_total_table = self.dynamodb.Table(os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'])
+        scan_params = {
+            'ProjectionExpression': 'user_id'
+        }
+
+        return [item['user_id'] for item in DBUtil.iterate_scan_items(token_distribution_total_table, scan_params)]
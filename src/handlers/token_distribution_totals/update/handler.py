@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+import boto3
+from token_distribution_totals_update import TokenDistributionTotalsUpdate
+
+dynamodb = boto3.resource('dynamodb')
+
+
+def lambda_handler(event, context):
+    token_distribution_totals_update = TokenDistributionTotalsUpdate(event=event, context=context, dynamodb=dynamodb)
+    response = token_distribution_totals_update.main()
+    # 失敗時は例外を送出し、ストリームのレコードを再処理させる
+    if response['statusCode'] != 200:
+        raise Exception('Failed to update token distribution totals')
+    return response
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+from boto3.dynamodb.types import TypeDeserializer
+from lambda_base import LambdaBase
+from token_distribution_total_util import TokenDistributionTotalUtil
+
+
+class TokenDistributionTotalsUpdate(LambdaBase):
+    """
+    TokenDistribution のストリーム(NEW_AND_OLD_IMAGES)を受け取り、TokenDistributionTotal の合計を加算する
+    TokenDistribution の書き込みは別システムのバッチで行われるため、書き込み側ではなくストリームで合計を更新する
+    レコード毎に加算済みかを記録するため、失敗時にバッチが再処理されても二重に加算しない
+    """
+    deserializer = TypeDeserializer()
+
+    def get_schema(self):
+        pass
+
+    def validate_params(self):
+        pass
+
+    def exec_main_proc(self):
+        # 失敗時はバッチ全体が再処理されるため、レコード毎に加算済みかを判定して1度のみ加算する
+        applied = 0
+        skipped = 0
+        for record in self.event['Records']:
+            new_image = self.__deserialize(record['dynamodb'].get('NewImage'))
+            old_image = self.__deserialize(record['dynamodb'].get('OldImage'))
+
+            quantities_by_user = {}
+            if record['eventName'] in ['INSERT', 'MODIFY']:
+                self.__add_quantity(quantities_by_user, new_image, 1)
+            if record['eventName'] in ['MODIFY', 'REMOVE']:
+                self.__add_quantity(quantities_by_user, old_image, -1)
+
+            if TokenDistributionTotalUtil.add(self.dynamodb, record['eventID'], quantities_by_user):
+                applied += 1
+            else:
+                skipped += 1
+
+        logging.info('records: {0}, applied: {1}, skipped: {2}'.format(len(self.event['Records']), applied, skipped))
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'applied': applied, 'skipped': skipped})
+        }
+
+    def __deserialize(self, image):
+        if image is None:
+            return None
+        return {k: self.deserializer.deserialize(v) for k, v in image.items()}
+
+    @staticmethod
+    def __add_quantity(quantities_by_user, item, sign):
+        quantities = quantities_by_user.setdefault(item['user_id'], {})
+        distribution_type = item['distribution_type']
+        quantities[distribution_type] = quantities.get(distribution_type, 0) + sign * item['quantity']
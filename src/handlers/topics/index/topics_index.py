@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 import json
-import os
 
-import settings
-from boto3.dynamodb.conditions import Key
+from db_util import DBUtil
 from decimal_encoder import DecimalEncoder
 from lambda_base import LambdaBase
 
@@ -16,14 +14,7 @@ class TopicsIndex(LambdaBase):
         pass
 
     def exec_main_proc(self):
-        topic_table = self.dynamodb.Table(os.environ['TOPIC_TABLE_NAME'])
-
-        query_params = {
-            'IndexName': 'index_hash_key-order-index',
-            'KeyConditionExpression': Key('index_hash_key').eq(settings.TOPIC_INDEX_HASH_KEY)
-        }
-
-        topics = topic_table.query(**query_params)['Items']
+        topics = DBUtil.get_topics(self.dynamodb)
 
         return {
             'statusCode': 200,
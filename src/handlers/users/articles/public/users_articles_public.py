@@ -2,8 +2,10 @@
 import os
 import json
 import settings
+from db_util import DBUtil
 from lambda_base import LambdaBase
-from boto3.dynamodb.conditions import Key, Attr
+from pagination_util import PaginationUtil
+from boto3.dynamodb.conditions import Key
 from jsonschema import validate, ValidationError
 from decimal_encoder import DecimalEncoder
 from parameter_util import ParameterUtil
@@ -39,42 +41,25 @@ class UsersArticlesPublic(LambdaBase):
 
         limit = self.__get_index_limit(self.event.get('queryStringParameters'))
 
+        # ステータス毎のインデックスからキー条件のみで取得する(公開中以外の記事を読み込まない)
+        user_id_status = DBUtil.get_user_id_status(self.event['pathParameters']['user_id'], 'public')
         query_params = {
-            'Limit': limit,
-            'IndexName': 'user_id-sort_key-index',
-            'KeyConditionExpression': Key('user_id').eq(self.event['pathParameters']['user_id']),
-            'FilterExpression': Attr('status').eq('public'),
+            'IndexName': 'user_id_status-sort_key-index',
+            'KeyConditionExpression': Key('user_id_status').eq(user_id_status),
             'ScanIndexForward': False
         }
 
         if self.__require_last_evaluatd_key(self.event.get('queryStringParameters')):
             LastEvaluatedKey = {
-                'user_id': self.event['pathParameters']['user_id'],
+                'user_id_status': user_id_status,
                 'article_id': self.event['queryStringParameters']['article_id'],
                 'sort_key': int(self.event['queryStringParameters']['sort_key'])
             }
 
             query_params.update({'ExclusiveStartKey': LastEvaluatedKey})
 
-        response = article_info_table.query(**query_params)
-
-        items = response['Items']
-
-        while 'LastEvaluatedKey' in response and len(response['Items']) < limit:
-            query_params.update({'ExclusiveStartKey': response['LastEvaluatedKey']})
-            response = article_info_table.query(**query_params)
-            items.extend(response['Items'])
-
-            if len(items) >= limit:
-                LastEvaluatedKey = {
-                    'user_id': self.params['user_id'],
-                    'article_id': items[limit - 1]['article_id'],
-                    'sort_key': int(items[limit - 1]['sort_key'])
-                }
-                response.update({'LastEvaluatedKey': LastEvaluatedKey})
-                break
-
-        response['Items'] = items[:limit]
+        response = PaginationUtil.query_filtered_page(
+            article_info_table, query_params, limit, ['user_id', 'article_id', 'sort_key'])
 
         return {
             'statusCode': 200,
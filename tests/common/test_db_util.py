@@ -1,13 +1,16 @@
 import os
 
 import settings
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
 from db_util import DBUtil
 from jsonschema import ValidationError
 from tests_util import TestsUtil
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 from record_not_found_error import RecordNotFoundError
 from not_authorized_error import NotAuthorizedError
+from request_cache import RequestCache
 
 
 class TestDBUtil(TestCase):
@@ -233,6 +236,34 @@ class TestDBUtil(TestCase):
     def tearDownClass(cls):
         TestsUtil.delete_all_tables(cls.dynamodb)
 
+    def test_get_article_info_ok(self):
+        article_info = DBUtil.get_article_info(self.dynamodb, self.article_info_table_items[0]['article_id'])
+        self.assertEqual(article_info, self.article_info_table_items[0])
+
+    def test_get_article_info_ok_with_request_cache(self):
+        request_cache = RequestCache()
+
+        DBUtil.validate_article_existence(
+            self.dynamodb,
+            self.article_info_table_items[2]['article_id'],
+            status='public',
+            request_cache=request_cache
+        )
+        DBUtil.validate_latest_price(
+            self.dynamodb,
+            self.article_info_table_items[2]['article_id'],
+            1 * (10 ** 18),
+            request_cache=request_cache
+        )
+        article_info = DBUtil.get_article_info(
+            self.dynamodb,
+            self.article_info_table_items[2]['article_id'],
+            request_cache
+        )
+
+        self.assertEqual(article_info, self.article_info_table_items[2])
+        self.assertEqual(request_cache.get_stats(), {'hits': 2, 'misses': 1})
+
     def test_exists_article_ok(self):
         result = DBUtil.exists_article(
             self.dynamodb,
@@ -442,6 +473,36 @@ class TestDBUtil(TestCase):
                 self.comment_items[0]['comment_id']
             )
 
+    def test_validate_user_existence_in_thread_with_thread_user_ids(self):
+        thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, self.comment_items[0]['comment_id'])
+
+        with patch('db_util.DBUtil.get_thread_user_ids') as mock_get_thread_user_ids:
+            result = DBUtil.validate_user_existence_in_thread(
+                self.dynamodb,
+                self.comment_items[1]['user_id'],
+                self.comment_items[0]['comment_id'],
+                thread_user_ids=thread_user_ids
+            )
+            self.assertTrue(result)
+            # 取得済みのスレッドを利用し、再度読み込まないこと
+            self.assertFalse(mock_get_thread_user_ids.called)
+
+            with self.assertRaises(ValidationError):
+                DBUtil.validate_user_existence_in_thread(
+                    self.dynamodb,
+                    self.comment_items[2]['user_id'],
+                    self.comment_items[0]['comment_id'],
+                    thread_user_ids=thread_user_ids
+                )
+
+    def test_get_thread_user_ids(self):
+        result = DBUtil.get_thread_user_ids(self.dynamodb, self.comment_items[0]['comment_id'])
+
+        thread_user_ids = [
+            item['user_id'] for item in self.comment_items if item.get('parent_id') == self.comment_items[0]['comment_id']
+        ]
+        self.assertEqual(sorted(result), sorted(thread_user_ids + [self.comment_items[0]['user_id']]))
+
     def test_comment_existence_ok(self):
         result = DBUtil.comment_existence(
             self.dynamodb,
@@ -505,6 +566,112 @@ class TestDBUtil(TestCase):
                 'piyopiyo'
             )
 
+    def test_batch_get_articles_ok(self):
+        article_ids = ['testid000003', 'notexists001', 'testid000001', 'testid000002']
+
+        result = DBUtil.batch_get_articles(self.dynamodb, article_ids)
+
+        self.assertEqual(
+            result,
+            [self.article_info_table_items[2], self.article_info_table_items[0], self.article_info_table_items[1]]
+        )
+
+    def test_batch_get_articles_ok_with_filter_status(self):
+        article_ids = ['testid000003', 'testid000002', 'testid000001']
+
+        result = DBUtil.batch_get_articles(self.dynamodb, article_ids, filter_status='public')
+
+        self.assertEqual(result, [self.article_info_table_items[2], self.article_info_table_items[0]])
+
+    def test_batch_get_articles_ok_over_batch_get_max(self):
+        article_ids = ['notexists' + str(i).zfill(3) for i in range(settings.DYNAMO_BATCH_GET_MAX + 50)]
+        article_ids.append('testid000001')
+
+        result = DBUtil.batch_get_articles(self.dynamodb, article_ids)
+
+        self.assertEqual(result, [self.article_info_table_items[0]])
+
+    def test_batch_get_articles_ok_empty(self):
+        self.assertEqual(DBUtil.batch_get_articles(self.dynamodb, []), [])
+
+    @patch('time.sleep', MagicMock())
+    def test_batch_get_articles_ok_with_unprocessed_keys(self):
+        table_name = os.environ['ARTICLE_INFO_TABLE_NAME']
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item.side_effect = [
+            {
+                'Responses': {table_name: [self.article_info_table_items[1]]},
+                'UnprocessedKeys': {table_name: {'Keys': [{'article_id': 'testid000001'}]}}
+            },
+            {
+                'Responses': {table_name: [self.article_info_table_items[0]]},
+                'UnprocessedKeys': {}
+            }
+        ]
+
+        result = DBUtil.batch_get_articles(dynamodb, ['testid000001', 'testid000002'])
+
+        self.assertEqual(result, [self.article_info_table_items[0], self.article_info_table_items[1]])
+        self.assertEqual(dynamodb.batch_get_item.call_count, 2)
+        self.assertEqual(
+            dynamodb.batch_get_item.call_args_list[1][1]['RequestItems'],
+            {table_name: {'Keys': [{'article_id': 'testid000001'}]}}
+        )
+
+    @patch('time.sleep', MagicMock())
+    def test_batch_get_articles_ng_unprocessed_keys_remain(self):
+        table_name = os.environ['ARTICLE_INFO_TABLE_NAME']
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item.return_value = {
+            'Responses': {table_name: []},
+            'UnprocessedKeys': {table_name: {'Keys': [{'article_id': 'testid000001'}]}}
+        }
+
+        with self.assertRaises(Exception):
+            DBUtil.batch_get_articles(dynamodb, ['testid000001'])
+
+        self.assertEqual(dynamodb.batch_get_item.call_count, settings.DYNAMO_BATCH_GET_RETRY_MAX_COUNT + 1)
+
+    def test_query_in_parallel_ok(self):
+        query_params_list = [
+            {
+                'IndexName': 'parent_id-sort_key-index',
+                'KeyConditionExpression': Key('parent_id').eq(parent_id)
+            }
+            for parent_id in ['comment00003', 'comment00002', 'comment00001']
+        ]
+
+        result = DBUtil.query_in_parallel(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], query_params_list)
+
+        # 問い合わせ条件の順序で結果が返却されること
+        self.assertEqual(result, [[self.comment_items[3]], [], [self.comment_items[1]]])
+
+    def test_query_in_parallel_ok_empty(self):
+        self.assertEqual(DBUtil.query_in_parallel(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], []), [])
+
+    def test_count_in_parallel_ok(self):
+        query_params_list = [
+            {
+                'IndexName': 'parent_id-sort_key-index',
+                'KeyConditionExpression': Key('parent_id').eq(parent_id)
+            }
+            for parent_id in ['comment00003', 'comment00002', 'comment00001']
+        ]
+
+        result = DBUtil.count_in_parallel(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], query_params_list)
+
+        self.assertEqual(result, [1, 0, 1])
+
+    def test_count_in_parallel_ok_empty(self):
+        self.assertEqual(DBUtil.count_in_parallel(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], []), [])
+
+    def test_batch_get_items_ok(self):
+        keys = [{'article_id': 'testid000002'}, {'article_id': 'testid000001'}, {'article_id': 'testid999999'}]
+
+        result = DBUtil.batch_get_items(self.dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], keys)
+
+        self.assertEqual(sorted([item['article_id'] for item in result]), ['testid000001', 'testid000002'])
+
     def test_items_values_empty_to_none_ok(self):
         values = {
             'test': 'test',
@@ -540,6 +707,110 @@ class TestDBUtil(TestCase):
 
         self.assertEqual(len(response), 4)
 
+    def test_scan_all_items_with_limit(self):
+        article_pv_user_table = self.dynamodb.Table(os.environ['ARTICLE_PV_USER_TABLE_NAME'])
+        # query_all_items と同じく、LastEvaluatedKey が付与される場合を Limit で代用している
+        scan_params = {
+            'FilterExpression': Attr('target_date').eq('2018-05-01'),
+            'Limit': 1
+        }
+
+        response = DBUtil.scan_all_items(article_pv_user_table, scan_params)
+
+        self.assertEqual(len(response), 4)
+        # 呼び出し元の scan_params は変更しない
+        self.assertNotIn('ExclusiveStartKey', scan_params)
+
+    def test_iterate_query_items(self):
+        article_pv_user_table = self.dynamodb.Table(os.environ['ARTICLE_PV_USER_TABLE_NAME'])
+        query_params = {
+            'IndexName': 'target_date-sort_key-index',
+            'KeyConditionExpression': Key('target_date').eq('2018-05-01'),
+            'ProjectionExpression': 'article_id',
+            'Limit': 1
+        }
+
+        items = DBUtil.iterate_query_items(article_pv_user_table, query_params)
+
+        self.assertNotIsInstance(items, list)
+        items = list(items)
+        self.assertEqual(len(items), 4)
+        self.assertEqual(set(items[0].keys()), {'article_id'})
+        # 呼び出し元の query_params は変更しない
+        self.assertNotIn('ExclusiveStartKey', query_params)
+
+    def test_iterate_query_items_with_max_items(self):
+        article_pv_user_table = self.dynamodb.Table(os.environ['ARTICLE_PV_USER_TABLE_NAME'])
+        article_pv_user_table.query = MagicMock(wraps=article_pv_user_table.query)
+        query_params = {
+            'IndexName': 'target_date-sort_key-index',
+            'KeyConditionExpression': Key('target_date').eq('2018-05-01')
+        }
+
+        items = list(DBUtil.iterate_query_items(article_pv_user_table, query_params, max_items=3))
+
+        self.assertEqual(len(items), 3)
+        # 上限件数を超えて読み込まない
+        self.assertEqual(article_pv_user_table.query.call_count, 1)
+        self.assertEqual(article_pv_user_table.query.call_args[1]['Limit'], 3)
+        self.assertNotIn('Limit', query_params)
+
+    def test_iterate_query_items_stop_early(self):
+        article_pv_user_table = self.dynamodb.Table(os.environ['ARTICLE_PV_USER_TABLE_NAME'])
+        article_pv_user_table.query = MagicMock(wraps=article_pv_user_table.query)
+        query_params = {
+            'IndexName': 'target_date-sort_key-index',
+            'KeyConditionExpression': Key('target_date').eq('2018-05-01'),
+            'Limit': 1
+        }
+
+        items = DBUtil.iterate_query_items(article_pv_user_table, query_params)
+        next(items)
+        next(items)
+
+        # 読み込んだ分のページのみ問い合わせる
+        self.assertEqual(article_pv_user_table.query.call_count, 2)
+
+    def test_iterate_scan_items_with_max_items(self):
+        article_pv_user_table = self.dynamodb.Table(os.environ['ARTICLE_PV_USER_TABLE_NAME'])
+        scan_params = {
+            'FilterExpression': Attr('target_date').eq('2018-05-01'),
+            'Limit': 1
+        }
+
+        items = list(DBUtil.iterate_scan_items(article_pv_user_table, scan_params, max_items=2))
+
+        self.assertEqual(len(items), 2)
+        self.assertTrue(all(item['target_date'] == '2018-05-01' for item in items))
+
+    def test_iterate_scan_items_in_parallel(self):
+        scan_params = {
+            'FilterExpression': Attr('target_date').eq('2018-05-01'),
+            'Limit': 1
+        }
+
+        items = DBUtil.iterate_scan_items_in_parallel(self.dynamodb, os.environ['ARTICLE_PV_USER_TABLE_NAME'],
+                                                      scan_params, total_segments=3)
+
+        # 各セグメントの結果は重複せず、合わせるとテーブル全体となる
+        keys = [(item['article_id'], item['user_id']) for item in items]
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(len(set(keys)), 4)
+
+    def test_iterate_scan_items_in_parallel_stop_early(self):
+        items = DBUtil.iterate_scan_items_in_parallel(self.dynamodb, os.environ['ARTICLE_PV_USER_TABLE_NAME'],
+                                                      {'Limit': 1}, total_segments=3)
+
+        next(items)
+        # 途中で読み込みを止めた場合も、各セグメントのスレッドが終了する
+        items.close()
+
+    def test_iterate_scan_items_in_parallel_with_error(self):
+        items = DBUtil.iterate_scan_items_in_parallel(self.dynamodb, 'NotExistTable', total_segments=2)
+
+        with self.assertRaises(ClientError):
+            list(items)
+
     def test_validate_topic_ok(self):
         self.assertTrue(DBUtil.validate_topic(self.dynamodb, 'crypto'))
 
@@ -547,6 +818,18 @@ class TestDBUtil(TestCase):
         with self.assertRaises(ValidationError):
             DBUtil.validate_topic(self.dynamodb, 'BTC')
 
+    def test_get_topics_ok_with_cache(self):
+        topics = DBUtil.get_topics(self.dynamodb)
+        topic_table = self.dynamodb.Table(os.environ['TOPIC_TABLE_NAME'])
+        topic_table.put_item(Item={'name': 'game', 'order': 4, 'index_hash_key': settings.TOPIC_INDEX_HASH_KEY})
+
+        # キャッシュの有効期限内は追加されたトピックは反映されない
+        self.assertEqual(DBUtil.get_topics(self.dynamodb), topics)
+        self.assertEqual(len(DBUtil.get_topics(self.dynamodb, bypass_cache=True)), len(topics) + 1)
+
+        topic_table.delete_item(Key={'name': 'game'})
+        DBUtil.get_topics(self.dynamodb, bypass_cache=True)
+
     def test_validate_latest_price_ok(self):
         price = 1 * (10 ** 18)
         self.assertTrue(DBUtil.validate_latest_price(self.dynamodb, 'testid000003', price))
@@ -0,0 +1,58 @@
+import os
+import settings
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from es_client import ESClient, LazyElasticsearch
+
+
+class TestESClient(TestCase):
+    def setUp(self):
+        os.environ['AWS_ACCESS_KEY_ID'] = 'test'
+        os.environ['AWS_SECRET_ACCESS_KEY'] = 'test'
+        os.environ['AWS_REGION'] = 'ap-northeast-1'
+        os.environ['AWS_SESSION_TOKEN'] = 'token'
+        os.environ['ELASTIC_SEARCH_ENDPOINT'] = 'localhost'
+        ESClient.clear()
+
+    def tearDown(self):
+        ESClient.clear()
+
+    def test_get_client_ok(self):
+        client = ESClient.get_client()
+
+        connection = client.transport.connection_pool.connections[0]
+        self.assertEqual(connection.host, 'https://localhost:443')
+        self.assertEqual(connection.timeout, settings.ES_TIMEOUT)
+        self.assertEqual(connection.session.auth.session_token, 'token')
+        self.assertEqual(connection.session.get_adapter('https://localhost')._pool_maxsize, settings.ES_POOL_MAX_SIZE)
+        self.assertEqual(client.transport.max_retries, settings.ES_MAX_RETRIES)
+        self.assertTrue(client.transport.retry_on_timeout)
+        self.assertIsNotNone(ESClient.construction_time)
+
+    def test_get_client_ok_reuse(self):
+        client = ESClient.get_client()
+
+        self.assertIs(ESClient.get_client(), client)
+
+    def test_get_client_ok_session_token_rotated(self):
+        client = ESClient.get_client()
+        os.environ['AWS_SESSION_TOKEN'] = 'rotated_token'
+
+        new_client = ESClient.get_client()
+
+        self.assertIsNot(new_client, client)
+        connection = new_client.transport.connection_pool.connections[0]
+        self.assertEqual(connection.session.auth.session_token, 'rotated_token')
+
+    def test_lazy_elasticsearch_ok(self):
+        elasticsearch = LazyElasticsearch()
+
+        # 属性にアクセスするまでクライアントは生成されない
+        self.assertIsNone(ESClient.client)
+
+        with patch('es_client.ESClient.get_client') as mock_get_client:
+            mock_get_client.return_value.search = MagicMock(return_value={'hits': {'hits': []}})
+            result = elasticsearch.search(index='articles', body={})
+
+        self.assertEqual(result, {'hits': {'hits': []}})
+        mock_get_client.return_value.search.assert_called_once_with(index='articles', body={})
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from elasticsearch import Elasticsearch
+from jsonschema import ValidationError
 from tests_es_util import TestsEsUtil
 
 from es_util import ESUtil
@@ -45,7 +46,42 @@ class TestDBUtil(TestCase):
         self.assertEquals(len(result), 2)
         self.assertEquals([tag['name'] for tag in result], ['A8', 'A7'])
 
+    def test_search_tag_with_cursor(self):
+        for x in range(0, 11):
+            TestsEsUtil.create_tag_with_count(self.elasticsearch, 'A' + str(x), x % 3)
+
+        tags = []
+        cursor = ''
+        while cursor is not None:
+            result = ESUtil.search_tag(self.elasticsearch, 'A', 4, 1, cursor=cursor)
+            tags.extend([tag['name'] for tag in result])
+            cursor = ESUtil.get_next_cursor(result, 4, ESUtil.TAG_SORT_FIELDS)
+
+        # count が重複するタグも取得漏れ、重複なく取得できること
+        self.assertEqual(tags, [tag['name'] for tag in ESUtil.search_tag(self.elasticsearch, 'A', 20, 1)])
+        self.assertEqual(len(tags), 11)
+
     def __assert_search_tags(self, word, expected):
         result = ESUtil.search_tag(self.elasticsearch, word, 10, 1)
         tags = [tag['name'] for tag in result]
         self.assertEquals(tags, expected)
+
+
+class TestESUtilCursor(TestCase):
+    # cursor のエンコード、デコードのみのため、Elasticsearch を起動せずに実行できるよう分ける
+    def test_get_next_cursor(self):
+        items = [{'sort_key': 2, 'article_id': 'b'}, {'sort_key': 1, 'article_id': 'a'}]
+
+        cursor = ESUtil.get_next_cursor(items, 2, ESUtil.RECENT_ARTICLES_SORT_FIELDS)
+        self.assertEqual(ESUtil.decode_cursor(cursor), [1, 'a'])
+
+        hits = [{'_source': {}, 'sort': [1.5, 'user01']}]
+        self.assertEqual(ESUtil.decode_cursor(ESUtil.get_next_cursor(hits, 1)), [1.5, 'user01'])
+
+        # 取得件数が limit 未満の場合は次のページが存在しない
+        self.assertIsNone(ESUtil.get_next_cursor(items, 3, ESUtil.RECENT_ARTICLES_SORT_FIELDS))
+
+    def test_decode_cursor_invalid(self):
+        for cursor in ['ALIS', 'e30=', 'W10=']:
+            with self.assertRaises(ValidationError):
+                ESUtil.decode_cursor(cursor)
@@ -0,0 +1,77 @@
+import base64
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from jsonschema import ValidationError
+from PIL import Image
+
+from image_util import ImageUtil
+
+
+class TestImageUtil(TestCase):
+    @staticmethod
+    def create_image_data(size, image_format, mode='RGB'):
+        buf = BytesIO()
+        Image.new(mode, size).save(buf, format=image_format)
+        return buf.getvalue()
+
+    def test_decode_base64_image_ok(self):
+        for image_format in ['jpeg', 'png', 'gif']:
+            image_data = self.create_image_data((100, 50), image_format)
+
+            with patch('PIL.ImageFile.ImageFile.load') as mock_load:
+                result_data, result_image = ImageUtil.decode_base64_image(base64.b64encode(image_data).decode('ascii'))
+                # 検証時はヘッダのみを読み込み、ピクセルデータはデコードしないこと
+                self.assertFalse(mock_load.called)
+
+            self.assertEqual(result_data, image_data)
+            self.assertEqual(result_image.size, (100, 50))
+            self.assertEqual(result_image.format, image_format.upper())
+
+    def test_decode_base64_image_ng_not_image_format(self):
+        for base64_image_data in [base64.b64encode(b'a' * 1024).decode('ascii'), 'not base64 !']:
+            with self.assertRaises(ValidationError):
+                ImageUtil.decode_base64_image(base64_image_data)
+
+    def test_shrink_ok_jpeg_with_draft(self):
+        image = Image.open(BytesIO(self.create_image_data((4000, 3000), 'jpeg')))
+
+        with patch('PIL.Image.Image.thumbnail', wraps=image.thumbnail) as mock_thumbnail:
+            ImageUtil.shrink(image, 800, 800)
+            # draft により 1/4 のサイズでデコードされた状態から縮小されること
+            self.assertEqual(image.size, (800, 600))
+            self.assertEqual(mock_thumbnail.call_count, 1)
+
+        self.assertEqual(image.decoderconfig, (4, 0))
+
+    def test_shrink_ok_png(self):
+        image = Image.open(BytesIO(self.create_image_data((400, 300), 'png')))
+
+        ImageUtil.shrink(image, 200.5, 200.5)
+
+        self.assertEqual(image.size, (200, 150))
+
+    def test_crop_center_ok(self):
+        image = Image.new('RGB', (300, 240))
+
+        self.assertEqual(ImageUtil.crop_center(image, 240, 240).size, (240, 240))
+
+    def test_get_fitted_image_data_ok_not_over_size(self):
+        image_data = self.create_image_data((200, 100), 'png')
+        image = Image.open(BytesIO(image_data))
+
+        # 再エンコードせず、受け取ったバイト列をそのまま返却すること
+        self.assertIs(ImageUtil.get_fitted_image_data(image_data, image, 200, 100, 'png'), image_data)
+
+    def test_get_fitted_image_data_ok_over_size(self):
+        for image_format in ['jpeg', 'png', 'gif']:
+            image_data = self.create_image_data((401, 200), image_format)
+            image = Image.open(BytesIO(image_data))
+
+            body = ImageUtil.get_fitted_image_data(image_data, image, 200, 200, image_format)
+
+            self.assertEqual(body.tell(), 0)
+            saved_image = Image.open(body)
+            self.assertEqual(saved_image.format, image_format.upper())
+            self.assertEqual(saved_image.size, (200, 100))
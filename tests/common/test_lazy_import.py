@@ -0,0 +1,44 @@
+import sys
+from unittest import TestCase
+from unittest.mock import MagicMock
+from lazy_import import LazyModule
+
+
+class TestLazyModule(TestCase):
+    def setUp(self):
+        sys.modules.pop('colorsys', None)
+
+    def test_getattr_ok(self):
+        colorsys = LazyModule('colorsys')
+
+        # 属性にアクセスするまで import されない
+        self.assertFalse(colorsys.is_loaded())
+        self.assertNotIn('colorsys', sys.modules)
+
+        self.assertEqual(colorsys.rgb_to_hsv(0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+        self.assertTrue(colorsys.is_loaded())
+        self.assertIn('colorsys', sys.modules)
+
+    def test_getattr_ok_on_load(self):
+        on_load = MagicMock()
+        colorsys = LazyModule('colorsys', on_load=on_load)
+
+        colorsys.rgb_to_hsv(0.0, 0.0, 0.0)
+        colorsys.hsv_to_rgb(0.0, 0.0, 0.0)
+
+        # on_load は初回の import 時に1度のみ実行される
+        on_load.assert_called_once_with(sys.modules['colorsys'])
+
+    def test_getattr_ng_module_not_found(self):
+        not_exists = LazyModule('not_exists_module')
+
+        with self.assertRaises(ImportError):
+            not_exists.test
+
+        self.assertFalse(not_exists.is_loaded())
+
+    def test_getattr_ng_attribute_not_found(self):
+        colorsys = LazyModule('colorsys')
+
+        with self.assertRaises(AttributeError):
+            colorsys.not_exists_attribute
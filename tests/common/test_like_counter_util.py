@@ -0,0 +1,68 @@
+import os
+from unittest import TestCase
+from like_counter_util import LikeCounterUtil
+from tests_util import TestsUtil
+
+
+class TestLikeCounterUtil(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        like_counter_items = [
+            {
+                'counter_id': 'article_like-testid000001',
+                'counter_type': 'article_like',
+                'target_id': 'testid000001',
+                'count': 3
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['LIKE_COUNTER_TABLE_NAME'], like_counter_items)
+        self.like_counter_table = self.dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_increment_ok(self):
+        self.assertEqual(LikeCounterUtil.increment(self.dynamodb, 'article_like', 'testid000001'), 4)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000001'), 4)
+
+    def test_increment_ok_not_exists(self):
+        self.assertEqual(LikeCounterUtil.increment(self.dynamodb, 'comment_like', 'comment00001'), 1)
+
+        like_counter = self.like_counter_table.get_item(Key={'counter_id': 'comment_like-comment00001'})['Item']
+        self.assertEqual(like_counter, {
+            'counter_id': 'comment_like-comment00001',
+            'counter_type': 'comment_like',
+            'target_id': 'comment00001',
+            'count': 1
+        })
+
+    def test_get_count_ok(self):
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000001'), 3)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000002'), 0)
+        # 種別が異なる場合は別のカウンタとして扱う
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'comment_like', 'testid000001'), 0)
+
+    def test_update_count_ok(self):
+        self.assertTrue(LikeCounterUtil.update_count(self.dynamodb, 'article_like', 'testid000001', 1, 3))
+        self.assertTrue(LikeCounterUtil.update_count(self.dynamodb, 'article_like', 'testid000002', 5))
+
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000001'), 1)
+        self.assertEqual(self.like_counter_table.get_item(Key={'counter_id': 'article_like-testid000002'})['Item'], {
+            'counter_id': 'article_like-testid000002',
+            'counter_type': 'article_like',
+            'target_id': 'testid000002',
+            'count': 5
+        })
+
+    def test_update_count_ok_changed_after_read(self):
+        # 読み込んだ時点から加算されている場合、存在しなかったカウンタが作成されている場合は更新しない
+        self.assertFalse(LikeCounterUtil.update_count(self.dynamodb, 'article_like', 'testid000001', 1, 2))
+        LikeCounterUtil.increment(self.dynamodb, 'article_like', 'testid000002')
+        self.assertFalse(LikeCounterUtil.update_count(self.dynamodb, 'article_like', 'testid000002', 5))
+
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000001'), 3)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000002'), 1)
@@ -1,4 +1,5 @@
 import os
+import time
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -113,3 +114,142 @@ class TestNotificationUtil(TestCase):
         ]
 
         self.assertEqual(after, expected_unread_manager)
+
+    @patch('time_util.TimeUtil.generate_sort_key', MagicMock(return_value=1520150552000003))
+    @patch('time.time', MagicMock(return_value=1520150552.000003))
+    def test_notify_article_comments(self):
+        comment = {
+            'comment_id': 'comment_id',
+            'user_id': 'comment_user01'
+        }
+
+        article_info = {
+            'article_id': 'ARTICLEID01',
+            'user_id': 'article_user01',
+            'title': 'AAAAAAAAAAAAAAAA'
+        }
+
+        targets = [
+            ('target_user_id_{0:02d}'.format(i), settings.COMMENT_THREAD_NOTIFICATION_TYPE) for i in range(30)
+        ] + [('article_user01', settings.COMMENT_NOTIFICATION_TYPE)]
+
+        NotificationUtil.notify_article_comments(self.dynamodb, article_info, comment, targets)
+
+        notifications = self.notification_table.scan()['Items']
+        self.assertEqual(len(notifications), len(targets))
+
+        for target_user_id, comment_type in targets:
+            notification_id = '-'.join([comment_type, target_user_id, comment['comment_id']])
+
+            notification = self.notification_table.get_item(
+                Key={'notification_id': notification_id}
+            ).get('Item')
+
+            expected_notification = {
+                'notification_id': notification_id,
+                'user_id': target_user_id,
+                'article_id': article_info['article_id'],
+                'article_title': article_info['title'],
+                'article_user_id': article_info['user_id'],
+                'acted_user_id': comment['user_id'],
+                'sort_key': 1520150552000003,
+                'type': comment_type,
+                'created_at': 1520150552
+            }
+
+            self.assertEqual(notification, expected_notification)
+
+    def test_notify_article_comments_with_invalid_type(self):
+        comment = {
+            'comment_id': 'comment_id',
+            'user_id': 'comment_user01'
+        }
+
+        article_info = {
+            'article_id': 'ARTICLEID01',
+            'user_id': 'article_user01',
+            'title': 'AAAAAAAAAAAAAAAA'
+        }
+
+        targets = [('target_user_id', settings.COMMENT_THREAD_NOTIFICATION_TYPE), ('target_user_id', 'ALIS')]
+
+        with self.assertRaises(ValueError):
+            NotificationUtil.notify_article_comments(self.dynamodb, article_info, comment, targets)
+
+        # 不正な通知種別が含まれる場合は1件も書き込まない
+        self.assertEqual(self.notification_table.scan()['Items'], [])
+
+    def test_update_unread_notification_managers(self):
+        user_ids = [self.unread_notification_manager_items[0]['user_id']] + \
+            ['new_user_{0:02d}'.format(i) for i in range(30)]
+
+        NotificationUtil.update_unread_notification_managers(self.dynamodb, user_ids)
+
+        after = self.unread_notification_manager_table.scan()['Items']
+
+        self.assertEqual(len(after), len(user_ids))
+        for user_id in user_ids:
+            self.assertEqual(
+                self.unread_notification_manager_table.get_item(Key={'user_id': user_id}).get('Item'),
+                {'user_id': user_id, 'unread': True}
+            )
+
+    def test_update_unread_notification_manager_skip_already_unread(self):
+        NotificationUtil.update_unread_notification_manager(self.dynamodb, 'new_user')
+        stats_before = NotificationUtil.get_unread_notification_manager_stats()
+
+        # 既に未読の場合は条件付き更新が不一致となり、書き込まずに False を返却する
+        result = NotificationUtil.update_unread_notification_manager(self.dynamodb, 'new_user')
+
+        stats_after = NotificationUtil.get_unread_notification_manager_stats()
+        self.assertFalse(result)
+        self.assertEqual(stats_after['written'] - stats_before['written'], 0)
+        self.assertEqual(stats_after['already_unread'] - stats_before['already_unread'], 1)
+        self.assertEqual(
+            self.unread_notification_manager_table.get_item(Key={'user_id': 'new_user'}).get('Item'),
+            {'user_id': 'new_user', 'unread': True}
+        )
+
+    def test_update_unread_notification_manager_with_use_cache(self):
+        user_id = self.unread_notification_manager_items[0]['user_id']
+        stats_before = NotificationUtil.get_unread_notification_manager_stats()
+
+        self.assertTrue(NotificationUtil.update_unread_notification_manager(self.dynamodb, user_id, use_cache=True))
+
+        # 既読にされた場合でも、キャッシュの有効期限内は DynamoDB へ問い合わせない
+        self.unread_notification_manager_table.put_item(Item={'user_id': user_id, 'unread': False})
+        with patch('notification_util.DBUtil') as mock_db_util:
+            self.assertFalse(NotificationUtil.update_unread_notification_manager(self.dynamodb, user_id, use_cache=True))
+            self.assertEqual(NotificationUtil.update_unread_notification_managers(self.dynamodb, [user_id], use_cache=True), [])
+            self.assertFalse(mock_db_util.batch_get_items.called)
+        self.assertFalse(self.unread_notification_manager_table.get_item(Key={'user_id': user_id})['Item']['unread'])
+
+        stats_after = NotificationUtil.get_unread_notification_manager_stats()
+        self.assertEqual(stats_after['written'] - stats_before['written'], 1)
+        self.assertEqual(stats_after['cached'] - stats_before['cached'], 2)
+
+        # キャッシュの有効期限を過ぎた場合は再度未読扱いに更新する
+        with patch('ttl_cache.time.time', return_value=time.time() + settings.UNREAD_NOTIFICATION_MANAGER_CACHE_TTL):
+            self.assertTrue(NotificationUtil.update_unread_notification_manager(self.dynamodb, user_id, use_cache=True))
+        self.assertTrue(self.unread_notification_manager_table.get_item(Key={'user_id': user_id})['Item']['unread'])
+
+    def test_update_unread_notification_managers_skip_already_unread(self):
+        self.unread_notification_manager_table.put_item(Item={'user_id': 'unread_user', 'unread': True})
+        stats_before = NotificationUtil.get_unread_notification_manager_stats()
+
+        with patch.object(self.dynamodb, 'Table', wraps=self.dynamodb.Table) as mock_table:
+            result = NotificationUtil.update_unread_notification_managers(
+                self.dynamodb,
+                ['unread_user', self.unread_notification_manager_items[0]['user_id'], 'new_user', 'new_user']
+            )
+            self.assertEqual(mock_table.call_count, 1)
+
+        stats_after = NotificationUtil.get_unread_notification_manager_stats()
+        self.assertEqual(result, [self.unread_notification_manager_items[0]['user_id'], 'new_user'])
+        self.assertEqual(stats_after['written'] - stats_before['written'], 2)
+        self.assertEqual(stats_after['already_unread'] - stats_before['already_unread'], 1)
+        for user_id in ['unread_user', self.unread_notification_manager_items[0]['user_id'], 'new_user']:
+            self.assertEqual(
+                self.unread_notification_manager_table.get_item(Key={'user_id': user_id}).get('Item'),
+                {'user_id': user_id, 'unread': True}
+            )
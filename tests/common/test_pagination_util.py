@@ -0,0 +1,88 @@
+import os
+from unittest import TestCase
+from unittest.mock import MagicMock
+from boto3.dynamodb.conditions import Key, Attr
+from pagination_util import PaginationUtil
+from tests_util import TestsUtil
+
+
+class TestPaginationUtil(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        # 下書きが多く、公開記事が少ないユーザー(sort_key の降順で、公開記事は 10, 30, 31, 32 件目)
+        article_info_items = [
+            {
+                'article_id': 'testid' + str(i).zfill(6),
+                'user_id': 'test01',
+                'status': 'public' if i in [90, 70, 69, 68] else 'draft',
+                'sort_key': 1520150272000000 + i
+            }
+            for i in range(100)
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], article_info_items)
+
+        self.article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
+        self.article_info_table.query = MagicMock(wraps=self.article_info_table.query)
+        self.query_params = {
+            'IndexName': 'user_id-sort_key-index',
+            'KeyConditionExpression': Key('user_id').eq('test01'),
+            'FilterExpression': Attr('status').eq('public'),
+            'ScanIndexForward': False
+        }
+        self.key_names = ['user_id', 'article_id', 'sort_key']
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_query_filtered_page_ok(self):
+        response = PaginationUtil.query_filtered_page(self.article_info_table, self.query_params, 2, self.key_names)
+
+        self.assertEqual([item['article_id'] for item in response['Items']], ['testid000090', 'testid000070'])
+        self.assertEqual(response['LastEvaluatedKey'], {
+            'user_id': 'test01',
+            'article_id': 'testid000070',
+            'sort_key': 1520150272000070
+        })
+        # Count は返却件数、ScannedCount は全ての query の読み込み件数の合計とする
+        self.assertEqual(response['Count'], 2)
+        self.assertEqual(response['ScannedCount'], 40)
+        self.assertIn('ResponseMetadata', response)
+        # 呼び出し元の query_params は変更しない
+        self.assertNotIn('Limit', self.query_params)
+
+    def test_query_filtered_page_ok_adaptive_page_size(self):
+        PaginationUtil.query_filtered_page(self.article_info_table, self.query_params, 2, self.key_names)
+
+        # Limit を固定した場合は 16回の query が必要となるが、読み込み件数を増やすことで問い合わせ回数を抑える
+        # 条件に合う項目が無い間は一定の割合で増やし、以降は条件に合った比率(10件中1件)から見積もる
+        limits = [kwargs['Limit'] for _, kwargs in self.article_info_table.query.call_args_list]
+        self.assertEqual(limits, [2, 8, 10, 20])
+
+    def test_query_filtered_page_ok_next_page(self):
+        response = PaginationUtil.query_filtered_page(self.article_info_table, self.query_params, 2, self.key_names)
+        query_params = dict(self.query_params, ExclusiveStartKey=response['LastEvaluatedKey'])
+
+        response = PaginationUtil.query_filtered_page(self.article_info_table, query_params, 2, self.key_names)
+
+        self.assertEqual([item['article_id'] for item in response['Items']], ['testid000069', 'testid000068'])
+        self.assertEqual(response['LastEvaluatedKey']['article_id'], 'testid000068')
+
+        query_params = dict(self.query_params, ExclusiveStartKey=response['LastEvaluatedKey'])
+
+        response = PaginationUtil.query_filtered_page(self.article_info_table, query_params, 2, self.key_names)
+
+        # 続きが存在しない場合は LastEvaluatedKey を返却しない
+        self.assertEqual(response['Items'], [])
+        self.assertNotIn('LastEvaluatedKey', response)
+
+    def test_query_filtered_page_ok_less_than_limit(self):
+        response = PaginationUtil.query_filtered_page(self.article_info_table, self.query_params, 10, self.key_names)
+
+        self.assertEqual(len(response['Items']), 4)
+        self.assertEqual(response['Count'], 4)
+        self.assertEqual(response['ScannedCount'], 100)
+        self.assertNotIn('LastEvaluatedKey', response)
@@ -0,0 +1,162 @@
+import os
+import json
+import requests
+import settings
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from private_chain_client import PrivateChainClient
+from private_chain_stub_server import PrivateChainStubServer
+
+
+class TestPrivateChainClient(TestCase):
+    def setUp(self):
+        os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'] = 'test'
+        os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'] = 'test'
+        os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] = 'test'
+        PrivateChainClient.session = None
+        PrivateChainClient.auth = None
+        PrivateChainClient.reset_metrics()
+
+    def tearDown(self):
+        PrivateChainClient.session = None
+        PrivateChainClient.reset_metrics()
+
+    def test_post_ok(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(return_value=PrivateChainApiFakeResponse(200, '{"result": "0x01"}'))
+
+        response = PrivateChainClient.post('wallet/balance', payload='{}', headers={'content-type': 'application/json'})
+
+        self.assertEqual(response.text, '{"result": "0x01"}')
+        args, kwargs = session.post.call_args
+        self.assertEqual(args[0], 'https://test/production/wallet/balance')
+        self.assertEqual(kwargs['data'], '{}')
+        self.assertEqual(kwargs['headers'], {'content-type': 'application/json'})
+        self.assertEqual(kwargs['timeout'],
+                         (settings.PRIVATE_CHAIN_CONNECT_TIMEOUT, settings.PRIVATE_CHAIN_READ_TIMEOUT))
+        self.assertEqual(PrivateChainClient.get_metrics()['wallet/balance']['count'], 1)
+        self.assertEqual(PrivateChainClient.get_metrics()['wallet/balance']['errors'], 0)
+
+    def test_post_ok_reuse_session_and_auth(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(return_value=PrivateChainApiFakeResponse(200, '{"result": "0x01"}'))
+
+        PrivateChainClient.post('wallet/balance')
+        PrivateChainClient.post('transaction/receipt')
+
+        self.assertIs(PrivateChainClient.get_session(), session)
+        self.assertIs(session.post.call_args_list[0][1]['auth'], session.post.call_args_list[1][1]['auth'])
+
+    def test_get_auth_ok_env_changed(self):
+        auth = PrivateChainClient.get_auth()
+        os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] = 'test2'
+
+        self.assertIsNot(PrivateChainClient.get_auth(), auth)
+
+    @patch('time.sleep', MagicMock())
+    def test_post_ok_retry_server_error(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(side_effect=[
+            PrivateChainApiFakeResponse(502),
+            PrivateChainApiFakeResponse(503),
+            PrivateChainApiFakeResponse(200, '{"result": "0x01"}')
+        ])
+
+        response = PrivateChainClient.post('transaction/receipt')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session.post.call_count, 3)
+        metrics = PrivateChainClient.get_metrics()['transaction/receipt']
+        self.assertEqual(metrics['count'], 3)
+        self.assertEqual(metrics['errors'], 2)
+        self.assertEqual(metrics['retries'], 2)
+
+    @patch('time.sleep', MagicMock())
+    def test_post_ok_retry_connection_error(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(side_effect=[
+            requests.exceptions.ConnectionError(),
+            PrivateChainApiFakeResponse(200, '{"result": "0x01"}')
+        ])
+
+        response = PrivateChainClient.post('wallet/balance')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session.post.call_count, 2)
+
+    @patch('time.sleep', MagicMock())
+    def test_post_ok_retry_exceeded(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(return_value=PrivateChainApiFakeResponse(500))
+
+        response = PrivateChainClient.post('transaction/receipt')
+
+        # リトライ回数を超えた場合は最後のレスポンスを返却し、判定は呼び出し元に委ねる
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(session.post.call_count, settings.PRIVATE_CHAIN_RETRY_MAX_COUNT + 1)
+
+    @patch('time.sleep', MagicMock())
+    def test_post_ng_retry_exceeded_connection_error(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(side_effect=requests.exceptions.Timeout())
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            PrivateChainClient.post('wallet/balance')
+
+        self.assertEqual(session.post.call_count, settings.PRIVATE_CHAIN_RETRY_MAX_COUNT + 1)
+
+    def test_post_ok_not_retry_transaction(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(return_value=PrivateChainApiFakeResponse(502))
+
+        # トランザクションを発行するエンドポイントは二重実行を避けるためリトライしない
+        response = PrivateChainClient.post('wallet/tip')
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(session.post.call_count, 1)
+
+    def test_get_transaction_receipts_ok(self):
+        private_chain = PrivateChainStubServer()
+        private_chain.start()
+        try:
+            private_chain.set_receipt('0x01', result={'logs': [{'type': 'mined'}]})
+            private_chain.set_receipt('0x02', error={'code': -32600, 'message': 'Invalid request'})
+
+            with patch('private_chain_client.PrivateChainClient.get_base_url',
+                       MagicMock(return_value=private_chain.url)):
+                receipts = PrivateChainClient.get_transaction_receipts(
+                    ['0x01', '0x02', '0x03', '0x01'],
+                    headers={'content-type': 'application/json'}
+                )
+        finally:
+            private_chain.stop()
+
+        self.assertEqual(list(receipts.keys()), ['0x01', '0x02', '0x03'])
+        self.assertEqual(json.loads(receipts['0x01'].text)['result'], {'logs': [{'type': 'mined'}]})
+        self.assertEqual(json.loads(receipts['0x02'].text)['error']['message'], 'Invalid request')
+        self.assertIsNone(json.loads(receipts['0x03'].text)['result'])
+        # 重複したトランザクションハッシュは1度のみ問い合わせる
+        self.assertEqual(len(private_chain.get_requests('transaction/receipt')), 3)
+        self.assertEqual(PrivateChainClient.get_metrics()['transaction/receipt']['count'], 3)
+
+    def test_get_transaction_receipts_ok_with_error(self):
+        session = PrivateChainClient.get_session()
+        session.post = MagicMock(side_effect=[
+            PrivateChainApiFakeResponse(200, '{"result": null}'),
+            ValueError('invalid payload')
+        ])
+
+        receipts = PrivateChainClient.get_transaction_receipts(['0x01', '0x02'], max_workers=1)
+
+        # 個別のリクエストで発生した例外は、他のリクエストの結果に影響しない
+        self.assertEqual(receipts['0x01'].status_code, 200)
+        self.assertIsInstance(receipts['0x02'], ValueError)
+
+    def test_get_transaction_receipts_ok_empty(self):
+        self.assertEqual(PrivateChainClient.get_transaction_receipts([]), {})
+
+
+class PrivateChainApiFakeResponse:
+    def __init__(self, status_code, text=''):
+        self.status_code = status_code
+        self.text = text
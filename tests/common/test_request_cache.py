@@ -0,0 +1,68 @@
+import os
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from request_cache import RequestCache
+from tests_util import TestsUtil
+
+
+class TestRequestCache(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    @classmethod
+    def setUpClass(cls):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(cls.dynamodb)
+
+        article_info_items = [
+            {
+                'article_id': 'testid000001',
+                'status': 'public',
+                'user_id': 'user0001',
+                'sort_key': 1520150272000000
+            }
+        ]
+        TestsUtil.create_table(cls.dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], article_info_items)
+
+    @classmethod
+    def tearDownClass(cls):
+        TestsUtil.delete_all_tables(cls.dynamodb)
+
+    def test_get_item_ok(self):
+        request_cache = RequestCache()
+        table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
+
+        item = request_cache.get_item(table, {'article_id': 'testid000001'})
+
+        self.assertEqual(item['user_id'], 'user0001')
+        self.assertEqual(request_cache.get_stats(), {'hits': 0, 'misses': 1})
+
+    def test_get_item_ok_fetch_only_once(self):
+        request_cache = RequestCache()
+        table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
+        table.get_item = MagicMock(return_value={'Item': {'article_id': 'testid000001'}})
+
+        first = request_cache.get_item(table, {'article_id': 'testid000001'})
+        second = request_cache.get_item(table, {'article_id': 'testid000001'})
+
+        self.assertIs(first, second)
+        self.assertEqual(table.get_item.call_count, 1)
+        self.assertEqual(request_cache.get_stats(), {'hits': 1, 'misses': 1})
+
+    def test_get_item_ok_not_exists(self):
+        request_cache = RequestCache()
+        table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
+
+        self.assertIsNone(request_cache.get_item(table, {'article_id': 'notexists001'}))
+        self.assertIsNone(request_cache.get_item(table, {'article_id': 'notexists001'}))
+        self.assertEqual(request_cache.get_stats(), {'hits': 1, 'misses': 1})
+
+    def test_invalidate_ok(self):
+        request_cache = RequestCache()
+        table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
+
+        request_cache.get_item(table, {'article_id': 'testid000001'})
+        request_cache.invalidate(table.name, {'article_id': 'testid000001'})
+        request_cache.get_item(table, {'article_id': 'testid000001'})
+
+        self.assertEqual(request_cache.get_stats(), {'hits': 0, 'misses': 2})
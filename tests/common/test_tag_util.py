@@ -1,11 +1,13 @@
 from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
 from elasticsearch import Elasticsearch
 from jsonschema import ValidationError
 from tests_es_util import TestsEsUtil
 
 from tag_util import TagUtil
+from es_util import ESUtil
 from tests_util import TestsUtil
 
 
@@ -22,37 +24,37 @@ class TestTagUtil(TestCase):
 
     def tearDown(self):
         TestsUtil.delete_all_tables(self.dynamodb)
+        TestsEsUtil.delete_alias(self.elasticsearch, 'tags')
         self.elasticsearch.indices.delete(index="tags", ignore=[404])
 
-    def test_create_and_count_ok(self):
+    def test_create_tags_ok(self):
         TagUtil.create_tag(self.elasticsearch, 'A')
-        TagUtil.update_count(self.elasticsearch, 'A', 1)
         TagUtil.create_tag(self.elasticsearch, 'B')
-
-        # count: 0 のTagを作成する
-        TagUtil.create_tag(self.elasticsearch, 'F')
-        TagUtil.update_count(self.elasticsearch, 'F', -1)
         self.elasticsearch.indices.refresh(index="tags")
 
-        before_tag_names = ['A', 'B', 'C', 'F']
-        after_tag_names = ['A', 'D', 'E']
-
-        TagUtil.create_and_count(self.elasticsearch, before_tag_names, after_tag_names)
-
+        elasticsearch = MagicMock(wraps=self.elasticsearch)
+        TagUtil.create_tags(elasticsearch, ['a', 'B', 'D', 'E', 'd'])
         self.elasticsearch.indices.refresh(index="tags")
 
+        # タグ数に関わらず、存在チェック(msearch)と作成(bulk)の2回のリクエストとなること
+        self.assertEqual(elasticsearch.msearch.call_count, 1)
+        self.assertEqual(elasticsearch.bulk.call_count, 1)
+        self.assertFalse(elasticsearch.search.called)
+        self.assertFalse(elasticsearch.index.called)
+
         tags = TestsEsUtil.get_all_tags(self.elasticsearch)
 
+        # 既存のタグのカウントは更新せず、存在しないタグのみ作成する(大文字小文字のみ異なるタグは1件のみ)
         expected = [
             {
                 'name': 'A',
                 'name_with_analyzer': 'A',
-                'count': Decimal('2'),
+                'count': Decimal('1'),
             },
             {
                 'name': 'B',
                 'name_with_analyzer': 'B',
-                'count': Decimal('0'),
+                'count': Decimal('1'),
             },
             {
                 'name': 'D',
@@ -64,11 +66,6 @@ class TestTagUtil(TestCase):
                 'name_with_analyzer': 'E',
                 'count': Decimal('1'),
             },
-            {
-                'name': 'F',
-                'name_with_analyzer': 'F',
-                'count': Decimal('0'),
-            },
         ]
 
         for tag in tags:
@@ -78,87 +75,110 @@ class TestTagUtil(TestCase):
 
         self.assertEqual(tags, expected)
 
-    def test_create_and_count_with_null_before_tag_names(self):
-        TagUtil.create_tag(self.elasticsearch, 'A')
-        TagUtil.create_tag(self.elasticsearch, 'B')
-        self.elasticsearch.indices.refresh(index="tags")
+    def test_create_tags_ok_with_resolved_tags(self):
+        TagUtil.create_tag(self.elasticsearch, 'aaa')
+        self.elasticsearch.indices.refresh(index='tags')
 
-        before_tag_names = None
-        after_tag_names = ['a', 'D', 'E']
+        tags = TagUtil.get_items_case_insensitive(self.elasticsearch, ['AAA', 'BBB'])
 
-        TagUtil.create_and_count(self.elasticsearch, before_tag_names, after_tag_names)
-        self.elasticsearch.indices.refresh(index="tags")
+        elasticsearch = MagicMock(wraps=self.elasticsearch)
+        TagUtil.create_tags(elasticsearch, ['AAA', 'BBB'], tags=tags)
+        self.elasticsearch.indices.refresh(index='tags')
 
-        tags = TestsEsUtil.get_all_tags(self.elasticsearch)
+        # 取得済みのタグは再度問い合わせないこと
+        self.assertFalse(elasticsearch.msearch.called)
+        tags = {tag['name']: tag['count'] for tag in TestsEsUtil.get_all_tags(self.elasticsearch)}
+        self.assertEqual(tags, {'aaa': 1, 'BBB': 1})
 
-        expected = [
-            {
-                'name': 'A',
-                'name_with_analyzer': 'A',
-                'count': Decimal('2'),
-            },
-            {
-                'name': 'B',
-                'name_with_analyzer': 'B',
-                'count': Decimal('1'),
-            },
-            {
-                'name': 'D',
-                'name_with_analyzer': 'D',
-                'count': Decimal('1'),
-            },
-            {
-                'name': 'E',
-                'name_with_analyzer': 'E',
-                'count': Decimal('1'),
-            },
-        ]
+    def test_create_tags_with_null_tag_names(self):
+        elasticsearch = MagicMock()
 
-        for tag in tags:
-            del tag['created_at']
+        TagUtil.create_tags(elasticsearch, None)
+        TagUtil.create_tags(elasticsearch, [])
 
-        tags = sorted(tags, key=lambda t: t['name'])
+        self.assertFalse(elasticsearch.msearch.called)
+        self.assertFalse(elasticsearch.bulk.called)
 
-        self.assertEqual(tags, expected)
+    def test_create_tags_ok_already_exists(self):
+        elasticsearch = MagicMock()
+        elasticsearch.bulk.return_value = {
+            'errors': True,
+            'items': [{'create': {'_id': 'A', 'status': 409, 'error': {'type': 'version_conflict_engine_exception'}}}]
+        }
+
+        # 並行して作成されたタグはエラーとしない
+        TagUtil.create_tags(elasticsearch, ['A'], tags={'A': None})
 
-    def test_create_and_count_with_null_after_tag_names(self):
+        elasticsearch.bulk.return_value = {
+            'errors': True,
+            'items': [{'create': {'_id': 'A', 'status': 400, 'error': {'type': 'mapper_parsing_exception'}}}]
+        }
+
+        with self.assertRaises(Exception):
+            TagUtil.create_tags(elasticsearch, ['A'], tags={'A': None})
+
+    def test_rebuild_tag_index_ok(self):
+        TestsEsUtil.create_articles_index(self.elasticsearch)
+        articles = [
+            {'article_id': 'article1', 'tags': ['A', 'b']},
+            {'article_id': 'article2', 'tags': ['a', 'C']},
+            {'article_id': 'article3', 'tags': ['A', 'new tag']},
+            {'article_id': 'article4'}
+        ]
+        for article in articles:
+            self.elasticsearch.index(index='articles', doc_type='article', id=article['article_id'], body=article)
+        self.elasticsearch.indices.refresh(index='articles')
+
+        # カウントがずれているタグ、記事に設定されていないタグ
         TagUtil.create_tag(self.elasticsearch, 'A')
         TagUtil.create_tag(self.elasticsearch, 'B')
-        TagUtil.create_tag(self.elasticsearch, 'E')
-        self.elasticsearch.indices.refresh(index="tags")
+        TagUtil.create_tag(self.elasticsearch, 'C')
+        TagUtil.create_tag(self.elasticsearch, 'D')
+        self.elasticsearch.update(index='tags', doc_type='tag', id='C',
+                                  body={'doc': {'count': 10, 'created_at': 1520150272}})
+        self.elasticsearch.indices.refresh(index='tags')
 
-        before_tag_names = ['A', 'b', 'C']
-        after_tag_names = None
+        result = TagUtil.rebuild_tag_index(self.elasticsearch)
+        self.assertEqual(result['tag_count'], 5)
 
-        TagUtil.create_and_count(self.elasticsearch, before_tag_names, after_tag_names)
-        self.elasticsearch.indices.refresh(index="tags")
+        # tags はエイリアスとして新しいインデックスを参照する
+        self.assertEqual(list(self.elasticsearch.indices.get_alias(name='tags').keys()), [result['index']])
 
-        tags = TestsEsUtil.get_all_tags(self.elasticsearch)
+        tags = {tag['name']: tag for tag in TestsEsUtil.get_all_tags(self.elasticsearch)}
+        self.assertEqual({name: tag['count'] for name, tag in tags.items()},
+                         {'A': 3, 'B': 1, 'C': 1, 'D': 0, 'new tag': 1})
+        # 既存のタグは作成日時を引き継ぐ
+        self.assertEqual(tags['C']['created_at'], 1520150272)
 
-        expected = [
-            {
-                'name': 'A',
-                'name_with_analyzer': 'A',
-                'count': Decimal('0'),
-            },
-            {
-                'name': 'B',
-                'name_with_analyzer': 'B',
-                'count': Decimal('0'),
-            },
-            {
-                'name': 'E',
-                'name_with_analyzer': 'E',
-                'count': Decimal('1'),
-            },
-        ]
+        # 再度実行した場合は、古いインデックスを削除してエイリアスを切り替える
+        TagUtil.create_tag(self.elasticsearch, 'E')
+        self.elasticsearch.indices.refresh(index='tags')
+        second_result = TagUtil.rebuild_tag_index(self.elasticsearch)
 
-        for tag in tags:
-            del tag['created_at']
+        self.assertFalse(self.elasticsearch.indices.exists(index=result['index']))
+        self.assertEqual(list(self.elasticsearch.indices.get_alias(name='tags').keys()), [second_result['index']])
+        self.assertEqual(ESUtil.search_tag(self.elasticsearch, 'a', 1, 1)[0]['name'], 'A')
+        self.assertEqual(len(TestsEsUtil.get_all_tags(self.elasticsearch)), 6)
 
-        tags = sorted(tags, key=lambda t: t['name'])
+        TestsEsUtil.remove_articles_index(self.elasticsearch)
 
-        self.assertEqual(tags, expected)
+    def test_aggregate_tag_counts_ok(self):
+        TestsEsUtil.create_articles_index(self.elasticsearch)
+        for i in range(30):
+            article = {'article_id': 'article' + str(i), 'tags': ['tag' + str(i % 7), 'TAG' + str(i % 3)]}
+            self.elasticsearch.index(index='articles', doc_type='article', id=article['article_id'], body=article)
+        self.elasticsearch.indices.refresh(index='articles')
+
+        with patch('settings.TAG_COUNT_AGGREGATION_SIZE', 2):
+            counts = TagUtil.aggregate_tag_counts(self.elasticsearch)
+
+        # 大文字小文字のみ異なるタグは合算し、記事数の多い表記をタグ名とする
+        self.assertEqual(counts['tag0'], {'name': 'TAG0', 'count': 15})
+        self.assertEqual(counts['tag3'], {'name': 'tag3', 'count': 4})
+        self.assertEqual(counts['tag6'], {'name': 'tag6', 'count': 4})
+        self.assertEqual(len(counts), 7)
+
+        TestsEsUtil.remove_articles_index(self.elasticsearch)
 
     def test_validate_format(self):
         def expected_raise_error(args):
@@ -202,6 +222,34 @@ class TestTagUtil(TestCase):
 
         self.assertEquals(result, ['aaa', 'BbB', 'CCC', 'DDD'])
 
+    def test_get_items_case_insensitive(self):
+        TagUtil.create_tag(self.elasticsearch, 'aaa')
+        TagUtil.create_tag(self.elasticsearch, 'BbB')
+        self.elasticsearch.indices.refresh(index='tags')
+
+        result = TagUtil.get_items_case_insensitive(self.elasticsearch, ['AAA', 'bbb', 'CCC', 'AAA'])
+
+        self.assertEqual(list(result.keys()), ['AAA', 'bbb', 'CCC'])
+        self.assertEqual(result['AAA']['name'], 'aaa')
+        self.assertEqual(result['bbb']['name'], 'BbB')
+        self.assertIsNone(result['CCC'])
+
+    def test_get_items_case_insensitive_with_empty(self):
+        elasticsearch = MagicMock()
+
+        self.assertEqual(TagUtil.get_items_case_insensitive(elasticsearch, []), {})
+        self.assertEqual(TagUtil.get_items_case_insensitive(elasticsearch, None), {})
+        self.assertFalse(elasticsearch.msearch.called)
+
+    def test_get_tags_with_name_collation_with_resolved_tags(self):
+        elasticsearch = MagicMock()
+        tags = {'AAA': {'name': 'aaa', 'count': 1}, 'DDD': None}
+
+        result = TagUtil.get_tags_with_name_collation(elasticsearch, ['AAA', 'DDD'], tags=tags)
+
+        self.assertEqual(result, ['aaa', 'DDD'])
+        self.assertFalse(elasticsearch.msearch.called)
+
     def test_get_tags_with_name_collation_with_none(self):
         TagUtil.create_tag(self.elasticsearch, "aaa")
         TagUtil.create_tag(self.elasticsearch, "BbB")
@@ -0,0 +1,105 @@
+import os
+import time
+from unittest import TestCase
+from token_distribution_total_util import TokenDistributionTotalUtil
+from tests_util import TestsUtil
+
+
+class TestTokenDistributionTotalUtil(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        token_distribution_total_items = [
+            {
+                'user_id': 'user01',
+                'article': 6000000000000000000,
+                'like': 5000000000000000000,
+                'tip': 0,
+                'bonus': 0
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'],
+                               token_distribution_total_items)
+        self.token_distribution_total_table = self.dynamodb.Table(os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'])
+        TestsUtil.create_table(self.dynamodb, os.environ['TOKEN_DISTRIBUTION_APPLIED_RECORD_TABLE_NAME'], [])
+        self.token_distribution_applied_record_table = self.dynamodb.Table(
+            os.environ['TOKEN_DISTRIBUTION_APPLIED_RECORD_TABLE_NAME'])
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_add_ok(self):
+        result = TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {
+            'user01': {
+                'like': 1000000000000000000,
+                'tip': 10000000000000000000,
+                'article': 0
+            }
+        })
+
+        self.assertTrue(result)
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01'), {
+            'article': 6000000000000000000,
+            'like': 6000000000000000000,
+            'tip': 10000000000000000000,
+            'bonus': 0
+        })
+        applied_record = self.token_distribution_applied_record_table.get_item(Key={'event_id': 'event01'})['Item']
+        self.assertGreater(applied_record['expiration_time'], time.time())
+
+    def test_add_ok_subtract(self):
+        TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {'user01': {'article': -1000000000000000000}})
+
+        totals = TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01')
+        self.assertEqual(totals['article'], 5000000000000000000)
+
+    def test_add_ok_not_exists(self):
+        TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {'user02': {'bonus': 3000000000000000000}})
+
+        token_distribution_total = self.token_distribution_total_table.get_item(Key={'user_id': 'user02'})['Item']
+        self.assertEqual(token_distribution_total, {'user_id': 'user02', 'bonus': 3000000000000000000})
+
+    def test_add_ok_multiple_users(self):
+        TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {
+            'user01': {'article': -1000000000000000000},
+            'user02': {'article': 1000000000000000000}
+        })
+
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01')['article'], 5000000000000000000)
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user02')['article'], 1000000000000000000)
+
+    def test_add_ok_already_applied(self):
+        self.assertTrue(TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {'user01': {'like': 1}}))
+
+        # 同じレコードは再処理されても加算しない
+        self.assertFalse(TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {'user01': {'like': 1}}))
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01')['like'], 5000000000000000001)
+
+    def test_add_ok_no_quantities(self):
+        self.assertFalse(TokenDistributionTotalUtil.add(self.dynamodb, 'event01', {'user02': {'like': 0}}))
+
+        # 加算量が無い場合は更新しない
+        self.assertIsNone(self.token_distribution_total_table.get_item(Key={'user_id': 'user02'}).get('Item'))
+        self.assertIsNone(self.token_distribution_applied_record_table.get_item(Key={'event_id': 'event01'}).get('Item'))
+
+    def test_get_totals_ok_not_exists(self):
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user02'), {
+            'article': 0,
+            'like': 0,
+            'tip': 0,
+            'bonus': 0
+        })
+
+    def test_put_totals_ok(self):
+        TokenDistributionTotalUtil.put_totals(self.dynamodb, {
+            'user01': {'article': 1, 'like': 2, 'tip': 3, 'bonus': 4},
+            'user02': {'article': 0, 'like': 0, 'tip': 5, 'bonus': 0}
+        })
+
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01'),
+                         {'article': 1, 'like': 2, 'tip': 3, 'bonus': 4})
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user02'),
+                         {'article': 0, 'like': 0, 'tip': 5, 'bonus': 0})
@@ -0,0 +1,88 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from ttl_cache import TTLCache
+
+
+class TestTTLCache(TestCase):
+    def test_get_or_load_ok(self):
+        cache = TTLCache(ttl=60, max_size=10)
+        loader = MagicMock(return_value=['crypto'])
+
+        self.assertEqual(cache.get_or_load('topic', loader), ['crypto'])
+        self.assertEqual(cache.get_or_load('topic', loader), ['crypto'])
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'misses': 1, 'size': 1})
+
+    def test_get_or_load_ok_expired(self):
+        cache = TTLCache(ttl=60, max_size=10)
+        loader = MagicMock(side_effect=[['crypto'], ['crypto', 'food']])
+
+        with patch('ttl_cache.time.time', return_value=1000):
+            cache.get_or_load('topic', loader)
+        with patch('ttl_cache.time.time', return_value=1060):
+            self.assertEqual(cache.get_or_load('topic', loader), ['crypto', 'food'])
+
+        self.assertEqual(loader.call_count, 2)
+
+    def test_get_or_load_ok_with_bypass(self):
+        cache = TTLCache(ttl=60, max_size=10)
+        loader = MagicMock(side_effect=[['crypto'], ['crypto', 'food']])
+
+        cache.get_or_load('topic', loader)
+        self.assertEqual(cache.get_or_load('topic', loader, bypass=True), ['crypto', 'food'])
+        # bypass 時に取得した値でキャッシュが更新されていること
+        self.assertEqual(cache.get_or_load('topic', loader), ['crypto', 'food'])
+        self.assertEqual(loader.call_count, 2)
+
+    def test_exists_ok(self):
+        cache = TTLCache(ttl=60, max_size=10)
+
+        with patch('ttl_cache.time.time', return_value=1000):
+            cache.set('topic', ['crypto'])
+        with patch('ttl_cache.time.time', return_value=1059):
+            self.assertTrue(cache.exists('topic'))
+        with patch('ttl_cache.time.time', return_value=1060):
+            self.assertFalse(cache.exists('topic'))
+        self.assertFalse(cache.exists('tag'))
+        self.assertEqual(cache.get_stats(), {'hits': 0, 'misses': 0, 'size': 1})
+
+    def test_set_ok_evict_oldest_item(self):
+        cache = TTLCache(ttl=60, max_size=2)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+
+        self.assertIsNone(cache.get_age('a'))
+        self.assertEqual(list(cache.items.keys()), ['b', 'c'])
+
+    def test_get_age_ok(self):
+        cache = TTLCache(ttl=60, max_size=10)
+
+        with patch('ttl_cache.time.time', return_value=1000):
+            cache.set('topic', ['crypto'])
+        with patch('ttl_cache.time.time', return_value=1015):
+            self.assertEqual(cache.get_age('topic'), 15)
+
+    def test_invalidate_ok(self):
+        cache = TTLCache(ttl=60, max_size=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        cache.invalidate('a')
+        self.assertEqual(list(cache.items.keys()), ['b'])
+
+        cache.invalidate()
+        self.assertEqual(len(cache.items), 0)
+
+    def test_invalidate_all_ok(self):
+        cache_1 = TTLCache(ttl=60, max_size=10)
+        cache_2 = TTLCache(ttl=60, max_size=10)
+        cache_1.set('a', 1)
+        cache_2.set('b', 2)
+
+        TTLCache.invalidate_all()
+
+        self.assertEqual(len(cache_1.items), 0)
+        self.assertEqual(len(cache_2.items), 0)
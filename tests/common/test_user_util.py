@@ -355,12 +355,11 @@ class TestUserUtil(TestCase):
         os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'] = 'test'
         os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'] = 'test'
         os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] = 'test'
-        with patch('user_util.requests.post') as requests_mock, patch('user_util.AWSRequestsAuth') as aws_auth_mock:
+        with patch('user_util.PrivateChainClient.post') as requests_mock:
             requests_mock.return_value = PrivateChainApiFakeResponse(
                 status_code=200,
                 text='{"result":"my_address"}'
             )
-            aws_auth_mock.return_value = True
             self.cognito.admin_update_user_attributes = MagicMock(
                 return_value=True)
             UserUtil.wallet_initialization(
@@ -378,6 +377,7 @@ class TestUserUtil(TestCase):
                 UserPoolId='user_pool_id',
                 Username='user_id'
             )
+            requests_mock.assert_called_once_with('accounts/new')
 
     def test_add_user_profile_ok(self):
         self.dynamodb.Table = MagicMock()
@@ -0,0 +1,82 @@
+import os
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from article_infos_backfill import ArticleInfosBackfill
+from db_util import DBUtil
+from tests_util import TestsUtil
+
+
+class TestArticleInfosBackfill(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        article_info_items = [
+            {
+                'article_id': 'draftId00001',
+                'user_id': 'test01',
+                'status': 'draft',
+                'sort_key': 1520150272000000
+            },
+            {
+                'article_id': 'publicId0001',
+                'user_id': 'test01',
+                'status': 'public',
+                'sort_key': 1520150272000001
+            },
+            {
+                # 設定済み
+                'article_id': 'publicId0002',
+                'user_id': 'test02',
+                'status': 'public',
+                'user_id_status': 'test02#public',
+                'sort_key': 1520150272000002
+            },
+            {
+                # 設定済みの値とステータスが異なる
+                'article_id': 'publicId0003',
+                'user_id': 'test02',
+                'status': 'public',
+                'user_id_status': 'test02#draft',
+                'sort_key': 1520150272000003
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], article_info_items)
+        self.article_info_table = self.dynamodb.Table(os.environ['ARTICLE_INFO_TABLE_NAME'])
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_main_ok(self):
+        response = ArticleInfosBackfill({}, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'targets': 3, 'updated': 3})
+
+        user_id_statuses = {item['article_id']: item['user_id_status'] for item in self.article_info_table.scan()['Items']}
+        self.assertEqual(user_id_statuses, {
+            'draftId00001': 'test01#draft',
+            'publicId0001': 'test01#public',
+            'publicId0002': 'test02#public',
+            'publicId0003': 'test02#public'
+        })
+
+    def test_main_ok_status_changed(self):
+        article_infos = list(DBUtil.iterate_scan_items(self.article_info_table))
+        # scan 後、更新前に公開された場合を再現する
+        self.article_info_table.update_item(
+            Key={'article_id': 'draftId00001'},
+            UpdateExpression='set #status = :status, user_id_status = :user_id_status',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={':status': 'public', ':user_id_status': 'test01#public'}
+        )
+
+        with patch('article_infos_backfill.DBUtil.iterate_scan_items_in_parallel', return_value=iter(article_infos)):
+            response = ArticleInfosBackfill({}, {}, self.dynamodb).main()
+
+        self.assertEqual(json.loads(response['body']), {'targets': 3, 'updated': 2})
+        article_info = self.article_info_table.get_item(Key={'article_id': 'draftId00001'})['Item']
+        self.assertEqual(article_info['user_id_status'], 'test01#public')
@@ -0,0 +1,183 @@
+from unittest import TestCase
+from articles_counts_index import ArticlesCountsIndex
+from tests_util import TestsUtil
+import os
+import json
+
+
+class TestArticlesCountsIndex(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        article_info_items = [
+            {
+                'article_id': 'testid000001',
+                'status': 'public',
+                'sort_key': 1520150272000000
+            },
+            {
+                'article_id': 'testid000002',
+                'status': 'public',
+                'sort_key': 1520150272000001
+            },
+            {
+                'article_id': 'testid000003',
+                'status': 'draft',
+                'sort_key': 1520150272000002
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['ARTICLE_INFO_TABLE_NAME'], article_info_items)
+
+        article_alis_token_items = [
+            {
+                'article_id': 'testid000001',
+                'alis_token': 100,
+                'evaluated_at': 1520150272000000
+            },
+            {
+                'article_id': 'testid000001',
+                'alis_token': 80,
+                'evaluated_at': 1520150572000000
+            },
+            {
+                'article_id': 'testid000002',
+                'alis_token': 150,
+                'evaluated_at': 1520150572000000
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['ARTICLE_ALIS_TOKEN_TABLE_NAME'], article_alis_token_items)
+
+        self.article_evaluated_manage_items = [
+            {
+                'type': 'alistoken',
+                'active_evaluated_at': 1520150272000000
+            }
+        ]
+        TestsUtil.create_table(
+            self.dynamodb,
+            os.environ['ARTICLE_EVALUATED_MANAGE_TABLE_NAME'],
+            self.article_evaluated_manage_items
+        )
+
+        like_counter_items = [
+            {
+                'counter_id': 'article_like-testid000002',
+                'counter_type': 'article_like',
+                'target_id': 'testid000002',
+                'count': 3
+            },
+            {
+                'counter_id': 'article_like-testid000003',
+                'counter_type': 'article_like',
+                'target_id': 'testid000003',
+                'count': 1
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['LIKE_COUNTER_TABLE_NAME'], like_counter_items)
+
+        comment_items = [
+            {
+                'comment_id': 'comment00001',
+                'article_id': 'testid000001',
+                'user_id': 'test_user_01',
+                'sort_key': 1520150272000000,
+                'created_at': 1520150272,
+                'text': 'コメントの内容1'
+            },
+            {
+                'comment_id': 'comment00002',
+                'article_id': 'testid000001',
+                'user_id': 'test_user_02',
+                'parent_id': 'comment00001',
+                'sort_key': 1520150272000001,
+                'created_at': 1520150272,
+                'text': 'リプライの内容1'
+            },
+            {
+                'comment_id': 'comment00003',
+                'article_id': 'testid000003',
+                'user_id': 'test_user_01',
+                'sort_key': 1520150272000002,
+                'created_at': 1520150272,
+                'text': 'コメントの内容2'
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], comment_items)
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def assert_bad_request(self, params):
+        response = ArticlesCountsIndex(params, {}, self.dynamodb).main()
+        self.assertEqual(response['statusCode'], 400)
+
+    def test_main_ok(self):
+        params = {
+            'queryStringParameters': {
+                'article_ids': 'testid000002,testid000003,testid000001,testid000004'
+            }
+        }
+
+        response = ArticlesCountsIndex(params, {}, self.dynamodb).main()
+
+        # 公開中の記事のみを、指定された順序で返却する
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body'])['Items'], [
+            {
+                'article_id': 'testid000002',
+                'likes_count': 3,
+                'comments_count': 0,
+                'alis_token': 0
+            },
+            {
+                'article_id': 'testid000001',
+                'likes_count': 0,
+                'comments_count': 2,
+                'alis_token': 100
+            }
+        ])
+
+    def test_main_ok_without_article_evaluated_manage(self):
+        article_evaluated_manage_table = self.dynamodb.Table(os.environ['ARTICLE_EVALUATED_MANAGE_TABLE_NAME'])
+        article_evaluated_manage_table.delete_item(Key={'type': 'alistoken'})
+        params = {
+            'queryStringParameters': {
+                'article_ids': 'testid000001'
+            }
+        }
+
+        response = ArticlesCountsIndex(params, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body'])['Items'][0]['alis_token'], 0)
+
+    def test_main_ok_not_exists(self):
+        params = {
+            'queryStringParameters': {
+                'article_ids': 'testid000003,testid000004'
+            }
+        }
+
+        response = ArticlesCountsIndex(params, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body'])['Items'], [])
+
+    def test_validation_with_no_params(self):
+        self.assert_bad_request({})
+
+    def test_validation_article_ids_empty(self):
+        self.assert_bad_request({'queryStringParameters': {'article_ids': ''}})
+
+    def test_validation_article_id_min(self):
+        self.assert_bad_request({'queryStringParameters': {'article_ids': 'testid000001,' + 'A' * 11}})
+
+    def test_validation_article_ids_max(self):
+        article_ids = ['testid' + str(i).zfill(6) for i in range(101)]
+        self.assert_bad_request({'queryStringParameters': {'article_ids': ','.join(article_ids)}})
+
+    def test_validation_article_ids_unique(self):
+        self.assert_bad_request({'queryStringParameters': {'article_ids': 'testid000001,testid000001'}})
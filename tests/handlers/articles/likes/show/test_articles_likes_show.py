@@ -34,6 +34,23 @@ class TestArticlesLikesShow(TestCase):
         ]
         TestsUtil.create_table(cls.dynamodb, os.environ['ARTICLE_LIKED_USER_TABLE_NAME'], article_liked_user_items)
 
+        # create like_counter_table
+        like_counter_items = [
+            {
+                'counter_id': 'article_like-testidlike01',
+                'counter_type': 'article_like',
+                'target_id': 'testidlike01',
+                'count': 1
+            },
+            {
+                'counter_id': 'article_like-testidlike02',
+                'counter_type': 'article_like',
+                'target_id': 'testidlike02',
+                'count': 2
+            }
+        ]
+        TestsUtil.create_table(cls.dynamodb, os.environ['LIKE_COUNTER_TABLE_NAME'], like_counter_items)
+
         # create article_info_table
         article_info_table_items = [
             {
@@ -103,6 +103,39 @@ class TestArticlesRecent(TestCase):
         self.assertEqual(response['statusCode'], 200)
         self.assertEqual(json.loads(response['body'])['Items'], expected_items)
 
+    def test_main_ok_with_cursor(self):
+        params = {
+            'queryStringParameters': {
+                'limit': '10',
+                'cursor': ''
+            }
+        }
+
+        # cursor を辿って全件取得した結果が、page によるページングの結果と一致すること
+        cursor_items = []
+        for _ in range(5):
+            response = ArticlesRecent(params, {}, dynamodb=self.dynamodb, elasticsearch=self.elasticsearch).main()
+            self.assertEqual(response['statusCode'], 200)
+            body = json.loads(response['body'])
+            cursor_items.extend(body['Items'])
+            if body['Cursor'] is None:
+                break
+            params['queryStringParameters']['cursor'] = body['Cursor']
+
+        page_items = []
+        for page in range(1, 5):
+            params = {
+                'queryStringParameters': {
+                    'limit': '10',
+                    'page': str(page)
+                }
+            }
+            response = ArticlesRecent(params, {}, dynamodb=self.dynamodb, elasticsearch=self.elasticsearch).main()
+            page_items.extend(json.loads(response['body'])['Items'])
+
+        self.assertEqual(len(cursor_items), 33)
+        self.assertEqual(cursor_items, page_items)
+
     def test_main_ok_with_no_limit(self):
         params = {
             'queryStringParameters': None
@@ -203,6 +236,15 @@ class TestArticlesRecent(TestCase):
 
         self.assert_bad_request(params)
 
+    def test_validation_cursor_invalid(self):
+        params = {
+            'queryStringParameters': {
+                'cursor': 'ALIS'
+            }
+        }
+
+        self.assert_bad_request(params)
+
     def test_validation_limit_max(self):
         params = {
             'queryStringParameters': {
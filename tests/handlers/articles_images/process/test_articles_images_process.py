@@ -0,0 +1,138 @@
+import json
+import os
+from io import BytesIO
+from unittest import TestCase
+
+import boto3
+from PIL import Image
+
+import settings
+from articles_images_process import ArticlesImagesProcess
+from tests_util import TestsUtil
+
+
+class TestArticlesImagesProcess(TestCase):
+    s3 = boto3.resource('s3', endpoint_url='http://localhost:4572/')
+
+    @classmethod
+    def setUpClass(cls):
+        TestsUtil.set_all_s3_buckets_name_to_env()
+        TestsUtil.create_all_s3_buckets(cls.s3)
+        cls.bucket = cls.s3.Bucket(os.environ['DIST_S3_BUCKET_NAME'])
+
+    def setUp(self):
+        self.bucket.objects.all().delete()
+
+    @staticmethod
+    def create_event(bucket_name, keys):
+        # S3 の作成イベント(s3:ObjectCreated:Put)の形式
+        return {
+            'Records': [
+                {
+                    'eventSource': 'aws:s3',
+                    'eventName': 'ObjectCreated:Put',
+                    's3': {
+                        'bucket': {'name': bucket_name},
+                        'object': {'key': key}
+                    }
+                } for key in keys
+            ]
+        }
+
+    def put_image(self, key, size, image_format, metadata=None):
+        buf = BytesIO()
+        Image.new('RGB', size, (255, 0, 0)).save(buf, format=image_format)
+        self.bucket.put_object(Body=buf.getvalue(), Key=key, Metadata=metadata or {})
+
+    def get_image(self, key):
+        s3_object = self.bucket.Object(key).get()
+        return Image.open(BytesIO(s3_object['Body'].read())), s3_object
+
+    def get_keys(self):
+        return sorted(s3_object.key for s3_object in self.bucket.objects.all())
+
+    def test_main_ok_over_size_jpeg(self):
+        key = settings.S3_ARTICLES_IMAGES_PATH + 'user01/article01/uuid.jpeg'
+        self.put_image(key, (settings.ARTICLE_IMAGE_MAX_WIDTH * 2, settings.ARTICLE_IMAGE_MAX_HEIGHT * 3), 'jpeg')
+
+        event = self.create_event(self.bucket.name, [key])
+        response = ArticlesImagesProcess(event, {}, s3=self.s3).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'processed_keys': [key]})
+
+        # 上限サイズに縮小して上書きされること
+        image, s3_object = self.get_image(key)
+        self.assertEqual(image.size, (2560, settings.ARTICLE_IMAGE_MAX_HEIGHT))
+        self.assertEqual(s3_object['ContentType'], 'image/jpeg')
+        self.assertEqual(s3_object['Metadata'], {settings.ARTICLE_IMAGE_PROCESSED_METADATA_KEY: 'true'})
+
+        key_base = settings.S3_ARTICLES_IMAGES_DERIVATIVES_PATH + 'user01/article01/uuid'
+        expected_derivatives = {
+            key_base + '.webp': ((2560, 2160), 'WEBP', 'image/webp'),
+            key_base + '_1280.jpeg': ((1280, 1080), 'JPEG', 'image/jpeg'),
+            key_base + '_1280.webp': ((1280, 1080), 'WEBP', 'image/webp'),
+            key_base + '_640.jpeg': ((640, 540), 'JPEG', 'image/jpeg'),
+            key_base + '_640.webp': ((640, 540), 'WEBP', 'image/webp')
+        }
+        self.assertEqual(self.get_keys(), sorted([key] + list(expected_derivatives.keys())))
+        for derivative_key, (size, image_format, content_type) in expected_derivatives.items():
+            image, s3_object = self.get_image(derivative_key)
+            self.assertEqual(image.size, size)
+            self.assertEqual(image.format, image_format)
+            self.assertEqual(s3_object['ContentType'], content_type)
+
+    def test_main_ok_not_over_size_png(self):
+        key = settings.S3_ARTICLES_IMAGES_PATH + 'user01/article01/uuid.png'
+        self.put_image(key, (1000, 500), 'png')
+
+        response = ArticlesImagesProcess(self.create_event(self.bucket.name, [key]), {}, s3=self.s3).main()
+
+        self.assertEqual(response['statusCode'], 200)
+
+        # 上限サイズに収まる場合は上書きしないこと
+        image, s3_object = self.get_image(key)
+        self.assertEqual(image.size, (1000, 500))
+        self.assertEqual(s3_object['Metadata'], {})
+
+        # 画像の幅以上の派生画像は作成しないこと
+        key_base = settings.S3_ARTICLES_IMAGES_DERIVATIVES_PATH + 'user01/article01/uuid'
+        self.assertEqual(
+            self.get_keys(),
+            sorted([key, key_base + '.webp', key_base + '_640.png', key_base + '_640.webp'])
+        )
+        self.assertEqual(self.get_image(key_base + '_640.png')[0].size, (640, 320))
+
+    def test_main_ok_url_encoded_key(self):
+        key = settings.S3_ARTICLES_IMAGES_PATH + 'user01/article01/uuid 01.gif'
+        self.put_image(key, (800, 400), 'gif')
+
+        event = self.create_event(self.bucket.name, [key.replace(' ', '+')])
+        response = ArticlesImagesProcess(event, {}, s3=self.s3).main()
+
+        self.assertEqual(json.loads(response['body']), {'processed_keys': [key]})
+        self.assertEqual(
+            self.get_image(settings.S3_ARTICLES_IMAGES_DERIVATIVES_PATH + 'user01/article01/uuid 01_640.gif')[0].size,
+            (640, 320)
+        )
+
+    def test_main_ok_ignore_targets(self):
+        processed_key = settings.S3_ARTICLES_IMAGES_PATH + 'user01/article01/processed.jpeg'
+        self.put_image(processed_key, (1000, 500), 'jpeg', {settings.ARTICLE_IMAGE_PROCESSED_METADATA_KEY: 'true'})
+        other_path_key = settings.S3_INFO_ICON_PATH + 'user01/icon/uuid.png'
+        self.put_image(other_path_key, (1000, 500), 'png')
+        animated_key = settings.S3_ARTICLES_IMAGES_PATH + 'user01/article01/animated.gif'
+        buf = BytesIO()
+        frames = [Image.new('RGB', (1000, 500), color) for color in [(255, 0, 0), (0, 0, 255)]]
+        frames[0].save(buf, format='gif', save_all=True, append_images=frames[1:])
+        self.bucket.put_object(Body=buf.getvalue(), Key=animated_key)
+        not_image_key = settings.S3_ARTICLES_IMAGES_PATH + 'user01/article01/not_image.png'
+        self.bucket.put_object(Body=b'not image', Key=not_image_key)
+
+        keys = [processed_key, other_path_key, animated_key, not_image_key]
+        response = ArticlesImagesProcess(self.create_event(self.bucket.name, keys), {}, s3=self.s3).main()
+
+        # 処理済みの画像、対象外のパス、アニメーション GIF、画像以外のデータは処理しないこと
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'processed_keys': []})
+        self.assertEqual(self.get_keys(), sorted(keys))
@@ -0,0 +1,73 @@
+import os
+import json
+from unittest import TestCase
+from comment_liked_users_backfill import CommentLikedUsersBackfill
+from tests_util import TestsUtil
+
+
+class TestCommentLikedUsersBackfill(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        comment_items = [
+            {
+                'comment_id': 'comment00001',
+                'article_id': 'publicId0001',
+                'user_id': 'test_user_01',
+                'sort_key': 1520150272000000,
+                'created_at': 1520150272,
+                'text': 'コメントの内容1'
+            },
+            {
+                'comment_id': 'comment00002',
+                'article_id': 'publicId0002',
+                'user_id': 'test_user_01',
+                'sort_key': 1520150272000001,
+                'created_at': 1520150272,
+                'text': 'コメントの内容2'
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['COMMENT_TABLE_NAME'], comment_items)
+
+        comment_like_items = [
+            {
+                'comment_id': 'comment00001',
+                'user_id': 'like_user_01',
+                'created_at': 1520150272
+            },
+            {
+                'comment_id': 'comment00002',
+                'user_id': 'like_user_01',
+                'article_id': 'publicId0002',
+                'created_at': 1520150272
+            },
+            {
+                'comment_id': 'comment00003',
+                'user_id': 'like_user_01',
+                'created_at': 1520150272
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['COMMENT_LIKED_USER_TABLE_NAME'], comment_like_items)
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_main_ok(self):
+        response = CommentLikedUsersBackfill({}, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'targets': 2, 'updated': 1})
+
+        comment_liked_user_table = self.dynamodb.Table(os.environ['COMMENT_LIKED_USER_TABLE_NAME'])
+        liked_user = comment_liked_user_table.get_item(
+            Key={'comment_id': 'comment00001', 'user_id': 'like_user_01'}
+        )['Item']
+        self.assertEqual(liked_user['article_id'], 'publicId0001')
+        # コメントが存在しない場合は更新しない
+        liked_user = comment_liked_user_table.get_item(
+            Key={'comment_id': 'comment00003', 'user_id': 'like_user_01'}
+        )['Item']
+        self.assertNotIn('article_id', liked_user)
@@ -58,6 +58,22 @@ class TestCommentsLikesShow(TestCase):
         ]
         TestsUtil.create_table(cls.dynamodb, os.environ['COMMENT_LIKED_USER_TABLE_NAME'], comment_like_items)
 
+        like_counter_items = [
+            {
+                'counter_id': 'comment_like-comment00001',
+                'counter_type': 'comment_like',
+                'target_id': 'comment00001',
+                'count': 3
+            },
+            {
+                'counter_id': 'comment_like-comment11111',
+                'counter_type': 'comment_like',
+                'target_id': 'comment11111',
+                'count': 1
+            }
+        ]
+        TestsUtil.create_table(cls.dynamodb, os.environ['LIKE_COUNTER_TABLE_NAME'], like_counter_items)
+
     @classmethod
     def tearDownClass(self):
         TestsUtil.delete_all_tables(self.dynamodb)
@@ -0,0 +1,108 @@
+import os
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from db_util import DBUtil
+from like_counters_reconcile import LikeCountersReconcile
+from like_counter_util import LikeCounterUtil
+from tests_util import TestsUtil
+
+
+class TestLikeCountersReconcile(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        article_liked_user_items = [
+            {
+                'article_id': 'testid000001',
+                'user_id': 'test01',
+                'sort_key': 1520150272000000
+            },
+            {
+                'article_id': 'testid000001',
+                'user_id': 'test02',
+                'sort_key': 1520150272000001
+            },
+            {
+                'article_id': 'testid000002',
+                'user_id': 'test01',
+                'sort_key': 1520150272000002
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['ARTICLE_LIKED_USER_TABLE_NAME'], article_liked_user_items)
+
+        comment_liked_user_items = [
+            {
+                'comment_id': 'comment00001',
+                'user_id': 'test01',
+                'article_id': 'testid000001',
+                'created_at': 1520150272
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['COMMENT_LIKED_USER_TABLE_NAME'], comment_liked_user_items)
+
+        # 加算漏れ、いいねが存在しないカウンタ、正しいカウンタ
+        like_counter_items = [
+            {
+                'counter_id': 'article_like-testid000001',
+                'counter_type': 'article_like',
+                'target_id': 'testid000001',
+                'count': 1
+            },
+            {
+                'counter_id': 'article_like-testid000003',
+                'counter_type': 'article_like',
+                'target_id': 'testid000003',
+                'count': 2
+            },
+            {
+                'counter_id': 'comment_like-comment00001',
+                'counter_type': 'comment_like',
+                'target_id': 'comment00001',
+                'count': 1
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['LIKE_COUNTER_TABLE_NAME'], like_counter_items)
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_main_ok(self):
+        response = LikeCountersReconcile({}, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {
+            'article_like': {'targets': 2, 'updated': 3, 'skipped': 0},
+            'comment_like': {'targets': 1, 'updated': 0, 'skipped': 0}
+        })
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000001'), 2)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000002'), 1)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000003'), 0)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'comment_like', 'comment00001'), 1)
+
+    def test_main_ok_liked_while_counting(self):
+        iterate_scan_items_in_parallel = DBUtil.iterate_scan_items_in_parallel
+
+        def like_while_counting(dynamodb, table_name, scan_params):
+            items = list(iterate_scan_items_in_parallel(dynamodb, table_name, scan_params))
+            # 集計後にいいねが作成され、カウンタが加算された場合
+            if table_name == os.environ['ARTICLE_LIKED_USER_TABLE_NAME']:
+                self.dynamodb.Table(table_name).put_item(Item={
+                    'article_id': 'testid000001',
+                    'user_id': 'test03',
+                    'sort_key': 1520150272000003
+                })
+                LikeCounterUtil.increment(self.dynamodb, 'article_like', 'testid000001')
+            return items
+
+        with patch('db_util.DBUtil.iterate_scan_items_in_parallel', side_effect=like_while_counting):
+            response = LikeCountersReconcile({}, {}, self.dynamodb).main()
+
+        # 加算されたカウンタは集計結果で上書きしない
+        self.assertEqual(json.loads(response['body'])['article_like'], {'targets': 2, 'updated': 2, 'skipped': 1})
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000001'), 2)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000002'), 1)
+        self.assertEqual(LikeCounterUtil.get_count(self.dynamodb, 'article_like', 'testid000003'), 0)
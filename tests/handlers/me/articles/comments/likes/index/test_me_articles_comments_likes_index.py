@@ -3,6 +3,7 @@ import json
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+from db_util import DBUtil
 from me_articles_comments_likes_index import MeArticlesCommentsLikesIndex
 from tests_util import TestsUtil
 
@@ -130,6 +131,29 @@ class TestMeArticlesCommentsLikesIndex(TestCase):
         self.assertEqual(response['statusCode'], 200)
         self.assertEqual(sorted(json.loads(response['body'])['comment_ids']), sorted(expected_items))
 
+    def test_main_ok_query_only_my_likes(self):
+        params = {
+            'pathParameters': {
+                'article_id': 'publicId0001'
+            },
+            'requestContext': {
+                'authorizer': {
+                    'claims': {
+                        'cognito:username': 'like_user_01'
+                    }
+                }
+            }
+        }
+
+        with patch('me_articles_comments_likes_index.DBUtil.iterate_query_items',
+                   MagicMock(wraps=DBUtil.iterate_query_items)) as mock_iterate_query_items:
+            MeArticlesCommentsLikesIndex(event=params, context={}, dynamodb=self.dynamodb).main()
+
+        # 自身のいいねのみを article_id-user_id-index から取得する(他のユーザーのいいねは読み込まない)
+        args, _ = mock_iterate_query_items.call_args
+        self.assertEqual(args[1]['IndexName'], 'article_id-user_id-index')
+        self.assertEqual(len(args[0].query(**args[1])['Items']), 2)
+
     def test_main_with_no_likes(self):
         params = {
             'pathParameters': {
@@ -3,6 +3,7 @@ import os
 import json
 from unittest import TestCase
 from me_articles_comments_reply import MeArticlesCommentsReply
+from db_util import DBUtil
 from unittest.mock import patch, MagicMock
 from tests_util import TestsUtil
 
@@ -242,6 +243,44 @@ class TestMeArticlesCommentsReply(TestCase):
                 {'user_id': user_id, 'unread': True}
             )
 
+    @patch('me_articles_comments_reply.MeArticlesCommentsReply._MeArticlesCommentsReply__generate_comment_id',
+           MagicMock(return_value='HOGEHOGEHOGE'))
+    def test_main_ok_read_thread_once(self):
+        params = {
+            'pathParameters': {
+                'article_id': 'publicId0001'
+            },
+            'body': {
+                'text': 'A',
+                'parent_id': 'comment00001',
+                'replyed_user_id': 'commentuser02'
+            },
+            'requestContext': {
+                'authorizer': {
+                    'claims': {
+                        'cognito:username': 'test_user_id01',
+                        'phone_number_verified': 'true',
+                        'email_verified': 'true'
+                    }
+                }
+            }
+        }
+
+        params['body'] = json.dumps(params['body'])
+
+        # スレッドの読み込みは存在確認と通知対象の算出で1回のみ行われ、通知はまとめて書き込まれること
+        with patch('me_articles_comments_reply.DBUtil.get_thread_user_ids',
+                   MagicMock(wraps=DBUtil.get_thread_user_ids)) as mock_get_thread_user_ids, \
+                patch('me_articles_comments_reply.NotificationUtil.notify_article_comment') as mock_notify, \
+                patch('me_articles_comments_reply.NotificationUtil.update_unread_notification_manager') as mock_update:
+            response = MeArticlesCommentsReply(params, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(mock_get_thread_user_ids.call_count, 1)
+        self.assertFalse(mock_notify.called)
+        self.assertFalse(mock_update.called)
+        self.assertEqual(len(self.notification_table.scan()['Items']), 4)
+
     '''
     記事投稿者が自らスレッドに返信するケース
     返信先への通知 + スレッド通知が行われる
@@ -266,8 +305,9 @@ class TestMeArticlesCommentsReply(TestCase):
         notification_before = self.notification_table.scan()['Items']
         unread_notification_manager_before = self.unread_notification_manager_table.scan()['Items']
 
+        thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, params['parent_id'])
         me_articles_comments_reply._MeArticlesCommentsReply__create_comment_notifications(
-            article_info, comment)
+            article_info, comment, thread_user_ids)
 
         notification_after = self.notification_table.scan()['Items']
         unread_notification_manager_after = self.unread_notification_manager_table.scan()['Items']
@@ -312,8 +352,9 @@ class TestMeArticlesCommentsReply(TestCase):
         notification_before = self.notification_table.scan()['Items']
         unread_notification_manager_before = self.unread_notification_manager_table.scan()['Items']
 
+        thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, params['parent_id'])
         me_articles_comments_reply._MeArticlesCommentsReply__create_comment_notifications(
-            article_info, comment)
+            article_info, comment, thread_user_ids)
 
         notification_after = self.notification_table.scan()['Items']
         unread_notification_manager_after = self.unread_notification_manager_table.scan()['Items']
@@ -357,8 +398,9 @@ class TestMeArticlesCommentsReply(TestCase):
         notification_before = self.notification_table.scan()['Items']
         unread_notification_manager_before = self.unread_notification_manager_table.scan()['Items']
 
+        thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, params['parent_id'])
         me_articles_comments_reply._MeArticlesCommentsReply__create_comment_notifications(
-            article_info, comment)
+            article_info, comment, thread_user_ids)
 
         notification_after = self.notification_table.scan()['Items']
         unread_notification_manager_after = self.unread_notification_manager_table.scan()['Items']
@@ -398,8 +440,9 @@ class TestMeArticlesCommentsReply(TestCase):
         notification_before = self.notification_table.scan()['Items']
         unread_notification_manager_before = self.unread_notification_manager_table.scan()['Items']
 
+        thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, params['parent_id'])
         me_articles_comments_reply._MeArticlesCommentsReply__create_comment_notifications(
-            article_info, comment)
+            article_info, comment, thread_user_ids)
 
         notification_after = self.notification_table.scan()['Items']
         unread_notification_manager_after = self.unread_notification_manager_table.scan()['Items']
@@ -426,12 +469,12 @@ class TestMeArticlesCommentsReply(TestCase):
     def test___get_thread_notification_targets_ignore_value_errors(self):
         user_id = 'comment10001'
         replyed_user_id = 'articleuser01'
-        parent_id = 'comment00001'
+        thread_user_ids = DBUtil.get_thread_user_ids(self.dynamodb, 'comment00001')
         me_articles_comments_reply = MeArticlesCommentsReply({}, {}, self.dynamodb)
 
         try:
             me_articles_comments_reply._MeArticlesCommentsReply__get_thread_notification_targets(
-                user_id, replyed_user_id, parent_id)
+                user_id, replyed_user_id, thread_user_ids)
         except ValueError:
             self.fail('get_thread_notification_tagets() raised ValueError unexpectedly')
 
@@ -478,11 +521,12 @@ class TestMeArticlesCommentsReply(TestCase):
             self.assertEqual(args[0], self.dynamodb)
             self.assertEqual(args[1], 'commentuser02')
 
-            args, _ = mock_lib.validate_user_existence_in_thread.call_args
+            args, kwargs = mock_lib.validate_user_existence_in_thread.call_args
             self.assertTrue(mock_lib.validate_user_existence_in_thread.called)
             self.assertEqual(args[0], self.dynamodb)
             self.assertEqual(args[1], 'commentuser02')
             self.assertEqual(args[2], 'comment00001')
+            self.assertEqual(kwargs['thread_user_ids'], mock_lib.get_thread_user_ids.return_value)
 
     @patch('me_articles_comments_reply.MeArticlesCommentsReply._MeArticlesCommentsReply__create_comment_notifications',
            MagicMock(side_effect=Exception()))
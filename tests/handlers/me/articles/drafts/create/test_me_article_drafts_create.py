@@ -75,6 +75,8 @@ class TestMeArticlesDraftsCreate(TestCase):
 
         self.assertEqual(params['requestContext']['authorizer']['claims']['cognito:username'],
                          article_info_after[0]['user_id'])
+        self.assertEqual(article_info_after[0]['user_id_status'],
+                         params['requestContext']['authorizer']['claims']['cognito:username'] + '#draft')
 
         for key in article_info_param_names:
             self.assertEqual(json.loads(params['body'])[key], article_info_after[0][key])
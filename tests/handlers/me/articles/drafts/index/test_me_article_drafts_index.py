@@ -18,30 +18,35 @@ class TestMeArticlesDraftsIndex(TestCase):
                 'article_id': 'publicId0001',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000000
             },
             {
                 'article_id': 'testid000001',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000001
             },
             {
                 'article_id': 'testid000002',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000002
             },
             {
                 'article_id': 'testid000003',
                 'user_id': 'test_user_id2',
                 'status': 'draft',
+                'user_id_status': 'test_user_id2#draft',
                 'sort_key': 1520150272000003
             },
             {
                 'article_id': 'testid000004',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000004
             }
         ]
@@ -81,12 +86,14 @@ class TestMeArticlesDraftsIndex(TestCase):
                 'article_id': 'testid000004',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000004
             },
             {
                 'article_id': 'testid000002',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000002
             }
         ]
@@ -119,6 +126,7 @@ class TestMeArticlesDraftsIndex(TestCase):
                 'article_id': 'testid000001',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000001
             }
         ]
@@ -150,6 +158,7 @@ class TestMeArticlesDraftsIndex(TestCase):
                 'article_id': 'testid000001',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000001
             }
         ]
@@ -165,6 +174,7 @@ class TestMeArticlesDraftsIndex(TestCase):
                 'user_id': 'test_user_id',
                 'article_id': 'test_limit_number' + str(i),
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150273000000 + i
                 }
             )
@@ -199,6 +209,7 @@ class TestMeArticlesDraftsIndex(TestCase):
                 'user_id': 'public_test_user',
                 'article_id': 'test_limit_' + str(i),
                 'status': status,
+                'user_id_status': 'public_test_user#' + status,
                 'sort_key': 1520150273000000 + i
                 }
             )
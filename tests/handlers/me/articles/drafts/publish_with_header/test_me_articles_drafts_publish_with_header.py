@@ -191,6 +191,7 @@ class TestMeArticlesDraftsPublishWithHeader(TestCase):
         )['Items'][-1]
 
         self.assertEqual(article_info['status'], 'public')
+        self.assertEqual(article_info['user_id_status'], 'test01#public')
         self.assertEqual(article_info['sort_key'], 1520150552000000)
         self.assertEqual(article_info['published_at'], 1525000000)
         self.assertEqual(article_info['sync_elasticsearch'], 1)
@@ -304,8 +305,8 @@ class TestMeArticlesDraftsPublishWithHeader(TestCase):
         self.assertEqual(len(article_history_after) - len(article_history_before), 1)
         self.assertEqual(len(article_content_edit_after) - len(article_content_edit_before), 0)
 
-    @patch("me_articles_drafts_publish.TagUtil.create_and_count", MagicMock(side_effect=Exception()))
-    def test_create_and_count_raise_exception(self):
+    @patch("me_articles_drafts_publish.TagUtil.create_tags", MagicMock(side_effect=Exception()))
+    def test_create_tags_raise_exception(self):
         params = {
             'pathParameters': {
                 'article_id': 'draftId00001'
@@ -366,12 +367,11 @@ class TestMeArticlesDraftsPublishWithHeader(TestCase):
             args, _ = mock_lib.get_tags_with_name_collation.call_args
             self.assertEqual(args[1], ['A'])
 
-            self.assertTrue(mock_lib.create_and_count.called)
-            args, _ = mock_lib.create_and_count.call_args
+            self.assertTrue(mock_lib.create_tags.called)
+            args, _ = mock_lib.create_tags.call_args
 
             self.assertTrue(args[0])
-            self.assertEqual(args[1], ['a', 'b', 'c'])
-            self.assertEqual(args[2], ['A'])
+            self.assertEqual(args[1], ['A'])
 
     def test_call_validate_array_unique(self):
         params = {
@@ -47,6 +47,27 @@ class TestMeArticlesLikeCreate(TestCase):
             self.article_liked_user_table_items
         )
 
+        # create like_counter_table
+        self.like_counter_items = [
+            {
+                'counter_id': 'article_like-testid000000',
+                'counter_type': 'article_like',
+                'target_id': 'testid000000',
+                'count': 1
+            },
+            {
+                'counter_id': 'article_like-testid000002',
+                'counter_type': 'article_like',
+                'target_id': 'testid000002',
+                'count': 4
+            }
+        ]
+        TestsUtil.create_table(
+            self.dynamodb,
+            os.environ['LIKE_COUNTER_TABLE_NAME'],
+            self.like_counter_items
+        )
+
         # create article_info_table
         self.article_info_table_items = [
             {
@@ -170,6 +191,10 @@ class TestMeArticlesLikeCreate(TestCase):
         ).get('Item')
         self.assertEqual(unread_notification_manager['unread'], True)
 
+        like_counter_table = self.dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        like_counter = like_counter_table.get_item(Key={'counter_id': 'article_like-testid000000'}).get('Item')
+        self.assertEqual(like_counter['count'], 2)
+
     @patch('time.time', MagicMock(return_value=1520150272.000015))
     def test_create_notification_and_unread_notification_manager(self):
         params = {
@@ -330,6 +355,10 @@ class TestMeArticlesLikeCreate(TestCase):
         response = MeArticlesLikeCreate(event=params, context={}, dynamodb=self.dynamodb).main()
 
         self.assertEqual(response['statusCode'], 400)
+        # いいね済みの場合はカウンタを加算しない
+        like_counter_table = self.dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        like_counter = like_counter_table.get_item(Key={'counter_id': 'article_like-testid000000'}).get('Item')
+        self.assertEqual(like_counter['count'], 1)
 
     def test_validation_with_no_params(self):
         params = {}
@@ -18,18 +18,21 @@ class TestMeArticlesPublicIndex(TestCase):
                 'article_id': 'draftId00001',
                 'user_id': 'test_user_id',
                 'status': 'draft',
+                'user_id_status': 'test_user_id#draft',
                 'sort_key': 1520150272000000
             },
             {
                 'article_id': 'testid000001',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000001
             },
             {
                 'article_id': 'testid000002',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000002,
                 'price': 200
             },
@@ -37,12 +40,14 @@ class TestMeArticlesPublicIndex(TestCase):
                 'article_id': 'testid000003',
                 'user_id': 'test_user_id2',
                 'status': 'public',
+                'user_id_status': 'test_user_id2#public',
                 'sort_key': 1520150272000003
             },
             {
                 'article_id': 'testid000004',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000004
             }
         ]
@@ -82,12 +87,14 @@ class TestMeArticlesPublicIndex(TestCase):
                 'article_id': 'testid000004',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000004
             },
             {
                 'article_id': 'testid000002',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000002,
                 'price': 200
             }
@@ -121,6 +128,7 @@ class TestMeArticlesPublicIndex(TestCase):
                 'article_id': 'testid000001',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000001
             }
         ]
@@ -152,6 +160,7 @@ class TestMeArticlesPublicIndex(TestCase):
                 'article_id': 'testid000001',
                 'user_id': 'test_user_id',
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150272000001
             }
         ]
@@ -167,6 +176,7 @@ class TestMeArticlesPublicIndex(TestCase):
                 'user_id': 'test_user_id',
                 'article_id': 'test_limit_number' + str(i),
                 'status': 'public',
+                'user_id_status': 'test_user_id#public',
                 'sort_key': 1520150273000000 + i
                 }
             )
@@ -201,6 +211,7 @@ class TestMeArticlesPublicIndex(TestCase):
                 'user_id': 'draft_test_user',
                 'article_id': 'test_limit_' + str(i),
                 'status': status,
+                'user_id_status': 'draft_test_user#' + status,
                 'sort_key': 1520150273000000 + i
                 }
             )
@@ -99,6 +99,7 @@ class TestMeArticlesPublicUnpublish(TestCase):
 
         self.assertEqual(response['statusCode'], 200)
         self.assertEqual(article_info['status'], 'draft')
+        self.assertEqual(article_info['user_id_status'], 'test01#draft')
         self.assertEqual(article_info['sync_elasticsearch'], 1)
         self.assertEqual(len(article_info_after) - len(article_info_before), 0)
         self.assertEqual(len(article_content_edit_after) - len(article_content_edit_before), 0)
@@ -0,0 +1,103 @@
+import os
+import json
+from decimal import Decimal
+from unittest import TestCase
+from me_articles_purchase_status_show import MeArticlesPurchaseStatusShow
+from tests_util import TestsUtil
+
+
+class TestMeArticlesPurchaseStatusShow(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        paid_article_items = [
+            {
+                'user_id': 'purchaseuser001',
+                'article_user_id': 'author001',
+                'article_title': 'purchase001 titile',
+                'price': 100 * (10 ** 18),
+                'article_id': 'publicId0001',
+                'status': 'fail',
+                'purchase_transaction': '0x0000000000000000000000000000000000000000',
+                'sort_key': Decimal(1520150552000003),
+                'created_at': Decimal(int(1520150552.000003)),
+                'history_created_at': Decimal(1520150270)
+            },
+            {
+                'user_id': 'purchaseuser001',
+                'article_user_id': 'author001',
+                'article_title': 'purchase001 titile',
+                'price': 100 * (10 ** 18),
+                'article_id': 'publicId0001',
+                'status': 'doing',
+                'purchase_transaction': '0x0000000000000000000000000000000000000001',
+                'sort_key': Decimal(1520150552000010),
+                'created_at': Decimal(int(1520150552.000010)),
+                'history_created_at': Decimal(1520150270)
+            },
+            {
+                'user_id': 'purchaseuser002',
+                'article_user_id': 'author001',
+                'article_title': 'purchase001 titile',
+                'price': 100 * (10 ** 18),
+                'article_id': 'publicId0001',
+                'status': 'done',
+                'purchase_transaction': '0x0000000000000000000000000000000000000002',
+                'sort_key': Decimal(1520150552000005),
+                'created_at': Decimal(int(1520150552.000005)),
+                'history_created_at': Decimal(1520150270)
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['PAID_ARTICLES_TABLE_NAME'], paid_article_items)
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    @staticmethod
+    def create_event(article_id, user_id):
+        return {
+            'pathParameters': {
+                'article_id': article_id
+            },
+            'requestContext': {
+                'authorizer': {
+                    'claims': {
+                        'cognito:username': user_id
+                    }
+                }
+            }
+        }
+
+    def test_main_ok(self):
+        event = self.create_event('publicId0001', 'purchaseuser002')
+
+        response = MeArticlesPurchaseStatusShow(event, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'status': 'done'})
+
+    def test_main_ok_latest_status(self):
+        # 購入に失敗した後、再購入した場合は最新の購入状態を返却する
+        event = self.create_event('publicId0001', 'purchaseuser001')
+
+        response = MeArticlesPurchaseStatusShow(event, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'status': 'doing'})
+
+    def test_main_ng_not_purchased(self):
+        event = self.create_event('publicId0001', 'purchaseuser003')
+
+        response = MeArticlesPurchaseStatusShow(event, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 404)
+
+    def test_validation_article_id_max(self):
+        event = self.create_event('A' * 13, 'purchaseuser001')
+
+        response = MeArticlesPurchaseStatusShow(event, {}, self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 400)
@@ -54,6 +54,20 @@ class TestMeArticlesCommentsCreate(TestCase):
         ]
         TestsUtil.create_table(self.dynamodb, os.environ['COMMENT_LIKED_USER_TABLE_NAME'], comment_like_items)
 
+        self.like_counter_table = self.dynamodb.Table(os.environ['LIKE_COUNTER_TABLE_NAME'])
+        like_counter_items = [
+            {
+                'counter_id': 'comment_like-comment00002',
+                'counter_type': 'comment_like',
+                'target_id': 'comment00002',
+                'count': 1
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['LIKE_COUNTER_TABLE_NAME'], like_counter_items)
+
+    def get_like_count(self, comment_id):
+        return self.like_counter_table.get_item(Key={'counter_id': 'comment_like-' + comment_id})['Item']['count']
+
     def tearDown(self):
         TestsUtil.delete_all_tables(self.dynamodb)
 
@@ -96,6 +110,7 @@ class TestMeArticlesCommentsCreate(TestCase):
         self.assertEqual(len(comment_after) - len(comment_before), 1)
         self.assertIsNotNone(liked_user)
         self.assertEqual(liked_user['article_id'], self.article_info_items[0]['article_id'])
+        self.assertEqual(self.get_like_count('comment00001'), 1)
 
     def test_main_ok_already_liked_by_other_user(self):
         params = {
@@ -130,6 +145,7 @@ class TestMeArticlesCommentsCreate(TestCase):
         self.assertEqual(len(comment_after) - len(comment_before), 1)
         self.assertIsNotNone(liked_user)
         self.assertEqual(liked_user['article_id'], self.article_info_items[0]['article_id'])
+        self.assertEqual(self.get_like_count('comment00002'), 2)
 
     def test_main_ok_already_liked_by_myself(self):
         params = {
@@ -164,6 +180,37 @@ class TestMeArticlesCommentsCreate(TestCase):
         self.assertEqual(json.loads(response['body'])['message'], 'Already exists')
         self.assertEqual(len(comment_after) - len(comment_before), 0)
         self.assertIsNone(liked_user)
+        self.assertEqual(self.get_like_count('comment00002'), 1)
+
+    @patch('me_comments_likes_create.LikeCounterUtil.increment', MagicMock(side_effect=Exception()))
+    def test_raise_exception_in_incrementing_like_counter(self):
+        params = {
+            'pathParameters': {
+                'comment_id': 'comment00001'
+            },
+            'requestContext': {
+                'authorizer': {
+                    'claims': {
+                        'cognito:username': 'like_user_01',
+                        'phone_number_verified': 'true',
+                        'email_verified': 'true'
+                    }
+                }
+            }
+        }
+
+        response = MeCommentsLikesCreate(params, {}, self.dynamodb).main()
+
+        liked_user = self.comment_liked_user_table.get_item(
+            Key={
+                'comment_id': 'comment00001',
+                'user_id': 'like_user_01'
+            },
+        ).get('Item')
+
+        # いいねは保存済みのため、カウンタの加算に失敗した場合も成功として扱う
+        self.assertEqual(response['statusCode'], 200)
+        self.assertIsNotNone(liked_user)
 
     def test_call_get_validated_comment_existence(self):
         params = {
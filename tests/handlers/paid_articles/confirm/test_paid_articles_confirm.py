@@ -0,0 +1,345 @@
+import os
+import json
+import settings
+from decimal import Decimal
+from unittest import TestCase
+from paid_articles_confirm import PaidArticlesConfirm
+from unittest.mock import patch, MagicMock
+from tests_util import TestsUtil
+from private_chain_stub_server import PrivateChainStubServer
+
+
+class TestPaidArticlesConfirm(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    mined_receipt = {
+        'blockHash': '0xab698033e885b1ca0b4976063232df35db42eed57d9c12ad3937ab2bea33a55c',
+        'blockNumber': '0x812ad',
+        'contractAddress': None,
+        'cumulativeGasUsed': '0x8ed2',
+        'gasUsed': '0x8ed2',
+        'logs': [
+            {
+                'address': '0x1383b25f9ba231e3a1a1e45c0b5689d778d44ad5',
+                'blockHash': '0xab698033e885b1ca0b4976063232df35db42eed57d9c12ad3937ab2bea33a55c',
+                'blockNumber': '0x812ad',
+                'data': '0x0000000000000000000000000000000000000000000000007ce66c50e2840000',
+                'logIndex': '0x0',
+                'topics': [
+                    '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef',
+                    '0x00000000000000000000000093f102758c661de802f7c50cc40daa03269e5d97',
+                    '0x000000000000000000000000d29881fb9805aa4fddbec9c28c818bbac1951aee'
+                ],
+                'transactionHash': '0xa5999131185ec77a1e9f640a35149633c988b91990e4b18a506250dc2992d8fb',
+                'transactionIndex': '0x0',
+                'transactionLogIndex': '0x0',
+                'type': 'mined'
+            }
+        ],
+        'root': None, 'status': None,
+        'transactionHash': '0xa5999131185ec77a1e9f640a35149633c988b91990e4b18a506250dc2992d8fb',
+        'transactionIndex': '0x0'
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.private_chain = PrivateChainStubServer()
+        cls.private_chain.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.private_chain.stop()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        os.environ['PRIVATE_CHAIN_AWS_ACCESS_KEY'] = "test"
+        os.environ['PRIVATE_CHAIN_AWS_SECRET_ACCESS_KEY'] = "test"
+        os.environ['PRIVATE_CHAIN_EXECUTE_API_HOST'] = "test"
+
+        self.private_chain.receipts = {}
+        self.private_chain.requests = []
+        self.base_url_patcher = patch('private_chain_client.PrivateChainClient.get_base_url',
+                                      MagicMock(return_value=self.private_chain.url))
+        self.base_url_patcher.start()
+
+        self.paid_article_items = [
+            {
+                'user_id': 'purchaseuser001',
+                'article_user_id': 'author001',
+                'article_title': 'purchase001 titile',
+                'price': 100 * (10 ** 18),
+                'article_id': 'publicId0001',
+                'status': 'doing',
+                'purchase_transaction': '0x0000000000000000000000000000000000000000',
+                'sort_key': Decimal(1520150552000003),
+                'created_at': Decimal(int(1520150552.000003)),
+                'history_created_at': Decimal(1520150270)
+            },
+            {
+                'user_id': 'purchaseuser002',
+                'article_user_id': 'author001',
+                'article_title': 'purchase001 titile',
+                'price': 100 * (10 ** 18),
+                'article_id': 'publicId0001',
+                'status': 'done',
+                'purchase_transaction': '0x0000000000000000000000000000000000000002',
+                'burn_transaction': '0x0000000000000000000000000000000000000003',
+                'sort_key': Decimal(1520150552000001),
+                'created_at': Decimal(int(1520150552.000001)),
+                'history_created_at': Decimal(1520150270)
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['PAID_ARTICLES_TABLE_NAME'], self.paid_article_items)
+
+        self.paid_articles_table = self.dynamodb.Table(os.environ['PAID_ARTICLES_TABLE_NAME'])
+
+        self.unread_notification_manager_table \
+            = self.dynamodb.Table(os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'])
+        TestsUtil.create_table(self.dynamodb, os.environ['UNREAD_NOTIFICATION_MANAGER_TABLE_NAME'], [])
+
+        self.notification_table \
+            = self.dynamodb.Table(os.environ['NOTIFICATION_TABLE_NAME'])
+        TestsUtil.create_table(self.dynamodb, os.environ['NOTIFICATION_TABLE_NAME'], [])
+
+    def tearDown(self):
+        self.base_url_patcher.stop()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def get_paid_article(self, sort_key):
+        return self.paid_articles_table.get_item(
+            Key={'article_id': 'publicId0001', 'sort_key': sort_key}
+        )['Item']
+
+    @patch('paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__burn_transaction',
+           MagicMock(return_value='0x0000000000000000000000000000000000000001'))
+    @patch("paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__get_randomhash",
+           MagicMock(side_effect=[
+               "d6f09fcaa6f409b7dde72957fdc17992d570e12ad23e8e968c29ab9aaea4df3d",
+               "0e12ad23e8e968c29ab9aaea4df3dd6f09fcaa6f409b7dde72957fdc17992d57"
+           ]))
+    @patch('time_util.TimeUtil.generate_sort_key', MagicMock(return_value=1520150552000010))
+    @patch('time.time', MagicMock(return_value=1520150552.000003))
+    def test_main_ok(self):
+        self.private_chain.set_receipt('0x0000000000000000000000000000000000000000', result=self.mined_receipt)
+
+        with patch('paid_articles_confirm.UserUtil') as user_util_mock:
+            user_util_mock.get_cognito_user_info.return_value = {
+                'UserAttributes': [{
+                    'Name': 'custom:private_eth_address',
+                    'Value': '0x1111111111111111111111111111111111111111'
+                }]
+            }
+
+            response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+            self.assertEqual(response['statusCode'], 200)
+            self.assertEqual(json.loads(response['body']), {'done': 1, 'fail': 0, 'doing': 0})
+            # status が doing の購入記事データのみ確認すること
+            self.assertEqual(
+                [r['payload'] for r in self.private_chain.get_requests('transaction/receipt')],
+                [{'transaction_hash': '0x0000000000000000000000000000000000000000'}]
+            )
+            user_util_mock.get_cognito_user_info.assert_called_with(None, 'purchaseuser001')
+
+            expected_paid_article = dict(self.paid_article_items[0], **{
+                'status': 'done',
+                'burn_transaction': '0x0000000000000000000000000000000000000001'
+            })
+            self.assertEqual(expected_paid_article, self.get_paid_article(1520150552000003))
+
+            expect_notifications = [
+                {
+                    'notification_id': 'd6f09fcaa6f409b7dde72957fdc17992d570e12ad23e8e968c29ab9aaea4df3d',
+                    'user_id': 'author001',
+                    'acted_user_id': 'purchaseuser001',
+                    'article_id': 'publicId0001',
+                    'article_user_id': 'author001',
+                    'article_title': 'purchase001 titile',
+                    'sort_key': Decimal(1520150552000010),
+                    'type': settings.ARTICLE_PURCHASED_TYPE,
+                    'price': Decimal(100 * (10 ** 18)),
+                    'created_at': Decimal(int(1520150552.000003))
+                }, {
+                    'notification_id': '0e12ad23e8e968c29ab9aaea4df3dd6f09fcaa6f409b7dde72957fdc17992d57',
+                    'user_id': 'purchaseuser001',
+                    'acted_user_id': 'purchaseuser001',
+                    'article_id': 'publicId0001',
+                    'article_user_id': 'author001',
+                    'article_title': 'purchase001 titile',
+                    'sort_key': Decimal(1520150552000010),
+                    'type': settings.ARTICLE_PURCHASE_TYPE,
+                    'price': Decimal(100 * (10 ** 18)),
+                    'created_at': Decimal(int(1520150552.000003))
+                }
+            ]
+
+            # 記事購入に成功した場合は購入者と著者へ通知を行う
+            actual_notifications = self.notification_table.scan()['Items']
+            self.assertEqual(TestPaidArticlesConfirm.__sorted_notifications(expect_notifications),
+                             TestPaidArticlesConfirm.__sorted_notifications(actual_notifications))
+            self.assertEqual(len(self.unread_notification_manager_table.scan()['Items']), 2)
+
+    @patch('paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__burn_transaction',
+           MagicMock(return_value='0x0000000000000000000000000000000000000001'))
+    def test_main_ok_multiple_paid_articles(self):
+        # 複数の購入記事データの receipt をまとめて取得し、それぞれの状態を更新する
+        paid_articles = []
+        for i in range(30):
+            paid_article = dict(self.paid_article_items[0], **{
+                'user_id': 'purchaseuser1{0:02d}'.format(i),
+                'purchase_transaction': '0x1{0:039d}'.format(i),
+                'sort_key': Decimal(1520150552000100 + i)
+            })
+            paid_articles.append(paid_article)
+            if i % 3 == 0:
+                self.private_chain.set_receipt(paid_article['purchase_transaction'], result=self.mined_receipt)
+            elif i % 3 == 1:
+                self.private_chain.set_receipt(paid_article['purchase_transaction'], status_code=400)
+        with self.paid_articles_table.batch_writer() as batch:
+            for paid_article in paid_articles:
+                batch.put_item(Item=paid_article)
+
+        with patch('paid_articles_confirm.UserUtil') as user_util_mock:
+            user_util_mock.get_cognito_user_info.return_value = {
+                'UserAttributes': [{
+                    'Name': 'custom:private_eth_address',
+                    'Value': '0x1111111111111111111111111111111111111111'
+                }]
+            }
+
+            response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'done': 10, 'fail': 0, 'doing': 21})
+        self.assertEqual(len(self.private_chain.get_requests('transaction/receipt')), 31)
+        for i, paid_article in enumerate(paid_articles):
+            expected_status = ['done', 'doing', 'doing'][i % 3]
+            self.assertEqual(self.get_paid_article(paid_article['sort_key'])['status'], expected_status)
+
+    @patch('paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__burn_transaction',
+           MagicMock(return_value='0x0000000000000000000000000000000000000001'))
+    def test_main_ok_transaction_unconfirmed(self):
+        response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'done': 0, 'fail': 0, 'doing': 1})
+        # 未承認の場合は次回の実行時に再度確認するため、データは更新されない
+        self.assertEqual(self.paid_article_items[0], self.get_paid_article(1520150552000003))
+        self.assertEqual(len(self.notification_table.scan()['Items']), 0)
+        self.assertEqual(len(self.unread_notification_manager_table.scan()['Items']), 0)
+
+    @patch('paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__burn_transaction',
+           MagicMock(return_value='0x0000000000000000000000000000000000000001'))
+    @patch("paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__check_transaction_confirmation",
+           MagicMock(return_value=json.dumps({
+               "jsonrpc": "2.0",
+               "error": {
+                   "code": -32600,
+                   "message": "Invalid request"
+               },
+               "id": None
+           })))
+    def test_main_ok_transaction_fail(self):
+        response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'done': 0, 'fail': 1, 'doing': 0})
+        self.assertEqual(self.get_paid_article(1520150552000003)['status'], 'fail')
+        self.assertIsNone(self.get_paid_article(1520150552000003).get('burn_transaction'))
+
+        # 購入者へのみ失敗の通知を行う
+        notifications = self.notification_table.scan()['Items']
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(notifications[0]['user_id'], 'purchaseuser001')
+        self.assertEqual(notifications[0]['type'], settings.ARTICLE_PURCHASE_ERROR_TYPE)
+        self.assertEqual(len(self.unread_notification_manager_table.scan()['Items']), 1)
+
+    def test_main_ok_unexpected_receipt_type(self):
+        self.private_chain.set_receipt('0x0000000000000000000000000000000000000000', result={
+            'logs': [
+                {
+                    'transactionHash': '0xa5999131185ec77a1e9f640a35149633c988b91990e4b18a506250dc2992d8fb',
+                    # typeに予期せぬ値が来た場合
+                    'type': 'hogehoge'
+                }
+            ]
+        })
+
+        response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'done': 0, 'fail': 0, 'doing': 1})
+        self.assertEqual(self.get_paid_article(1520150552000003)['status'], 'doing')
+
+    @patch("paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__get_randomhash",
+           MagicMock(side_effect=[
+               "d6f09fcaa6f409b7dde72957fdc17992d570e12ad23e8e968c29ab9aaea4df3d",
+               "0e12ad23e8e968c29ab9aaea4df3dd6f09fcaa6f409b7dde72957fdc17992d57"
+           ]))
+    @patch('paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__burn_transaction',
+           MagicMock(side_effect=Exception()))
+    def test_main_ok_purchase_succeeded_but_failed_to_burn(self):
+        self.private_chain.set_receipt('0x0000000000000000000000000000000000000000', result=self.mined_receipt)
+
+        with patch('paid_articles_confirm.UserUtil') as user_util_mock:
+            user_util_mock.get_cognito_user_info.return_value = {
+                'UserAttributes': [{
+                    'Name': 'custom:private_eth_address',
+                    'Value': '0x1111111111111111111111111111111111111111'
+                }]
+            }
+
+            response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+            self.assertEqual(response['statusCode'], 200)
+            self.assertEqual(json.loads(response['body']), {'done': 1, 'fail': 0, 'doing': 0})
+            self.assertEqual(self.get_paid_article(1520150552000003)['status'], 'done')
+            self.assertIsNone(self.get_paid_article(1520150552000003).get('burn_transaction'))
+
+            # バーンに失敗した場合も購入者と著者へ購入通知が行われる
+            self.assertEqual(len(self.notification_table.scan()['Items']), 2)
+            self.assertEqual(len(self.unread_notification_manager_table.scan()['Items']), 2)
+
+    @patch('time.sleep', MagicMock())
+    def test_main_ok_private_chain_error(self):
+        self.private_chain.set_receipt('0x0000000000000000000000000000000000000000', status_code=502)
+
+        response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+        # 問い合わせに失敗した場合は doing のまま残し、次回の実行時に再度確認する
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'done': 0, 'fail': 0, 'doing': 1})
+        self.assertEqual(self.get_paid_article(1520150552000003)['status'], 'doing')
+
+    @patch('paid_articles_confirm.PaidArticlesConfirm._PaidArticlesConfirm__check_transaction_confirmation',
+           MagicMock(return_value=json.dumps({
+               "jsonrpc": "2.0",
+               "error": {
+                   "code": -32600,
+                   "message": "Invalid request"
+               },
+               "id": None
+           })))
+    def test_main_ok_already_confirmed(self):
+        # 確認中に他の実行により状態が確定した場合
+        paid_articles = [dict(self.paid_article_items[0], status='done')]
+        with patch('paid_articles_confirm.DBUtil.query_all_items', MagicMock(return_value=paid_articles)):
+            self.paid_articles_table.put_item(Item=paid_articles[0])
+
+            response = PaidArticlesConfirm({}, {}, self.dynamodb, cognito=None).main()
+
+        # 状態の更新、通知の作成は重複して行わない
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'done': 0, 'fail': 0, 'doing': 1})
+        self.assertEqual(self.get_paid_article(1520150552000003)['status'], 'done')
+        self.assertEqual(len(self.notification_table.scan()['Items']), 0)
+
+    @staticmethod
+    def __sorted_notifications(notifications):
+        result = []
+        for item in notifications:
+            result.append(sorted(item.items(), key=lambda x: x[0]))
+
+        return sorted(result)
@@ -1,7 +1,10 @@
 from elasticsearch import Elasticsearch
 from search_users import SearchUsers
 from unittest import TestCase
+from unittest.mock import MagicMock
+import copy
 import json
+import settings
 
 
 class TestSearchUsers(TestCase):
@@ -10,48 +13,10 @@ class TestSearchUsers(TestCase):
     )
 
     def setUp(self):
-        self.elasticsearch.indices.create(
-                index="users",
-                body={
-                    "settings": {
-                        "index": {
-                            "number_of_replicas": "0"
-                        },
-                        "analysis": {
-                            "analyzer": {
-                                "default": {
-                                    "tokenizer": "keyword"
-                                }
-                            },
-                            "normalizer": {
-                                "lowcase": {
-                                    "type": "custom",
-                                    "char_filter": [],
-                                    "filter": ["lowercase"]
-                                }
-                            }
-                        }
-                    },
-                    "mappings": {
-                        "user": {
-                            "properties": {
-                                "user_id": {
-                                    "type": "keyword",
-                                    "copy_to": "search_name"
-                                },
-                                "user_display_name": {
-                                    "type": "keyword",
-                                    "copy_to": "search_name"
-                                },
-                                "search_name": {
-                                    "type": "keyword",
-                                    "normalizer": "lowcase"
-                                }
-                            }
-                        }
-                    }
-                }
-        )
+        # 本番と同じ N-gram のマッピングでインデックスを作成する
+        users_settings = copy.deepcopy(settings.USERS_INDEX_SETTINGS)
+        users_settings['settings']['index']['number_of_replicas'] = '0'
+        self.elasticsearch.indices.create(index="users", body=users_settings)
         items = []
         for dummy in range(30):
             items.append({
@@ -187,3 +152,75 @@ class TestSearchUsers(TestCase):
         response = SearchUsers(params, {}, elasticsearch=self.elasticsearch).main()
         result = json.loads(response['body'])
         self.assertEqual(len(result), 1)
+
+    def test_search_short_query(self):
+        # N-gram の長さに満たない検索語でも部分一致で検索できる
+        self.elasticsearch.index(
+                index="users",
+                doc_type="user",
+                id="AbCdEfG",
+                body={
+                    'user_id': "AbCdEfG",
+                    'user_display_name': "HiJkLmN",
+                    'updated_at': 1530112761,
+                }
+        )
+        self.elasticsearch.indices.refresh(index="users")
+        for query, count in [('d', 1), ('Jk', 1), ('t', 30), ('z', 0)]:
+            params = {
+                    'queryStringParameters': {
+                        'query': query,
+                        'limit': '100'
+                    }
+            }
+            response = SearchUsers(params, {}, elasticsearch=self.elasticsearch).main()
+            result = json.loads(response['body'])
+            self.assertEqual(len(result), count)
+
+    def test_search_not_contiguous(self):
+        # 検索語の文字が連続して含まれない場合は一致しない
+        params = {
+                'queryStringParameters': {
+                    'query': 'userTest'
+                }
+        }
+        response = SearchUsers(params, {}, elasticsearch=self.elasticsearch).main()
+        result = json.loads(response['body'])
+        self.assertEqual(len(result), 0)
+
+    def test_search_not_adjacent_ngram(self):
+        # 検索語の N-gram(abc, bcd)を全て含んでいても、隣接していない場合は一致しない
+        for user_id in ['abcXbcd', 'xabcdx']:
+            self.elasticsearch.index(
+                    index="users",
+                    doc_type="user",
+                    id=user_id,
+                    body={
+                        'user_id': user_id,
+                        'user_display_name': user_id,
+                        'updated_at': 1530112761,
+                    }
+            )
+        self.elasticsearch.indices.refresh(index="users")
+        params = {
+                'queryStringParameters': {
+                    'query': 'abcd'
+                }
+        }
+        response = SearchUsers(params, {}, elasticsearch=self.elasticsearch).main()
+        result = json.loads(response['body'])
+        self.assertEqual([user['user_id'] for user in result], ['xabcdx'])
+
+    def test_search_without_wildcard(self):
+        elasticsearch = MagicMock()
+        elasticsearch.search.return_value = {'hits': {'hits': []}}
+        params = {
+                'queryStringParameters': {
+                    'query': 'test*user'
+                }
+        }
+        SearchUsers(params, {}, elasticsearch=elasticsearch).main()
+
+        # 検索語は wildcard ではなく N-gram のフィールドに対する match_phrase として扱う
+        query = elasticsearch.search.call_args[1]['body']['query']
+        self.assertEqual(query, {'match_phrase': {'search_name.trigram': 'test*user'}})
@@ -0,0 +1,44 @@
+import json
+from unittest import TestCase
+
+from tests_es_util import TestsEsUtil
+
+from tags_count_rebuild import TagsCountRebuild
+from elasticsearch import Elasticsearch
+
+
+class TestTagsCountRebuild(TestCase):
+    elasticsearch = Elasticsearch(
+        hosts=[{'host': 'localhost'}]
+    )
+
+    def setUp(self):
+        TestsEsUtil.create_tag_index(self.elasticsearch)
+        TestsEsUtil.create_tag_with_count(self.elasticsearch, 'ALIS', 10)
+        TestsEsUtil.create_tag_with_count(self.elasticsearch, 'hoge', 3)
+        self.elasticsearch.indices.refresh(index='tags')
+
+        TestsEsUtil.create_articles_index(self.elasticsearch)
+        articles = [
+            {'article_id': 'testid000001', 'tags': ['ALIS', 'fuga']},
+            {'article_id': 'testid000002', 'tags': ['alis']},
+            {'article_id': 'testid000003'}
+        ]
+        for article in articles:
+            self.elasticsearch.index(index='articles', doc_type='article', id=article['article_id'], body=article)
+        self.elasticsearch.indices.refresh(index='articles')
+
+    def tearDown(self):
+        TestsEsUtil.delete_alias(self.elasticsearch, 'tags')
+        self.elasticsearch.indices.delete(index='tags', ignore=[404])
+        TestsEsUtil.remove_articles_index(self.elasticsearch)
+
+    def test_main_ok(self):
+        response = TagsCountRebuild({}, {}, elasticsearch=self.elasticsearch).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        result = json.loads(response['body'])
+        self.assertEqual(result['tag_count'], 3)
+
+        tags = {tag['name']: tag['count'] for tag in TestsEsUtil.get_all_tags(self.elasticsearch)}
+        self.assertEqual(tags, {'ALIS': 2, 'hoge': 0, 'fuga': 1})
@@ -0,0 +1,101 @@
+import os
+import json
+from unittest import TestCase
+from token_distribution_totals_rebuild import TokenDistributionTotalsRebuild
+from token_distribution_total_util import TokenDistributionTotalUtil
+from tests_util import TestsUtil
+
+
+class TestTokenDistributionTotalsRebuild(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        token_distribution_items = [
+            {
+                'distribution_id': 'user01-1536184800000000-tip',
+                'user_id': 'user01',
+                'distribution_type': 'tip',
+                'quantity': 10000000000000000000,
+                'created_at': 1536184800,
+                'sort_key': 1536184800000000
+            },
+            {
+                'distribution_id': 'user01-1524318892000000-like',
+                'user_id': 'user01',
+                'distribution_type': 'like',
+                'quantity': 3000000000000000000,
+                'created_at': 1524328892,
+                'sort_key': 1524328892000000,
+                'evaluated_at': 1524318892000000
+            },
+            {
+                'distribution_id': 'user01-1524318893000000-like',
+                'user_id': 'user01',
+                'distribution_type': 'like',
+                'quantity': 2000000000000000000,
+                'created_at': 1524328892,
+                'sort_key': 1524328892000000,
+                'evaluated_at': 1524318893000000
+            },
+            {
+                'distribution_id': 'user02-1524318892000000-article',
+                'user_id': 'user02',
+                'distribution_type': 'article',
+                'quantity': 6000000000000000000,
+                'created_at': 1524328892,
+                'sort_key': 1524328892000000,
+                'evaluated_at': 1524318892000000
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['TOKEN_DISTRIBUTION_TABLE_NAME'], token_distribution_items)
+
+        token_distribution_total_items = [
+            {
+                # 乖離している合計
+                'user_id': 'user01',
+                'article': 1000000000000000000,
+                'like': 0,
+                'tip': 0,
+                'bonus': 0
+            },
+            {
+                # 付与履歴が存在しなくなったユーザーの合計
+                'user_id': 'user03',
+                'article': 0,
+                'like': 4000000000000000000,
+                'tip': 0,
+                'bonus': 1000000000000000000
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'],
+                               token_distribution_total_items)
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def test_main_ok(self):
+        response = TokenDistributionTotalsRebuild({}, {}, dynamodb=self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'distributions': 4, 'users': 2, 'reset': 1})
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01'), {
+            'article': 0,
+            'like': 5000000000000000000,
+            'tip': 10000000000000000000,
+            'bonus': 0
+        })
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user02'), {
+            'article': 6000000000000000000,
+            'like': 0,
+            'tip': 0,
+            'bonus': 0
+        })
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user03'), {
+            'article': 0,
+            'like': 0,
+            'tip': 0,
+            'bonus': 0
+        })
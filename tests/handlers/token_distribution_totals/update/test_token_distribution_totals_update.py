@@ -0,0 +1,131 @@
+import os
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from boto3.dynamodb.types import TypeSerializer
+from token_distribution_totals_update import TokenDistributionTotalsUpdate
+from token_distribution_total_util import TokenDistributionTotalUtil
+from tests_util import TestsUtil
+
+
+class TestTokenDistributionTotalsUpdate(TestCase):
+    dynamodb = TestsUtil.get_dynamodb_client()
+    serializer = TypeSerializer()
+
+    def setUp(self):
+        TestsUtil.set_all_tables_name_to_env()
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+        token_distribution_total_items = [
+            {
+                'user_id': 'user01',
+                'article': 6000000000000000000,
+                'like': 5000000000000000000,
+                'tip': 0,
+                'bonus': 0
+            }
+        ]
+        TestsUtil.create_table(self.dynamodb, os.environ['TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME'],
+                               token_distribution_total_items)
+        TestsUtil.create_table(self.dynamodb, os.environ['TOKEN_DISTRIBUTION_APPLIED_RECORD_TABLE_NAME'], [])
+
+    def tearDown(self):
+        TestsUtil.delete_all_tables(self.dynamodb)
+
+    def create_record(self, event_id, event_name, new_image=None, old_image=None):
+        record = {'eventID': event_id, 'eventName': event_name, 'dynamodb': {}}
+        if new_image is not None:
+            record['dynamodb']['NewImage'] = {k: self.serializer.serialize(v) for k, v in new_image.items()}
+        if old_image is not None:
+            record['dynamodb']['OldImage'] = {k: self.serializer.serialize(v) for k, v in old_image.items()}
+        return record
+
+    def create_distribution(self, user_id, distribution_type, quantity):
+        return {
+            'distribution_id': '{0}-1536184800000000-{1}'.format(user_id, distribution_type),
+            'user_id': user_id,
+            'distribution_type': distribution_type,
+            'quantity': quantity,
+            'created_at': 1536184800,
+            'sort_key': 1536184800000000
+        }
+
+    def test_main_ok(self):
+        event = {
+            'Records': [
+                self.create_record(
+                    'event01', 'INSERT', new_image=self.create_distribution('user01', 'tip', 10000000000000000000)),
+                self.create_record(
+                    'event02', 'INSERT', new_image=self.create_distribution('user01', 'like', 1000000000000000000)),
+                self.create_record(
+                    'event03', 'INSERT', new_image=self.create_distribution('user02', 'article', 2000000000000000000))
+            ]
+        }
+
+        response = TokenDistributionTotalsUpdate(event, {}, dynamodb=self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'applied': 3, 'skipped': 0})
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01'), {
+            'article': 6000000000000000000,
+            'like': 6000000000000000000,
+            'tip': 10000000000000000000,
+            'bonus': 0
+        })
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user02'), {
+            'article': 2000000000000000000,
+            'like': 0,
+            'tip': 0,
+            'bonus': 0
+        })
+
+    def test_main_ok_modify_and_remove(self):
+        event = {
+            'Records': [
+                # 付与量の修正は差分を加算する
+                self.create_record(
+                    'event01',
+                    'MODIFY',
+                    new_image=self.create_distribution('user01', 'article', 4000000000000000000),
+                    old_image=self.create_distribution('user01', 'article', 6000000000000000000)
+                ),
+                # 削除された付与は減算する
+                self.create_record(
+                    'event02', 'REMOVE', old_image=self.create_distribution('user01', 'like', 1000000000000000000))
+            ]
+        }
+
+        response = TokenDistributionTotalsUpdate(event, {}, dynamodb=self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01'), {
+            'article': 4000000000000000000,
+            'like': 4000000000000000000,
+            'tip': 0,
+            'bonus': 0
+        })
+
+    def test_main_ok_retry_after_failure(self):
+        event = {
+            'Records': [
+                self.create_record(
+                    'event01', 'INSERT', new_image=self.create_distribution('user01', 'tip', 10000000000000000000)),
+                self.create_record(
+                    'event02', 'INSERT', new_image=self.create_distribution('user02', 'article', 2000000000000000000))
+            ]
+        }
+
+        # 2件目のレコードの加算に失敗した場合
+        add = TokenDistributionTotalUtil.add
+        with patch('token_distribution_total_util.TokenDistributionTotalUtil.add',
+                   side_effect=[add(self.dynamodb, 'event01', {'user01': {'tip': 10000000000000000000}}), Exception()]):
+            response = TokenDistributionTotalsUpdate(event, {}, dynamodb=self.dynamodb).main()
+        self.assertEqual(response['statusCode'], 500)
+
+        # バッチ全体が再処理されても、加算済みのレコードは二重に加算しない
+        response = TokenDistributionTotalsUpdate(event, {}, dynamodb=self.dynamodb).main()
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'applied': 1, 'skipped': 1})
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user01')['tip'], 10000000000000000000)
+        self.assertEqual(TokenDistributionTotalUtil.get_totals(self.dynamodb, 'user02')['article'], 2000000000000000000)
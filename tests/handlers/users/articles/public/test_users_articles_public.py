@@ -18,18 +18,21 @@ class TestUsersArticlesPublic(TestCase):
                 'article_id': 'draftId00001',
                 'user_id': 'TST',
                 'status': 'draft',
+                'user_id_status': 'TST#draft',
                 'sort_key': 1520150272000000
             },
             {
                 'article_id': 'testid000001',
                 'user_id': 'TST',
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150272000001
             },
             {
                 'article_id': 'testid000002',
                 'user_id': 'TST',
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150272000002,
                 'price': 200
             },
@@ -37,12 +40,14 @@ class TestUsersArticlesPublic(TestCase):
                 'article_id': 'testid000003',
                 'user_id': 'TST2',
                 'status': 'public',
+                'user_id_status': 'TST2#public',
                 'sort_key': 1520150272000003
             },
             {
                 'article_id': 'testid000004',
                 'user_id': 'TST',
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150272000004
             }
         ]
@@ -76,12 +81,14 @@ class TestUsersArticlesPublic(TestCase):
                 'article_id': 'testid000004',
                 'user_id': 'TST',
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150272000004
             },
             {
                 'article_id': 'testid000002',
                 'user_id': 'TST',
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150272000002,
                 'price': 200
             }
@@ -109,6 +116,7 @@ class TestUsersArticlesPublic(TestCase):
                 'article_id': 'testid000001',
                 'user_id': 'TST',
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150272000001
             }
         ]
@@ -124,6 +132,7 @@ class TestUsersArticlesPublic(TestCase):
                 'user_id': 'test-only-sort-key',
                 'article_id': 'test_limit_number' + str(i),
                 'status': 'public',
+                'user_id_status': 'test-only-sort-key#public',
                 'sort_key': 1520150273000000 + i
                 }
             )
@@ -150,6 +159,7 @@ class TestUsersArticlesPublic(TestCase):
                 'user_id': 'TST',
                 'article_id': 'test_limit_number' + str(i),
                 'status': 'public',
+                'user_id_status': 'TST#public',
                 'sort_key': 1520150273000000 + i
                 }
             )
@@ -177,6 +187,7 @@ class TestUsersArticlesPublic(TestCase):
                 'user_id': 'public-test-user',
                 'article_id': 'test_limit_' + str(i),
                 'status': status,
+                'user_id_status': 'public-test-user#' + status,
                 'sort_key': 1520150273000000 + i
                 }
             )
@@ -0,0 +1,86 @@
+import json
+import threading
+import socketserver
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+
+class PrivateChainStubServer:
+    """
+    テスト用のプライベートチェーン API のスタブサーバ
+    ローカルの空きポートで起動し、transaction/receipt 等に対して事前に登録したレスポンスを返却する
+    PrivateChainClient.get_base_url を url に差し替えて利用する
+    """
+
+    def __init__(self):
+        self.receipts = {}
+        self.responses = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+        self.url = None
+
+    def start(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.__get_handler_class())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{0}/production'.format(self.server.server_address[1])
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    # 登録されていないトランザクションハッシュは未承認(result が None)として返却する
+    def set_receipt(self, transaction_hash, result=None, error=None, status_code=200):
+        body = {'jsonrpc': '2.0', 'id': 1}
+        if error is not None:
+            body['error'] = error
+        else:
+            body['result'] = result
+        self.receipts[transaction_hash] = (status_code, body)
+
+    def set_response(self, endpoint, body, status_code=200):
+        self.responses[endpoint] = (status_code, body)
+
+    def get_requests(self, endpoint=None):
+        return [r for r in self.requests if endpoint is None or r['endpoint'] == endpoint]
+
+    def __get_handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw_body = self.rfile.read(length).decode('utf-8')
+                payload = json.loads(raw_body) if raw_body else {}
+                endpoint = self.path[len('/production/'):]
+
+                with stub.lock:
+                    stub.requests.append({'endpoint': endpoint, 'payload': payload})
+
+                if endpoint == 'transaction/receipt':
+                    status_code, body = stub.receipts.get(
+                        payload.get('transaction_hash'),
+                        (200, {'jsonrpc': '2.0', 'id': 1, 'result': None})
+                    )
+                else:
+                    status_code, body = stub.responses.get(endpoint, (404, {'message': 'Not Found'}))
+
+                response = json.dumps(body).encode('utf-8')
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
@@ -1,6 +1,7 @@
 import os
 import yaml
 import boto3
+from ttl_cache import TTLCache
 
 
 class TestsUtil:
@@ -56,6 +57,8 @@ class TestsUtil:
 
     @classmethod
     def delete_all_tables(cls, dynamodb):
+        # テーブルを作り直すため、warm コンテナ用のキャッシュも合わせて破棄する
+        TTLCache.invalidate_all()
         for table in dynamodb.tables.all():
             del_table = dynamodb.Table(table.table_name)
             del_table.delete()
@@ -84,6 +87,7 @@ class TestsUtil:
             {'env_name': 'COMMENT_TABLE_NAME', 'table_name': 'Comment'},
             {'env_name': 'COMMENT_LIKED_USER_TABLE_NAME',  'table_name': 'CommentLikedUser'},
             {'env_name': 'DELETED_COMMENT_TABLE_NAME',  'table_name': 'DeletedComment'},
+            {'env_name': 'LIKE_COUNTER_TABLE_NAME', 'table_name': 'LikeCounter'},
             {'env_name': 'TOPIC_TABLE_NAME', 'table_name': 'Topic'},
             {'env_name': 'TAG_TABLE_NAME', 'table_name': 'Tag'},
             {'env_name': 'TIP_TABLE_NAME', 'table_name': 'Tip'},
@@ -91,6 +95,8 @@ class TestsUtil:
             {'env_name': 'USER_FRAUD_TABLE_NAME', 'table_name': 'UserFraud'},
             {'env_name': 'SCREENED_ARTICLE_TABLE_NAME', 'table_name': 'ScreenedArticle'},
             {'env_name': 'TOKEN_DISTRIBUTION_TABLE_NAME', 'table_name': 'TokenDistribution'},
+            {'env_name': 'TOKEN_DISTRIBUTION_TOTAL_TABLE_NAME', 'table_name': 'TokenDistributionTotal'},
+            {'env_name': 'TOKEN_DISTRIBUTION_APPLIED_RECORD_TABLE_NAME', 'table_name': 'TokenDistributionAppliedRecord'},
             {'env_name': 'USER_FIRST_EXPERIENCE_TABLE_NAME', 'table_name': 'UserFirstExperience'},
             {'env_name': 'NONCE_TABLE_NAME', 'table_name': 'Nonce'},
             {'env_name': 'PAID_ARTICLES_TABLE_NAME', 'table_name': 'PaidArticles'}